@@ -1,8 +1,11 @@
 """
 The soundtouchplus integration.
 """
+import asyncio
 import functools
 import logging
+import sqlite3
+import time
 from urllib3._version import __version__ as urllib3_version
 import voluptuous as vol
 
@@ -12,17 +15,27 @@ from bosesoundtouchapi.models import *
 from bosesoundtouchapi.ws import *
 from bosesoundtouchapi.bstconst import VERSION as bosesoundtouchapi_VERSION
 from spotifywebapipython.const import VERSION as spotifywebapipython_VERSION
+from zeroconf import ServiceStateChange
+from zeroconf.asyncio import AsyncServiceBrowser
 
 from homeassistant.components.media_player import MediaPlayerEntity
+from homeassistant.components.zeroconf import async_get_async_instance
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError, IntegrationError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.typing import ConfigType
 
+from .artworkcache import ARTWORK_CACHE
+from .fleetconfig import FLEET_CONFIG_SECTIONS, FLEET_CONFIG_VERSION, FLEET_SECTION_NAME, ApplyDeviceConfig, ExportDeviceConfig
 from .instancedata_soundtouchplus import InstanceDataSoundTouchPlus
+from .logsink import TRACE_SINK
+from .playhistoryindex import PLAY_HISTORY_INDEX
 from .stappmessages import STAppMessages
+from .storedmusicindex import StoredMusicIndex
+from .ttscache import TTS_CACHE, TtsCacheView
 from .const import (
     DOMAIN,
     CONF_PORT_WEBSOCKET,
@@ -32,6 +45,11 @@ from .const import (
     DEFAULT_PING_WEBSOCKET_INTERVAL,
     DEFAULT_PORT,
     DEFAULT_PORT_WEBSOCKET,
+    SNAPSHOT_RESTORE_MODE_CHANGES,
+    SNAPSHOT_RESTORE_MODE_FULL,
+    ZONE_VOLUME_MODE_OFFSET,
+    ZONE_VOLUME_MODE_SCALE,
+    ZONE_VOLUME_MODE_SET,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,6 +83,12 @@ List of platforms to support.
 There should be a matching .py file for each (e.g. "media_player")
 """
 
+_zeroconfBrowser:AsyncServiceBrowser = None
+"""
+ZeroConf browser of SoundTouch devices; it is only started when a device has the zone
+master failover option enabled.
+"""
+
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 """ Configuration schema. """
 
@@ -74,6 +98,7 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 SERVICE_ADD_WIRELESS_PROFILE = "add_wireless_profile"
 SERVICE_AUDIO_TONE_LEVELS = "audio_tone_levels"
 SERVICE_CLEAR_SOURCE_NOWPLAYINGSTATUS = "clear_source_nowplayingstatus"
+SERVICE_EXPORT_CONFIG = "export_config"
 SERVICE_GET_AUDIO_DSP_CONTROLS = "get_audio_dsp_controls"
 SERVICE_GET_AUDIO_PRODUCT_LEVEL_CONTROLS = "get_audio_product_level_controls"
 SERVICE_GET_AUDIO_PRODUCT_TONE_CONTROLS = "get_audio_product_tone_controls"
@@ -86,19 +111,24 @@ SERVICE_GET_PRODUCT_CEC_HDMI_CONTROL = "get_product_cec_hdmi_control"
 SERVICE_GET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS = "get_product_hdmi_assignment_controls"
 SERVICE_GET_SOURCE_LIST = "get_source_list"
 SERVICE_GET_SUPPORTED_URLS = "get_supported_urls"
+SERVICE_IMPORT_CONFIG = "import_config"
 SERVICE_MUSICSERVICE_STATION_LIST = "musicservice_station_list"
 SERVICE_PLAY_CONTENTITEM = "play_contentitem"
 SERVICE_PLAY_HANDOFF = "play_handoff"
+SERVICE_PLAY_HISTORY = "play_history"
 SERVICE_PLAY_TTS = "play_tts"
 SERVICE_PLAY_URL = "play_url"
 SERVICE_PLAY_URL_DLNA = "play_url_dlna"
 SERVICE_PRESET_LIST = "preset_list"
 SERVICE_PRESET_REMOVE = "preset_remove"
 SERVICE_PRESET_STORE = "preset_store"
+SERVICE_PRESET_STORE_BULK = "preset_store_bulk"
 SERVICE_REBOOT_DEVICE = "reboot_device"
 SERVICE_RECENT_LIST = "recent_list"
 SERVICE_RECENT_LIST_CACHE = "recent_list_cache"
 SERVICE_REMOTE_KEYPRESS = "remote_keypress"
+SERVICE_SEARCH = "search"
+SERVICE_SEARCH_STORED_MUSIC = "search_stored_music"
 SERVICE_SET_AUDIO_DSP_CONTROLS = "set_audio_dsp_controls"
 SERVICE_SET_AUDIO_PRODUCT_LEVEL_CONTROLS = "set_audio_product_level_controls"
 SERVICE_SET_AUDIO_PRODUCT_TONE_CONTROLS = "set_audio_product_tone_controls"
@@ -111,7 +141,11 @@ SERVICE_SET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS = "set_product_hdmi_assignment_cont
 SERVICE_SNAPSHOT_RESTORE = "snapshot_restore"
 SERVICE_SNAPSHOT_STORE = "snapshot_store"
 SERVICE_UPDATE_SOURCE_NOWPLAYINGSTATUS = "update_source_nowplayingstatus"
+SERVICE_ZONE_BUILD = "zone_build"
+SERVICE_ZONE_SNAPSHOT_RESTORE = "zone_snapshot_restore"
+SERVICE_ZONE_SNAPSHOT_STORE = "zone_snapshot_store"
 SERVICE_ZONE_TOGGLE_MEMBER = "zone_toggle_member"
+SERVICE_ZONE_VOLUME = "zone_volume"
 
 
 SERVICE_ADD_WIRELESS_PROFILE_SCHEMA = vol.Schema(
@@ -140,6 +174,13 @@ SERVICE_CLEAR_SOURCE_NOWPLAYINGSTATUS_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_EXPORT_CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional("sections"): vol.All(cv.ensure_list, [vol.In(list(FLEET_CONFIG_SECTIONS.keys()))]),
+    }
+)
+
 SERVICE_GET_AUDIO_DSP_CONTROLS_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
@@ -222,6 +263,15 @@ SERVICE_GET_SUPPORTED_URLS_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_IMPORT_CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Required("config"): dict,
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional("sections"): vol.All(cv.ensure_list, [vol.In(list(FLEET_CONFIG_SECTIONS.keys()))]),
+        vol.Optional("source_device_id"): cv.string,
+    }
+)
+
 SERVICE_MUSICSERVICE_STATION_LIST_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
@@ -249,7 +299,17 @@ SERVICE_PLAY_HANDOFF_SCHEMA = vol.Schema(
         vol.Required("entity_id_from"): cv.entity_id,
         vol.Required("entity_id_to"): cv.entity_id,
         vol.Required("restore_volume", default=False): cv.boolean,
-        vol.Required("snapshot_only", default=False): cv.boolean
+        vol.Required("snapshot_only", default=False): cv.boolean,
+        vol.Optional("volume_level"): vol.All(vol.Range(min=0,max=100))
+    }
+)
+
+SERVICE_PLAY_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("period_days", default=7): vol.All(vol.Coerce(int), vol.Range(min=0, max=30)),
+        vol.Optional("this_device_only", default=False): cv.boolean,
+        vol.Optional("limit", default=25): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
     }
 )
 
@@ -319,6 +379,26 @@ SERVICE_PRESET_STORE_SCHEMA = vol.Schema(
     }   
 )
 
+SERVICE_PRESET_STORE_BULK_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("presets"): vol.All(cv.ensure_list, [
+            vol.Schema(
+                {
+                    vol.Required("preset_id"): vol.All(vol.Coerce(int), vol.Range(min=1,max=6)),
+                    vol.Optional("name"): cv.string,
+                    vol.Required("source"): cv.string,
+                    vol.Optional("source_account"): cv.string,
+                    vol.Optional("item_type"): cv.string,
+                    vol.Optional("location"): cv.string,
+                    vol.Optional("container_art"): cv.string,
+                }
+            )
+        ]),
+        vol.Optional("remove_unlisted", default=False): cv.boolean,
+    }
+)
+
 SERVICE_REBOOT_DEVICE_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
@@ -335,6 +415,10 @@ SERVICE_RECENT_LIST_SCHEMA = vol.Schema(
 SERVICE_RECENT_LIST_CACHE_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("source"): cv.string,
+        vol.Optional("since"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("offset"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
     }
 )
 
@@ -346,6 +430,25 @@ SERVICE_REMOTE_KEYPRESS_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("criteria"): cv.string,
+        vol.Optional("collections"): vol.All(cv.ensure_list, [vol.In(["presets", "recents", "recents_cache"])]),
+        vol.Optional("limit", default=25): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }
+)
+
+SERVICE_SEARCH_STORED_MUSIC_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("criteria"): cv.string,
+        vol.Optional("limit", default=50): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+        vol.Optional("include_containers", default=True): cv.boolean,
+        vol.Optional("refresh_index", default=False): cv.boolean,
+    }
+)
+
 SERVICE_SET_AUDIO_DSP_CONTROLS_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
@@ -416,12 +519,15 @@ SERVICE_SNAPSHOT_RESTORE_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
         vol.Required("restore_volume", default=True): cv.boolean,
+        vol.Optional("name"): cv.string,
+        vol.Optional("restore_mode", default=SNAPSHOT_RESTORE_MODE_FULL): vol.In([SNAPSHOT_RESTORE_MODE_FULL, SNAPSHOT_RESTORE_MODE_CHANGES]),
     }
 )
 
 SERVICE_SNAPSHOT_STORE_SCHEMA = vol.Schema(
     {
-        vol.Required("entity_id"): cv.entity_id
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("name"): cv.string,
     }
 )
 
@@ -446,6 +552,28 @@ SERVICE_UPDATE_SOURCE_NOWPLAYINGSTATUS_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_ZONE_BUILD_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("members"): cv.entity_ids,
+        vol.Optional("timeout", default=20): vol.All(vol.Coerce(float), vol.Range(min=1, max=120)),
+    }
+)
+
+SERVICE_ZONE_SNAPSHOT_RESTORE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("restore_volume", default=True): cv.boolean,
+        vol.Optional("restore_mode", default=SNAPSHOT_RESTORE_MODE_FULL): vol.In([SNAPSHOT_RESTORE_MODE_FULL, SNAPSHOT_RESTORE_MODE_CHANGES]),
+    }
+)
+
+SERVICE_ZONE_SNAPSHOT_STORE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+
 SERVICE_ZONE_TOGGLE_MEMBER_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id_master"): cv.entity_id,
@@ -453,6 +581,14 @@ SERVICE_ZONE_TOGGLE_MEMBER_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_ZONE_VOLUME_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("volume_mode", default=ZONE_VOLUME_MODE_SET): vol.In([ZONE_VOLUME_MODE_SET, ZONE_VOLUME_MODE_OFFSET, ZONE_VOLUME_MODE_SCALE]),
+        vol.Required("volume_level"): vol.All(vol.Coerce(int), vol.Range(min=-100,max=100)),
+    }
+)
+
 
 def _trace_LogTextFile(filePath: str, title: str) -> None:
     """
@@ -468,6 +604,41 @@ def _trace_LogTextFile(filePath: str, title: str) -> None:
     _logsi.LogTextFile(SILevel.Verbose, title, filePath)
 
 
+async def _async_StartZeroconfBrowser(hass:HomeAssistant) -> None:
+    """
+    Starts watching for SoundTouch devices leaving the network (if not already started),
+    so that a zone master that is shut down cleanly can be failed over without waiting
+    for a websocket error.
+
+    A zone master that loses power does not send a zeroconf goodbye, so it is only 
+    reported once it's zeroconf records expire; such a loss is normally detected by the
+    websocket error first.
+    """
+    global _zeroconfBrowser
+    if _zeroconfBrowser is not None:
+        return
+
+    def _OnZeroconfServiceStateChange(zeroconf, service_type:str, name:str, state_change:ServiceStateChange) -> None:
+        if state_change is not ServiceStateChange.Removed:
+            return
+        deviceName:str = name.removesuffix("." + service_type)
+        _logsi.LogVerbose("ZeroConf reported that SoundTouch device '%s' was removed from the network" % deviceName)
+        for data in hass.data.get(DOMAIN, {}).values():
+            if (data.media_player is not None) and (data.client.Device.DeviceName == deviceName):
+                data.media_player._StartZoneMasterFailover("zeroconf removal")
+
+    async def _async_stop_zeroconf_browser(event:Event) -> None:
+        global _zeroconfBrowser
+        if _zeroconfBrowser is not None:
+            await _zeroconfBrowser.async_cancel()
+            _zeroconfBrowser = None
+
+    aiozc = await async_get_async_instance(hass)
+    _zeroconfBrowser = AsyncServiceBrowser(aiozc.zeroconf, "_soundtouch._tcp.local.", handlers=[_OnZeroconfServiceStateChange])
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_zeroconf_browser)
+    _logsi.LogVerbose("ZeroConf browser was started for zone master failover")
+
+
 async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
     """
     Set up the component.
@@ -491,7 +662,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
         _logsi.EnterMethod(SILevel.Debug)
         if _logsi.IsOn(SILevel.Verbose):
 
-            _logsi.LogObject(SILevel.Verbose, "Component async_setup for configuration type", config)
+            TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "Component async_setup for configuration type", config)
 
             # log the manifest file contents.
             # as of HA 2024.6, we have to use an executor job to do this as the trace uses a blocking file open / read call.
@@ -508,11 +679,11 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                 itemKey:str = str(item)
                 itemObj = config[itemKey]
                 if isinstance(itemObj,dict):
-                    _logsi.LogDictionary(SILevel.Verbose, "ConfigType '%s' data (dictionary)" % itemKey, itemObj, prettyPrint=True)
+                    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, "ConfigType '%s' data (dictionary)" % itemKey, itemObj, prettyPrint=True)
                 elif isinstance(itemObj,list):
-                    _logsi.LogArray(SILevel.Verbose, "ConfigType '%s' data (list)" % itemKey, itemObj)
+                    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, "ConfigType '%s' data (list)" % itemKey, itemObj)
                 else:
-                    _logsi.LogObject(SILevel.Verbose, "ConfigType '%s' data (object)" % (itemKey), itemObj)
+                    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "ConfigType '%s' data (object)" % (itemKey), itemObj)
 
 
         async def service_handle_entity(service:ServiceCall) -> None:
@@ -528,8 +699,8 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                 # trace.
                 _logsi.EnterMethod(SILevel.Debug)
                 _logsi.LogVerbose(STAppMessages.MSG_SERVICE_CALL_START, service.service, "service_handle_entity")
-                _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_PARM, service)
-                _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_DATA, service.data)
+                TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_PARM, service)
+                TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_DATA, service.data)
 
                 # get player instance from service parameter; if not found, then we are done.
                 entity = _GetEntityFromServiceData(hass, service, "entity_id")
@@ -570,13 +741,32 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                                                       position, session_id, station_location, station_name, track, track_id)
 
                 elif service.service == SERVICE_SNAPSHOT_STORE:
+                    name = service.data.get("name")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_snapshot_store)
+                    await hass.async_add_executor_job(entity.service_snapshot_store, name)
 
                 elif service.service == SERVICE_SNAPSHOT_RESTORE:
                     restore_volume = service.data.get("restore_volume")
+                    name = service.data.get("name")
+                    restore_mode = service.data.get("restore_mode")
+                    _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
+                    await hass.async_add_executor_job(entity.service_snapshot_restore, restore_volume, name, restore_mode)
+
+                elif service.service == SERVICE_ZONE_SNAPSHOT_STORE:
+                    _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
+                    await hass.async_add_executor_job(entity.service_zone_snapshot_store)
+
+                elif service.service == SERVICE_ZONE_SNAPSHOT_RESTORE:
+                    restore_volume = service.data.get("restore_volume")
+                    restore_mode = service.data.get("restore_mode")
+                    _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
+                    await hass.async_add_executor_job(entity.service_zone_snapshot_restore, restore_volume, restore_mode)
+
+                elif service.service == SERVICE_ZONE_VOLUME:
+                    volume_mode = service.data.get("volume_mode")
+                    volume_level = service.data.get("volume_level")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_snapshot_restore, restore_volume)
+                    await hass.async_add_executor_job(entity.service_zone_volume, volume_mode, volume_level)
 
                 elif service.service == SERVICE_REMOTE_KEYPRESS:
                     key_id = service.data.get("key_id")
@@ -737,8 +927,8 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                 # trace.
                 _logsi.EnterMethod(SILevel.Debug)
                 _logsi.LogVerbose(STAppMessages.MSG_SERVICE_CALL_START, service.service, "service_handle_entityfromto")
-                _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_PARM, service)
-                _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_DATA, service.data)
+                TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_PARM, service)
+                TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_DATA, service.data)
 
                 # process service request.
                 if service.service == SERVICE_PLAY_HANDOFF:
@@ -761,7 +951,8 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                     # process play handoff service.
                     restore_volume = service.data.get("restore_volume")
                     snapshot_only = service.data.get("snapshot_only")
-                    await hass.async_add_executor_job(from_player.service_play_handoff, to_player, restore_volume, snapshot_only)
+                    volume_level = service.data.get("volume_level")
+                    await hass.async_add_executor_job(from_player.service_play_handoff, to_player, restore_volume, snapshot_only, volume_level)
 
                 elif service.service == SERVICE_ZONE_TOGGLE_MEMBER:
 
@@ -907,8 +1098,8 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                 # trace.
                 _logsi.EnterMethod(SILevel.Debug)
                 _logsi.LogVerbose(STAppMessages.MSG_SERVICE_CALL_START, service.service, "service_handle_serviceresponse")
-                _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_PARM, service)
-                _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_DATA, service.data)
+                TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_PARM, service)
+                TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_DATA, service.data)
 
                 # get player instance from service parameter; if not found, then we are done.
                 entity = _GetEntityFromServiceData(hass, service, "entity_id")
@@ -1009,6 +1200,15 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
                     response = await hass.async_add_executor_job(entity.service_musicservice_station_list, source, source_account, sort_type)
 
+                elif service.service == SERVICE_PLAY_HISTORY:
+
+                    # get most played items from the play history index.
+                    period_days = service.data.get("period_days")
+                    this_device_only = service.data.get("this_device_only")
+                    limit = service.data.get("limit")
+                    _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
+                    response = await hass.async_add_executor_job(entity.service_play_history, period_days, this_device_only, limit)
+
                 elif service.service == SERVICE_PRESET_LIST:
 
                     # get list of presets defined for the device.
@@ -1016,6 +1216,14 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
                     response = await hass.async_add_executor_job(entity.service_preset_list, include_empty_slots)
 
+                elif service.service == SERVICE_PRESET_STORE_BULK:
+
+                    # store a complete preset layout, writing only the changed preset slots.
+                    presets = service.data.get("presets")
+                    remove_unlisted = service.data.get("remove_unlisted")
+                    _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
+                    response = await hass.async_add_executor_job(entity.service_preset_store_bulk, presets, remove_unlisted)
+
                 elif service.service == SERVICE_RECENT_LIST:
 
                     # get list of recently played items defined for the device.
@@ -1025,15 +1233,46 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                 elif service.service == SERVICE_RECENT_LIST_CACHE:
 
                     # get list of recently played cached items defined for the device.
+                    source = service.data.get("source")
+                    since = service.data.get("since")
+                    offset = service.data.get("offset")
+                    limit = service.data.get("limit")
+                    _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
+                    response = await hass.async_add_executor_job(entity.service_recent_list_cache, source, since, offset, limit)
+
+                elif service.service == SERVICE_SEARCH:
+
+                    # search presets, recents, and recents cache items.
+                    criteria = service.data.get("criteria")
+                    collections = service.data.get("collections")
+                    limit = service.data.get("limit")
+                    _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
+                    response = await hass.async_add_executor_job(entity.service_search, criteria, collections, limit)
+
+                elif service.service == SERVICE_SEARCH_STORED_MUSIC:
+
+                    # search the stored music library index.
+                    criteria = service.data.get("criteria")
+                    limit = service.data.get("limit")
+                    include_containers = service.data.get("include_containers")
+                    refresh_index = service.data.get("refresh_index")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_recent_list_cache)
+                    response = await hass.async_add_executor_job(entity.service_search_stored_music, criteria, limit, include_containers, refresh_index)
+
+                elif service.service == SERVICE_ZONE_BUILD:
+
+                    # build a zone, confirming that each member joined.
+                    members = service.data.get("members")
+                    timeout = service.data.get("timeout")
+                    _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
+                    response = await hass.async_add_executor_job(entity.service_zone_build, members, timeout)
 
                 else:
                     
                     raise IntegrationError("Unrecognized service identifier \"%s\" in method \"service_handle_serviceresponse\"." % service.service)
 
                 # return the response.
-                _logsi.LogDictionary(SILevel.Verbose, "Service Response data: '%s'" % (service.service), response, prettyPrint=True)
+                TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, "Service Response data: '%s'" % (service.service), response, prettyPrint=True)
                 return response 
 
             except HomeAssistantError as ex: 
@@ -1054,6 +1293,130 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
                 _logsi.LeaveMethod(SILevel.Debug)
 
 
+        async def service_handle_fleetresponse(service: ServiceCall) -> ServiceResponse:
+            """
+            Handle service requests that process multiple devices concurrently, and return
+            service response data.
+
+            Args:
+                service (ServiceCall):
+                    ServiceCall instance that contains service data (requested service name, field parameters, etc).
+            """
+            try:
+
+                # trace.
+                _logsi.EnterMethod(SILevel.Debug)
+                _logsi.LogVerbose(STAppMessages.MSG_SERVICE_CALL_START, service.service, "service_handle_fleetresponse")
+                TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_PARM, service)
+                TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_CALL_DATA, service.data)
+
+                # get instance data of the devices to process (all devices if no entities were specified).
+                entity_ids = service.data.get("entity_id")
+                sections = service.data.get("sections")
+                # entries whose media player has not been created yet are skipped.
+                devices:list[InstanceDataSoundTouchPlus] = [
+                    data for data in hass.data.get(DOMAIN, {}).values()
+                    if (data.media_player is not None) and ((entity_ids is None) or (data.media_player.entity_id in entity_ids))
+                    ]
+                startTime:float = time.monotonic()
+
+                # process service request.
+                if service.service == SERVICE_EXPORT_CONFIG:
+
+                    # read the settings of each device concurrently.
+                    _logsi.LogVerbose("Exporting fleet configuration from %d device(s)" % len(devices))
+                    results = await asyncio.gather(
+                        *[hass.async_add_executor_job(ExportDeviceConfig, data.client, sections) for data in devices],
+                        return_exceptions=True)
+
+                    exported:list[dict] = []
+                    errors:dict = {}
+                    for data, result in zip(devices, results):
+                        if isinstance(result, Exception):
+                            errors[data.client.Device.DeviceId] = getattr(result, "Message", None) or str(result)
+                        else:
+                            exported.append(result)
+
+                    response:dict = {
+                        "Version": FLEET_CONFIG_VERSION,
+                        "ExportedOn": int(time.time()),
+                        "ElapsedSeconds": round(time.monotonic() - startTime, 3),
+                        "Devices": exported,
+                        "Errors": errors,
+                    }
+
+                elif service.service == SERVICE_IMPORT_CONFIG:
+
+                    # index the document device entries by device id.
+                    config:dict = service.data.get("config")
+                    source_device_id = service.data.get("source_device_id")
+                    if config.get("Version", FLEET_CONFIG_VERSION) != FLEET_CONFIG_VERSION:
+                        raise ServiceValidationError("Configuration document version '%s' is not supported" % str(config.get("Version")))
+                    entries:dict[str, dict] = {}
+                    for entry in config.get("Devices", []):
+                        entries[entry.get("DeviceId")] = entry
+                    if (source_device_id is not None) and (source_device_id not in entries):
+                        raise ServiceValidationError("Source device id '%s' was not found in the configuration document" % source_device_id)
+
+                    # resolve the settings to apply to each device; device names are only 
+                    # applied to the device they were exported from.
+                    applies:list[tuple[InstanceDataSoundTouchPlus, dict]] = []
+                    reports:list[dict] = []
+                    for data in devices:
+                        deviceId:str = data.client.Device.DeviceId
+                        entry:dict = entries.get(source_device_id or deviceId, None)
+                        if entry is None:
+                            reports.append({"DeviceId": deviceId, "DeviceName": data.client.Device.DeviceName, "Writes": 0, "Skipped": 0, "Changed": [], "Errors": {"Config": "Device was not found in the configuration document"}})
+                            continue
+                        settings:dict = dict(entry.get("Settings", {}))
+                        if entry.get("DeviceId") != deviceId:
+                            settings.pop(FLEET_SECTION_NAME, None)
+                        applies.append((data, settings))
+
+                    # apply the settings to each device concurrently.
+                    _logsi.LogVerbose("Importing fleet configuration to %d device(s)" % len(applies))
+                    results = await asyncio.gather(
+                        *[hass.async_add_executor_job(ApplyDeviceConfig, data.client, settings, sections) for data, settings in applies],
+                        return_exceptions=True)
+
+                    for (data, _), result in zip(applies, results):
+                        if isinstance(result, Exception):
+                            result = {"Writes": 0, "Skipped": 0, "Changed": [], "Errors": {"Config": getattr(result, "Message", None) or str(result)}}
+                        reports.append({"DeviceId": data.client.Device.DeviceId, "DeviceName": data.client.Device.DeviceName, **result})
+
+                    response:dict = {
+                        "ElapsedSeconds": round(time.monotonic() - startTime, 3),
+                        "Writes": sum(report["Writes"] for report in reports),
+                        "Skipped": sum(report["Skipped"] for report in reports),
+                        "Devices": reports,
+                    }
+
+                else:
+                    
+                    raise IntegrationError("Unrecognized service identifier \"%s\" in method \"service_handle_fleetresponse\"." % service.service)
+
+                # return the response.
+                TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, "Service Response data: '%s'" % (service.service), response, prettyPrint=True)
+                return response 
+
+            except HomeAssistantError as ex: 
+                
+                # log error, but not to system logger as HA will take care of it.
+                _logsi.LogError(str(ex), logToSystemLogger=False)
+                raise
+            
+            except Exception as ex:
+                
+                # log exception, but not to system logger as HA will take care of it.
+                _logsi.LogException(STAppMessages.MSG_SERVICE_REQUEST_EXCEPTION % (service.service, "service_handle_fleetresponse"), ex, logToSystemLogger=False)
+                raise
+
+            finally:
+                
+                # trace.
+                _logsi.LeaveMethod(SILevel.Debug)
+
+
         @staticmethod
         def _GetEntityFromServiceData(hass:HomeAssistant, service:ServiceCall, field_id:str) -> MediaPlayerEntity:
             """
@@ -1101,7 +1464,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
 
 
         # register all services this component provides, and their corresponding schemas.
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_ADD_WIRELESS_PROFILE, SERVICE_ADD_WIRELESS_PROFILE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_ADD_WIRELESS_PROFILE, SERVICE_ADD_WIRELESS_PROFILE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_ADD_WIRELESS_PROFILE,
@@ -1110,7 +1473,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_AUDIO_TONE_LEVELS, SERVICE_AUDIO_TONE_LEVELS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_AUDIO_TONE_LEVELS, SERVICE_AUDIO_TONE_LEVELS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_AUDIO_TONE_LEVELS,
@@ -1119,7 +1482,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_CLEAR_SOURCE_NOWPLAYINGSTATUS, SERVICE_CLEAR_SOURCE_NOWPLAYINGSTATUS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_CLEAR_SOURCE_NOWPLAYINGSTATUS, SERVICE_CLEAR_SOURCE_NOWPLAYINGSTATUS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_CLEAR_SOURCE_NOWPLAYINGSTATUS,
@@ -1128,7 +1491,16 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_AUDIO_DSP_CONTROLS, SERVICE_GET_AUDIO_DSP_CONTROLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_EXPORT_CONFIG, SERVICE_EXPORT_CONFIG_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT_CONFIG,
+            service_handle_fleetresponse,
+            schema=SERVICE_EXPORT_CONFIG_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_AUDIO_DSP_CONTROLS, SERVICE_GET_AUDIO_DSP_CONTROLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_AUDIO_DSP_CONTROLS,
@@ -1137,7 +1509,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_AUDIO_PRODUCT_LEVEL_CONTROLS, SERVICE_GET_AUDIO_PRODUCT_LEVEL_CONTROLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_AUDIO_PRODUCT_LEVEL_CONTROLS, SERVICE_GET_AUDIO_PRODUCT_LEVEL_CONTROLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_AUDIO_PRODUCT_LEVEL_CONTROLS,
@@ -1146,7 +1518,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_AUDIO_PRODUCT_TONE_CONTROLS, SERVICE_GET_AUDIO_PRODUCT_TONE_CONTROLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_AUDIO_PRODUCT_TONE_CONTROLS, SERVICE_GET_AUDIO_PRODUCT_TONE_CONTROLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_AUDIO_PRODUCT_TONE_CONTROLS,
@@ -1155,7 +1527,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_AUDIO_SPEAKER_ATTRIBUTE_AND_SETTING, SERVICE_GET_AUDIO_SPEAKER_ATTRIBUTE_AND_SETTING_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_AUDIO_SPEAKER_ATTRIBUTE_AND_SETTING, SERVICE_GET_AUDIO_SPEAKER_ATTRIBUTE_AND_SETTING_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_AUDIO_SPEAKER_ATTRIBUTE_AND_SETTING,
@@ -1164,7 +1536,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_BALANCE, SERVICE_GET_BALANCE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_BALANCE, SERVICE_GET_BALANCE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_BALANCE,
@@ -1173,7 +1545,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_BASS_CAPABILITIES, SERVICE_GET_BASS_CAPABILITIES_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_BASS_CAPABILITIES, SERVICE_GET_BASS_CAPABILITIES_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_BASS_CAPABILITIES,
@@ -1182,7 +1554,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_BASS_LEVEL, SERVICE_GET_BASS_LEVEL_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_BASS_LEVEL, SERVICE_GET_BASS_LEVEL_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_BASS_LEVEL,
@@ -1191,7 +1563,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_DEVICE_INFO, SERVICE_GET_DEVICE_INFO_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_DEVICE_INFO, SERVICE_GET_DEVICE_INFO_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_DEVICE_INFO,
@@ -1200,7 +1572,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_PRODUCT_CEC_HDMI_CONTROL, SERVICE_GET_PRODUCT_CEC_HDMI_CONTROL_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_PRODUCT_CEC_HDMI_CONTROL, SERVICE_GET_PRODUCT_CEC_HDMI_CONTROL_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_PRODUCT_CEC_HDMI_CONTROL,
@@ -1209,7 +1581,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS, SERVICE_GET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS, SERVICE_GET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS,
@@ -1218,7 +1590,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_SOURCE_LIST, SERVICE_GET_SOURCE_LIST_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_SOURCE_LIST, SERVICE_GET_SOURCE_LIST_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_SOURCE_LIST,
@@ -1227,7 +1599,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_SUPPORTED_URLS, SERVICE_GET_SUPPORTED_URLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_GET_SUPPORTED_URLS, SERVICE_GET_SUPPORTED_URLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_GET_SUPPORTED_URLS,
@@ -1236,7 +1608,16 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_MUSICSERVICE_STATION_LIST, SERVICE_MUSICSERVICE_STATION_LIST_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_IMPORT_CONFIG, SERVICE_IMPORT_CONFIG_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_IMPORT_CONFIG,
+            service_handle_fleetresponse,
+            schema=SERVICE_IMPORT_CONFIG_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_MUSICSERVICE_STATION_LIST, SERVICE_MUSICSERVICE_STATION_LIST_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_MUSICSERVICE_STATION_LIST,
@@ -1245,7 +1626,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_CONTENTITEM, SERVICE_PLAY_CONTENTITEM_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_CONTENTITEM, SERVICE_PLAY_CONTENTITEM_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_PLAY_CONTENTITEM,
@@ -1254,7 +1635,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_HANDOFF, SERVICE_PLAY_HANDOFF_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_HANDOFF, SERVICE_PLAY_HANDOFF_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_PLAY_HANDOFF,
@@ -1263,7 +1644,16 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_TTS, SERVICE_PLAY_TTS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_HISTORY, SERVICE_PLAY_HISTORY_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PLAY_HISTORY,
+            service_handle_serviceresponse,
+            schema=SERVICE_PLAY_HISTORY_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_TTS, SERVICE_PLAY_TTS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_PLAY_TTS,
@@ -1272,7 +1662,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_URL, SERVICE_PLAY_URL_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_URL, SERVICE_PLAY_URL_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_PLAY_URL,
@@ -1281,7 +1671,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_URL_DLNA, SERVICE_PLAY_URL_DLNA_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PLAY_URL_DLNA, SERVICE_PLAY_URL_DLNA_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_PLAY_URL_DLNA,
@@ -1290,7 +1680,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PRESET_LIST, SERVICE_PRESET_LIST_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PRESET_LIST, SERVICE_PRESET_LIST_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_PRESET_LIST,
@@ -1299,7 +1689,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PRESET_REMOVE, SERVICE_PRESET_REMOVE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PRESET_REMOVE, SERVICE_PRESET_REMOVE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_PRESET_REMOVE,
@@ -1308,7 +1698,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PRESET_STORE, SERVICE_PRESET_STORE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PRESET_STORE, SERVICE_PRESET_STORE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_PRESET_STORE,
@@ -1317,7 +1707,16 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_REBOOT_DEVICE, SERVICE_REBOOT_DEVICE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_PRESET_STORE_BULK, SERVICE_PRESET_STORE_BULK_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PRESET_STORE_BULK,
+            service_handle_serviceresponse,
+            schema=SERVICE_PRESET_STORE_BULK_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_REBOOT_DEVICE, SERVICE_REBOOT_DEVICE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_REBOOT_DEVICE,
@@ -1326,7 +1725,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_RECENT_LIST, SERVICE_RECENT_LIST_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_RECENT_LIST, SERVICE_RECENT_LIST_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_RECENT_LIST,
@@ -1335,7 +1734,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_RECENT_LIST_CACHE, SERVICE_RECENT_LIST_CACHE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_RECENT_LIST_CACHE, SERVICE_RECENT_LIST_CACHE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_RECENT_LIST_CACHE,
@@ -1344,7 +1743,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_REMOTE_KEYPRESS, SERVICE_REMOTE_KEYPRESS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_REMOTE_KEYPRESS, SERVICE_REMOTE_KEYPRESS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_REMOTE_KEYPRESS,
@@ -1353,7 +1752,25 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_AUDIO_DSP_CONTROLS, SERVICE_SET_AUDIO_DSP_CONTROLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SEARCH, SERVICE_SEARCH_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SEARCH,
+            service_handle_serviceresponse,
+            schema=SERVICE_SEARCH_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SEARCH_STORED_MUSIC, SERVICE_SEARCH_STORED_MUSIC_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SEARCH_STORED_MUSIC,
+            service_handle_serviceresponse,
+            schema=SERVICE_SEARCH_STORED_MUSIC_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_AUDIO_DSP_CONTROLS, SERVICE_SET_AUDIO_DSP_CONTROLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_AUDIO_DSP_CONTROLS,
@@ -1362,7 +1779,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_AUDIO_PRODUCT_LEVEL_CONTROLS, SERVICE_SET_AUDIO_PRODUCT_LEVEL_CONTROLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_AUDIO_PRODUCT_LEVEL_CONTROLS, SERVICE_SET_AUDIO_PRODUCT_LEVEL_CONTROLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_AUDIO_PRODUCT_LEVEL_CONTROLS,
@@ -1371,7 +1788,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_AUDIO_PRODUCT_TONE_CONTROLS, SERVICE_SET_AUDIO_PRODUCT_TONE_CONTROLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_AUDIO_PRODUCT_TONE_CONTROLS, SERVICE_SET_AUDIO_PRODUCT_TONE_CONTROLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_AUDIO_PRODUCT_TONE_CONTROLS,
@@ -1380,7 +1797,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_BALANCE_LEVEL, SERVICE_SET_BALANCE_LEVEL_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_BALANCE_LEVEL, SERVICE_SET_BALANCE_LEVEL_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_BALANCE_LEVEL,
@@ -1389,7 +1806,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_BASS_LEVEL, SERVICE_SET_BASS_LEVEL_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_BASS_LEVEL, SERVICE_SET_BASS_LEVEL_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_BASS_LEVEL,
@@ -1398,7 +1815,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_LANGUAGE, SERVICE_SET_LANGUAGE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_LANGUAGE, SERVICE_SET_LANGUAGE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_LANGUAGE,
@@ -1407,7 +1824,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_NAME, SERVICE_SET_NAME_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_NAME, SERVICE_SET_NAME_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_NAME,
@@ -1416,7 +1833,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_PRODUCT_CEC_HDMI_CONTROL, SERVICE_SET_PRODUCT_CEC_HDMI_CONTROL_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_PRODUCT_CEC_HDMI_CONTROL, SERVICE_SET_PRODUCT_CEC_HDMI_CONTROL_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_PRODUCT_CEC_HDMI_CONTROL,
@@ -1425,7 +1842,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS, SERVICE_SET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS, SERVICE_SET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SET_PRODUCT_HDMI_ASSIGNMENT_CONTROLS,
@@ -1434,7 +1851,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SNAPSHOT_RESTORE, SERVICE_SNAPSHOT_RESTORE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SNAPSHOT_RESTORE, SERVICE_SNAPSHOT_RESTORE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SNAPSHOT_RESTORE,
@@ -1443,7 +1860,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SNAPSHOT_STORE, SERVICE_SNAPSHOT_STORE_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SNAPSHOT_STORE, SERVICE_SNAPSHOT_STORE_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_SNAPSHOT_STORE,
@@ -1452,7 +1869,7 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_UPDATE_SOURCE_NOWPLAYINGSTATUS, SERVICE_UPDATE_SOURCE_NOWPLAYINGSTATUS_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_UPDATE_SOURCE_NOWPLAYINGSTATUS, SERVICE_UPDATE_SOURCE_NOWPLAYINGSTATUS_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_UPDATE_SOURCE_NOWPLAYINGSTATUS,
@@ -1461,7 +1878,34 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             supports_response=SupportsResponse.NONE,
         )
 
-        _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_ZONE_TOGGLE_MEMBER, SERVICE_ZONE_TOGGLE_MEMBER_SCHEMA)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_ZONE_BUILD, SERVICE_ZONE_BUILD_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_ZONE_BUILD,
+            service_handle_serviceresponse,
+            schema=SERVICE_ZONE_BUILD_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_ZONE_SNAPSHOT_RESTORE, SERVICE_ZONE_SNAPSHOT_RESTORE_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_ZONE_SNAPSHOT_RESTORE,
+            service_handle_entity,
+            schema=SERVICE_ZONE_SNAPSHOT_RESTORE_SCHEMA,
+            supports_response=SupportsResponse.NONE,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_ZONE_SNAPSHOT_STORE, SERVICE_ZONE_SNAPSHOT_STORE_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_ZONE_SNAPSHOT_STORE,
+            service_handle_entity,
+            schema=SERVICE_ZONE_SNAPSHOT_STORE_SCHEMA,
+            supports_response=SupportsResponse.NONE,
+        )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_ZONE_TOGGLE_MEMBER, SERVICE_ZONE_TOGGLE_MEMBER_SCHEMA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_ZONE_TOGGLE_MEMBER,
@@ -1469,7 +1913,40 @@ async def async_setup(hass:HomeAssistant, config:ConfigType) -> bool:
             schema=SERVICE_ZONE_TOGGLE_MEMBER_SCHEMA,
             supports_response=SupportsResponse.NONE,
         )
+
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_ZONE_VOLUME, SERVICE_ZONE_VOLUME_SCHEMA)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_ZONE_VOLUME,
+            service_handle_entity,
+            schema=SERVICE_ZONE_VOLUME_SCHEMA,
+            supports_response=SupportsResponse.NONE,
+        )
     
+        # flush any queued trace entries when HA is stopping.
+        async def _async_stop_trace_sink(event:Event) -> None:
+            await hass.async_add_executor_job(TRACE_SINK.Stop)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_trace_sink)
+
+        # load the play history index; new plays are saved shortly after they are recorded.
+        await PLAY_HISTORY_INDEX.async_Load(hass, "%s_play_history" % DOMAIN)
+
+        # artwork evicted from the in-memory artwork cache is spilled to disk (outside of
+        # .storage, which is reserved for HA Store json files).
+        ARTWORK_CACHE.SpillDirectory = hass.config.path(DOMAIN, "artwork")
+
+        # rendered tts messages are cached on disk, and served to the speakers by the
+        # HA http server (via it's internal url, as the speakers are on the local network).
+        TTS_CACHE.Directory = hass.config.path(DOMAIN, "tts")
+        try:
+            TTS_CACHE.BaseUrl = get_url(hass, allow_external=False, allow_ip=True, prefer_external=False)
+        except NoURLAvailableError:
+            _logsi.LogVerbose("TtsCache is disabled, as HA does not have an internal url")
+            TTS_CACHE.BaseUrl = None
+        hass.http.register_view(TtsCacheView(TTS_CACHE))
+        await hass.async_add_executor_job(TTS_CACHE.Prune)
+
         # indicate success.
         _logsi.LogVerbose("Component async_setup complete")
         return True
@@ -1584,6 +2061,31 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
         )
         _logsi.LogObject(SILevel.Verbose, "'%s': Component async_setup_entry media_player instance data object" % entry.title, hass.data[DOMAIN][entry.entry_id])
 
+        # open the recently played items history store if the recently played cache is enabled;
+        # it is seeded with the cache items when it is first created.  if the store cannot be
+        # opened (e.g. a corrupt database file), the recently played cache is used instead.
+        if client.RecentListCacheEnabled:
+            try:
+                await hass.async_add_executor_job(
+                    hass.data[DOMAIN][entry.entry_id].recents_store.Open,
+                    hass.config.path(DOMAIN, "recents_%s.db" % device.DeviceId),
+                    list(client.RecentListCache.Recents),
+                )
+            except (sqlite3.DatabaseError, OSError) as ex:
+                _logsi.LogWarning("'%s': Component async_setup_entry could not open the recently played items store; the recently played cache will be used instead: %s" % (entry.title, str(ex)))
+
+        # load the named snapshots that were stored by a previous session.
+        await hass.data[DOMAIN][entry.entry_id].snapshot_store.async_Load(hass, "%s_snapshots_%s" % (DOMAIN, device.DeviceId))
+
+        # load the stored music search index that was persisted by a previous crawl.
+        storedMusicIndex:StoredMusicIndex = hass.data[DOMAIN][entry.entry_id].stored_music_index
+        await storedMusicIndex.async_Load(hass, "%s_stored_music_%s" % (DOMAIN, device.DeviceId))
+
+        # watch for devices leaving the network if zone master failover is enabled; the
+        # option is applied by reloading the entry, so enabling it starts the browser.
+        if hass.data[DOMAIN][entry.entry_id].OptionZoneMasterFailover:
+            await _async_StartZeroconfBrowser(hass)
+
         # we are now ready for HA to create individual objects for each platform that
         # our device requires; in our case, it's just a media_player platform.
         # we initiate this by calling the `async_forward_entry_setups`, which 
@@ -1669,6 +2171,9 @@ async def async_unload_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
             # remove instance data from domain.
             _logsi.LogVerbose("'%s': Component async_unload_entry is removing our device instance data from the domain" % entry.title)
             data:InstanceDataSoundTouchPlus = hass.data[DOMAIN].pop(entry.entry_id)
+            data.navigate_cache.Shutdown()
+            data.stored_music_index.Shutdown()
+            await hass.async_add_executor_job(data.recents_store.Close)
             _logsi.LogObject(SILevel.Verbose, "'%s': Component async_unload_entry unloaded configuration entry instance data" % entry.title, data)
 
             # a quick check to make sure all update listeners were removed (see method doc notes above).
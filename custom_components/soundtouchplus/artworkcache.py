@@ -0,0 +1,292 @@
+"""
+Now playing artwork cache for the SoundTouchPlus component.
+
+The media player proxies now playing artwork (e.g. `ContainerArtUrl`) through Home
+Assistant, as the art is not remotely accessible.  Every frontend that renders the
+player (and every state change) can trigger a fetch from the speaker or the upstream
+art host.  The cache keeps recently used artwork in memory (within a size budget),
+optionally spills evicted artwork to disk, and deduplicates concurrent fetches of
+the same url.
+"""
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import hashlib
+import os
+
+from homeassistant.core import HomeAssistant
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+ARTWORK_CACHE_MAX_BYTES:int = 16 * 1024 * 1024
+""" Maximum number of artwork bytes to retain in memory. """
+
+ARTWORK_CACHE_MAX_DISK_BYTES:int = 64 * 1024 * 1024
+""" Maximum number of artwork bytes to retain on disk, if disk spill is enabled. """
+
+ARTWORK_CACHE_MAX_ITEM_BYTES:int = 2 * 1024 * 1024
+""" Maximum size of a single artwork image that will be cached. """
+
+
+class ArtworkCache:
+    """
+    LRU cache of artwork image bytes, keyed by art url.
+
+    Threadsafety:
+        This class is NOT thread-safe; it must only be used from the event loop.  Disk
+        i/o is processed in executor threads.
+    """
+
+    def __init__(self,
+                 maxBytes:int=ARTWORK_CACHE_MAX_BYTES,
+                 maxDiskBytes:int=ARTWORK_CACHE_MAX_DISK_BYTES,
+                 maxItemBytes:int=ARTWORK_CACHE_MAX_ITEM_BYTES,
+                 ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxBytes (int):
+                Maximum number of artwork bytes to retain in memory.
+            maxDiskBytes (int):
+                Maximum number of artwork bytes to retain on disk, if disk spill is enabled.
+            maxItemBytes (int):
+                Maximum size of a single artwork image that will be cached.
+        """
+        self._bytes:int = 0
+        self._fetches:dict[str, asyncio.Future] = {}
+        self._hits:int = 0
+        self._hitsDisk:int = 0
+        self._items:OrderedDict[str, tuple[bytes, str]] = OrderedDict()
+        self._maxBytes:int = max(0, maxBytes)
+        self._maxDiskBytes:int = max(0, maxDiskBytes)
+        self._maxItemBytes:int = max(0, maxItemBytes)
+        self._misses:int = 0
+        self._spillDirectory:str = None
+
+
+    @property
+    def Bytes(self) -> int:
+        """ Number of artwork bytes currently held in memory. """
+        return self._bytes
+
+
+    @property
+    def Count(self) -> int:
+        """ Number of artwork images currently held in memory. """
+        return len(self._items)
+
+
+    @property
+    def Hits(self) -> int:
+        """ Number of requests that were satisfied from memory. """
+        return self._hits
+
+
+    @property
+    def HitsDisk(self) -> int:
+        """ Number of requests that were satisfied from the disk spill directory. """
+        return self._hitsDisk
+
+
+    @property
+    def Misses(self) -> int:
+        """ Number of requests that required the artwork to be fetched. """
+        return self._misses
+
+
+    @property
+    def SpillDirectory(self) -> str:
+        """
+        Directory that artwork evicted from memory is spilled to, or None if disk spill
+        is disabled.
+        """
+        return self._spillDirectory
+
+    @SpillDirectory.setter
+    def SpillDirectory(self, value:str):
+        """
+        Sets the SpillDirectory property value.
+        """
+        self._spillDirectory = value
+
+
+    async def async_get(self,
+                        hass:HomeAssistant,
+                        url:str,
+                        fetch:Callable[[str], Awaitable[tuple[bytes|None, str|None]]],
+                        ) -> tuple[bytes|None, str|None]:
+        """
+        Returns the artwork image for a url, fetching it if it is not cached.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+            url (str):
+                The art url.
+            fetch (Callable):
+                Coroutine function that fetches the art url, and returns a tuple of the
+                image bytes and content type (e.g. `MediaPlayerEntity._async_fetch_image`).
+
+        Returns:
+            A tuple of the image bytes and content type; both are None if the image could
+            not be fetched.
+
+        Concurrent requests for the same url share a single fetch.
+        """
+        if url is None:
+            return None, None
+
+        # serve from memory.
+        item:tuple[bytes, str] = self._items.get(url, None)
+        if item is not None:
+            self._items.move_to_end(url)
+            self._hits += 1
+            return item
+
+        # if a fetch is already in progress for the url then wait for it.
+        future:asyncio.Future = self._fetches.get(url, None)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = hass.loop.create_future()
+        self._fetches[url] = future
+        try:
+
+            result:tuple[bytes|None, str|None] = await self._async_load(hass, url, fetch)
+            future.set_result(result)
+            return result
+
+        except Exception as ex:
+
+            future.set_exception(ex)
+            # mark the exception as retrieved, in case there were no other waiters.
+            future.exception()
+            raise
+
+        finally:
+
+            # if the fetch was cancelled, then cancel any waiters as well.
+            self._fetches.pop(url, None)
+            if not future.done():
+                future.cancel()
+
+
+    def Clear(self) -> None:
+        """
+        Removes all artwork from memory; artwork on disk is not removed.
+        """
+        self._items.clear()
+        self._bytes = 0
+
+
+    async def _async_load(self,
+                          hass:HomeAssistant,
+                          url:str,
+                          fetch:Callable[[str], Awaitable[tuple[bytes|None, str|None]]],
+                          ) -> tuple[bytes|None, str|None]:
+        """
+        Loads the artwork for a url from the disk spill directory or via fetch, and adds
+        it to the memory cache.
+        """
+        result:tuple[bytes|None, str|None] = None
+        spillDirectory:str = self._spillDirectory
+
+        # load from disk (if spill is enabled).
+        if spillDirectory is not None:
+            result = await hass.async_add_executor_job(self._ReadSpillFile, spillDirectory, url)
+            if result is not None:
+                self._hitsDisk += 1
+                _logsi.LogVerbose("ArtworkCache loaded artwork from disk: '%s'" % url)
+
+        # fetch the artwork.
+        if result is None:
+            self._misses += 1
+            _logsi.LogVerbose("ArtworkCache is fetching artwork: '%s'" % url)
+            result = await fetch(url)
+            if (result is None) or (result[0] is None):
+                return None, None
+
+        # add to memory, evicting (and spilling) least recently used artwork if required.
+        content, contentType = result
+        if len(content) > min(self._maxBytes, self._maxItemBytes):
+            return result
+        self._items[url] = (content, contentType)
+        self._bytes += len(content)
+        evicted:list[tuple[str, bytes, str]] = []
+        while self._bytes > self._maxBytes:
+            evictedUrl, (evictedContent, evictedContentType) = self._items.popitem(last=False)
+            self._bytes -= len(evictedContent)
+            evicted.append((evictedUrl, evictedContent, evictedContentType))
+        if (spillDirectory is not None) and (len(evicted) > 0):
+            hass.async_add_executor_job(self._WriteSpillFiles, spillDirectory, evicted, self._maxDiskBytes)
+
+        return result
+
+
+    @staticmethod
+    def _GetSpillFilePath(spillDirectory:str, url:str) -> str:
+        """
+        Returns the disk spill file path for a url.
+        """
+        return os.path.join(spillDirectory, hashlib.sha256(url.encode('utf-8')).hexdigest() + ".art")
+
+
+    @staticmethod
+    def _ReadSpillFile(spillDirectory:str, url:str) -> tuple[bytes, str] | None:
+        """
+        Reads the artwork for a url from the disk spill directory, or returns None if it
+        was not found.  The file contains the content type, a newline, and the image bytes.
+
+        This method accesses the file system, so it should be called from an executor thread.
+        """
+        try:
+            with open(ArtworkCache._GetSpillFilePath(spillDirectory, url), "rb") as file:
+                data:bytes = file.read()
+            contentType, _, content = data.partition(b"\n")
+            return content, contentType.decode('utf-8')
+        except OSError:
+            return None
+
+
+    @staticmethod
+    def _WriteSpillFiles(spillDirectory:str, items:list[tuple[str, bytes, str]], maxDiskBytes:int) -> None:
+        """
+        Writes artwork to the disk spill directory, and removes the oldest artwork files
+        if the directory exceeds its size budget.
+
+        This method accesses the file system, so it should be called from an executor thread.
+        """
+        try:
+
+            os.makedirs(spillDirectory, exist_ok=True)
+            for url, content, contentType in items:
+                with open(ArtworkCache._GetSpillFilePath(spillDirectory, url), "wb") as file:
+                    file.write((contentType or "").encode('utf-8') + b"\n" + content)
+
+            # enforce the disk size budget, removing the least recently written files first.
+            files:list[os.DirEntry] = [entry for entry in os.scandir(spillDirectory) if entry.name.endswith(".art")]
+            files.sort(key=lambda entry: entry.stat().st_mtime)
+            totalBytes:int = sum(entry.stat().st_size for entry in files)
+            for entry in files:
+                if totalBytes <= maxDiskBytes:
+                    break
+                totalBytes -= entry.stat().st_size
+                os.remove(entry.path)
+
+        except OSError as ex:
+
+            # trace.
+            _logsi.LogVerbose("ArtworkCache could not spill artwork to disk: %s" % str(ex))
+
+
+ARTWORK_CACHE:ArtworkCache = ArtworkCache()
+"""
+Shared artwork cache instance used by all media players.
+"""
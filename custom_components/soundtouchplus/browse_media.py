@@ -1,11 +1,13 @@
 """Support for SoundTouchPlus media browsing."""
 from __future__ import annotations
-from asyncio import run_coroutine_threadsafe
+import asyncio
 import base64
+import copy
 import os
 import pickle
 import logging
 import enum
+import time
 from typing import Any, Tuple
 
 from homeassistant.components import media_source
@@ -20,6 +22,7 @@ from homeassistant.exceptions import HomeAssistantError
 
 from bosesoundtouchapi import *
 from bosesoundtouchapi.models import *
+from bosesoundtouchapi.uri import SoundTouchNodes
 from spotifywebapipython import SpotifyClient
 from spotifywebapipython.models import (
     Album,
@@ -31,6 +34,7 @@ from spotifywebapipython.models import (
     Category,
     CategoryPage,
     EpisodeSimplified,
+    PageObject,
     PlayHistoryPage,
     Playlist,
     PlaylistPageSimplified, 
@@ -46,7 +50,10 @@ from spotifywebapipython.models import (
 from spotifywebapipython.sautils import GetUnixTimestampMSFromUtcNow
 
 from .const import DOMAIN, DOMAIN_SPOTIFYPLUS
+from .contentidregistry import CONTENT_ID_REGISTRY
 from .instancedata_soundtouchplus import InstanceDataSoundTouchPlus
+from .logsink import TRACE_SINK
+from .playhistoryindex import PLAY_HISTORY_INDEX
 from .stappmessages import STAppMessages
 
 # get smartinspect logger reference; create a new session for this module name.
@@ -65,11 +72,27 @@ MEDIA_TYPE_CATEGORY = "spotify_category"
 """ Spotify Show media type (aka PODCAST in HA) """
 
 SPOTIFY_BROWSE_LIMIT = 50
-""" Max number of items to return from a Spotify Web API query. """
+""" Max number of items to return from a Spotify Web API query; this is also the browse page size. """
+
+SPOTIFY_BROWSE_PAGE_OFFSET = "|offset="
+""" 
+Eye-catcher used to append a page offset to a media content id; "Next Page" child nodes 
+carry the media content id of the node that is paged, followed by this value and the 
+offset of the first item to display.
+"""
 
 SPOTIFY_BROWSE_LIMIT_TOTAL = 200
 """ Max number of items to return from a SpotifyPlus integration request that supports paging. """
 
+PLAY_HISTORY_BROWSE_DAYS = 7
+""" Number of days of plays that the play history browse node ranks items by. """
+
+PLAY_HISTORY_BROWSE_LIMIT = 50
+""" Max number of items to display in the play history browse node. """
+
+STORED_MUSIC_PAGE_SIZE = 100
+""" Max number of items to return from a STORED_MUSIC navigate request; this is also the browse page size. """
+
 class BrowsableMedia(enum.StrEnum):
     """
     Enum of browsable media.
@@ -78,8 +101,11 @@ class BrowsableMedia(enum.StrEnum):
     # library custom root node title definitions.
     LIBRARY_INDEX = "library_index"
     PANDORA_STATIONS = "pandora_stations"
+    PLAY_HISTORY = "play_history"
     SOUNDTOUCH_PRESETS = "soundtouch_presets"
     SOUNDTOUCH_RECENTLY_PLAYED = "soundtouch_recently_played"
+    STORED_MUSIC = "stored_music"
+    STORED_MUSIC_CONTAINER = "stored_music_container"
     # FAVORITES = "favorites"
     # spotify library types should all start with "spotify_".
     SPOTIFY_LIBRARY_INDEX = "spotify_library_index"
@@ -128,6 +154,27 @@ LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.TRACK,
     },
+    BrowsableMedia.PLAY_HISTORY.value: {
+        "title": "Most Played",
+        "title_node": "SoundTouchPlus Most Played This Week",
+        "image": f"/local/images/{DOMAIN}_medialib_play_history.png",
+        "parent": MediaClass.DIRECTORY,
+        "children": MediaClass.TRACK,
+        "is_index_item": True,
+    },
+    BrowsableMedia.STORED_MUSIC.value: {
+        "title": "Music Library",
+        "title_node": "SoundTouchPlus Music Library",
+        "image": f"/local/images/{DOMAIN}_medialib_stored_music.png",
+        "parent": MediaClass.DIRECTORY,
+        "children": MediaClass.DIRECTORY,
+        "is_index_item": True,
+    },
+    BrowsableMedia.STORED_MUSIC_CONTAINER.value: {
+        "parent": MediaClass.DIRECTORY,
+        "children": MediaClass.TRACK,
+        "is_index_item": False,
+    },
     # BrowsableMedia.FAVORITES.value: {
     #     "title": "Favorites",
     #     "title_node": "SoundTouchPlus Favorites",
@@ -341,10 +388,10 @@ The order listed is how they are displayed in the media browser.
 
 
 CATEGORY_BASE64:str = "category_base64::"
-""" Eye-catcher used to denote a serialized ContentItem. """
+""" Eye-catcher used to denote a serialized Category (legacy format; ids are now issued by the content id registry). """
 
 CONTENT_ITEM_BASE64:str = "ci_base64::"
-""" Eye-catcher used to denote a serialized ContentItem. """
+""" Eye-catcher used to denote a serialized ContentItem (legacy format; ids are now issued by the content id registry). """
 
 
 LOCAL_IMAGE_PREFIX:str = "/local/"
@@ -363,6 +410,37 @@ PLAYABLE_MEDIA_TYPES = [
 """ Array of all media types that are playable. """
 
 
+SPOTIFY_MEDIA_TYPES = [
+    MediaType.ALBUM,
+    MediaType.ARTIST,
+    MediaType.PLAYLIST,
+    MediaType.PODCAST,
+    MEDIA_TYPE_SHOW,
+]
+""" 
+Array of HA media types that are browsed via the SpotifyPlus integration, in addition
+to the "spotify_" prefixed library index media types.
+"""
+
+SPOTIFY_PAGED_MEDIA_TYPES = [
+    BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS,
+    BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS_MADEFORYOU,
+    BrowsableMedia.SPOTIFY_FEATURED_PLAYLISTS,
+    BrowsableMedia.SPOTIFY_NEW_RELEASES,
+    BrowsableMedia.SPOTIFY_USER_PLAYLISTS,
+    BrowsableMedia.SPOTIFY_USER_SAVED_ALBUMS,
+    BrowsableMedia.SPOTIFY_USER_SAVED_SHOWS,
+    BrowsableMedia.SPOTIFY_USER_SAVED_TRACKS,
+    BrowsableMedia.SPOTIFY_USER_TOP_ARTISTS,
+    BrowsableMedia.SPOTIFY_USER_TOP_TRACKS,
+    MediaType.ARTIST,
+]
+""" 
+Array of media types that are browsed one page (of `SPOTIFY_BROWSE_LIMIT` items) at a
+time; a "Next Page" child node is added if more items are available.
+"""
+
+
 class MediaSourceNotFoundError(BrowseError):
     """ Source could not be found for selected media type. """
 
@@ -410,6 +488,76 @@ def serialize_object(obj:object) -> str:
     return txt
 
 
+def resolve_category_id(media_content_id:str) -> Category:
+    """
+    Resolves a media content id to a Category object.
+
+    Args:
+        media_content_id (str):
+            A media content id that references a Category object; this can be a registry
+            id, or a legacy serialized (base64) id.
+
+    Returns:
+        A `Category` object, or None if the id does not reference a Category.
+    """
+    if media_content_id is None:
+        return None
+    if media_content_id.startswith(CATEGORY_BASE64):
+        return deserialize_object(media_content_id[len(CATEGORY_BASE64):])
+    return CONTENT_ID_REGISTRY.ResolveCategory(media_content_id)
+
+
+def resolve_content_item_id(media_content_id:str) -> ContentItem:
+    """
+    Resolves a media content id to a ContentItem object.
+
+    Args:
+        media_content_id (str):
+            A media content id that references a ContentItem object; this can be a registry
+            id, or a legacy serialized (base64) id.
+
+    Returns:
+        A `ContentItem` object, or None if the id does not reference a ContentItem.
+    """
+    if media_content_id is None:
+        return None
+    if media_content_id.startswith(CONTENT_ITEM_BASE64):
+        return deserialize_object(media_content_id[len(CONTENT_ITEM_BASE64):])
+    return CONTENT_ID_REGISTRY.ResolveContentItem(media_content_id)
+
+
+def build_page_id(media_content_id:str|None, offset:int) -> str|None:
+    """
+    Returns a media content id that references a page of a paged browse node.
+
+    Args:
+        media_content_id (str):
+            Media content id of the node that is paged.
+        offset (int):
+            The index of the first item on the page.
+    """
+    if offset <= 0:
+        return media_content_id
+    return "%s%s%d" % (media_content_id or "", SPOTIFY_BROWSE_PAGE_OFFSET, offset)
+
+
+def split_page_id(media_content_id:str|None) -> Tuple[str|None, int]:
+    """
+    Splits a media content id that was returned by `build_page_id` into the media
+    content id of the node that is paged and the page offset.
+
+    Returns:
+        A tuple of the media content id and page offset; the offset is zero if the
+        media content id does not reference a page.
+    """
+    if (media_content_id is None) or (SPOTIFY_BROWSE_PAGE_OFFSET not in media_content_id):
+        return media_content_id, 0
+    baseId, _, offset = media_content_id.rpartition(SPOTIFY_BROWSE_PAGE_OFFSET)
+    if not offset.isdigit():
+        return media_content_id, 0
+    return (baseId or None), int(offset)
+
+
 async def async_browse_media_library_index(hass:HomeAssistant,
                                            data:InstanceDataSoundTouchPlus,
                                            playerName:str,
@@ -418,6 +566,8 @@ async def async_browse_media_library_index(hass:HomeAssistant,
                                            libraryIndex:BrowsableMedia,
                                            media_content_type:str|None,
                                            media_content_id:str|None,
+                                           title:str|None=None,
+                                           hiddenMediaTypes:list[str]|None=None,
                                            ) -> BrowseMedia:
     """
     Builds a BrowseMedia object for the top level index page, and all of it's
@@ -442,6 +592,18 @@ async def async_browse_media_library_index(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        title (str):
+            Title to display for the index; if None, the library map title is used.
+        hiddenMediaTypes (list[str]):
+            Library map media types that should not be displayed in the index, in addition
+            to those that are not flagged as index items in the library map.
+
+    The index is built once per player, and served from memory after that.  It is only
+    rebuilt if the title or hidden media types change (e.g. the SpotifyPlus entity was 
+    renamed, or the SpotifyPlus integration was installed), or if the index was cleared 
+    by the media player (e.g. a new media source was loaded).  A shallow copy of the 
+    index is returned, so the caller can modify the children list without affecting
+    the index; the child nodes themselves are shared, and must not be modified.
     """
     methodParms:SIMethodParmListContext = None
         
@@ -451,79 +613,28 @@ async def async_browse_media_library_index(hass:HomeAssistant,
         methodParms = _logsi.EnterMethodParmList(SILevel.Debug)
         methodParms.AppendKeyValue("playerName", playerName)
         methodParms.AppendKeyValue("source", source)
-        methodParms.AppendKeyValue("libraryMap", libraryMap)
         methodParms.AppendKeyValue("libraryIndex", libraryIndex)
         methodParms.AppendKeyValue("media_content_type", media_content_type)
         methodParms.AppendKeyValue("media_content_id", media_content_id)
+        methodParms.AppendKeyValue("title", title)
+        methodParms.AppendKeyValue("hiddenMediaTypes", hiddenMediaTypes)
         _logsi.LogMethodParmList(SILevel.Verbose, "'%s': browsing for media - top level index: '%s'" % (playerName, libraryIndex), methodParms)
         
-        # validations.
-        if source is None:
-            source = "unknownSource"
-            
-        # get parent media atttributes based upon selected media content type.
-        parentAttrs:dict[str, Any] = libraryMap.get(libraryIndex.value, None)
-        _logsi.LogDictionary(SILevel.Verbose, "'%s': BrowseMedia attributes for parent media content type: '%s'" % (playerName, libraryIndex.value), parentAttrs)
-
-        # create the index.
-        browseMedia:BrowseMedia = BrowseMedia(
-            can_expand=True,
-            can_play=False,
-            children=[],
-            children_media_class=parentAttrs["children"],
-            media_class=parentAttrs["parent"],
-            media_content_id=libraryIndex.value,
-            media_content_type=libraryIndex.value,
-            thumbnail=parentAttrs["image"],
-            title=parentAttrs["title"],
-            )
-
-        # add child items to the index.
-        for mediaType, childAttrs in libraryMap.items():
+        # if the index was built for the same title and hidden media types then use it;
+        # otherwise, build (or rebuild) the index.
+        indexKey:tuple = (title, tuple(hiddenMediaTypes or []))
+        cacheEntry:tuple = data.library_index.get(libraryIndex.value, None)
+        if (cacheEntry is not None) and (cacheEntry[0] == indexKey):
+            _logsi.LogVerbose("'%s': BrowseMedia library index '%s' was served from memory" % (playerName, libraryIndex.value))
+            browseMedia:BrowseMedia = cacheEntry[1]
+        else:
+            browseMedia:BrowseMedia = await _async_BuildLibraryIndex(hass, playerName, libraryMap, libraryIndex, title, hiddenMediaTypes)
+            data.library_index[libraryIndex.value] = (indexKey, browseMedia)
 
-            # if not an index item then don't bother.
-            isIndexItem:bool = childAttrs.get("is_index_item", True)
-            if not isIndexItem:
-                continue
-            
-            # trace.
-            #_logsi.LogDictionary(SILevel.Verbose, "'%s': BrowseMedia attributes for child media content type: '%s'" % (playerName, mediaType), childAttrs)
-
-            # if a LOCAL index image was specified, then ensure it exists.
-            # otherwise, default to null.
-            image:str = childAttrs.get("image", None)
-            if image is not None and image.startswith(LOCAL_IMAGE_PREFIX):
-                imagePath:str = "%s/www/%s" % (hass.config.config_dir, image[len(LOCAL_IMAGE_PREFIX):])
-                if not os.path.exists(imagePath):
-                    #_logsi.LogVerbose("'%s': could not find logo image path '%s'; image will be reset to null" % (playerName, imagePath))
-                    image = None
-
-            browseMediaChild:BrowseMedia = BrowseMedia(
-                can_expand=True,
-                can_play=False,
-                children=None,
-                children_media_class=childAttrs["children"],
-                media_class=childAttrs["parent"],
-                media_content_id=f"{mediaType}",
-                media_content_type=f"{mediaType}",
-                thumbnail=image,
-                title=childAttrs["title"],
-                )
-            browseMedia.children.append(browseMediaChild)
-            _logsi.LogObject(SILevel.Verbose, "'%s': BrowseMedia Child Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMediaChild.media_content_type, browseMediaChild.media_content_id, browseMediaChild.title), browseMediaChild)
-
-        # add base media library items to the MAIN index.
-        if libraryIndex == BrowsableMedia.LIBRARY_INDEX:
-            media:BrowseMedia = await media_source.async_browse_media(hass, media_content_id)
-            mediaChild:BrowseMedia
-            for mediaChild in media.children:
-                _logsi.LogObject(SILevel.Verbose, "'%s': adding base media library child item: '%s'" % (playerName, mediaChild.title), mediaChild)
-                browseMedia.children.append(mediaChild)
-                
-        # trace.
-        _logsi.LogObject(SILevel.Verbose, "'%s': BrowseMedia Parent Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMedia.media_content_type, browseMedia.media_content_id, browseMedia.title), browseMedia)
-
-        return browseMedia
+        # return a shallow copy of the index to the caller.
+        result:BrowseMedia = copy.copy(browseMedia)
+        result.children = list(browseMedia.children)
+        return result
 
     except Exception as ex:
             
@@ -537,6 +648,159 @@ async def async_browse_media_library_index(hass:HomeAssistant,
         _logsi.LeaveMethod(SILevel.Debug)
 
 
+async def _async_BuildLibraryIndex(hass:HomeAssistant,
+                                   playerName:str,
+                                   libraryMap:dict,
+                                   libraryIndex:BrowsableMedia,
+                                   title:str|None,
+                                   hiddenMediaTypes:list[str]|None,
+                                   ) -> BrowseMedia:
+    """
+    Builds a BrowseMedia object for a top level index page, and all of it's child nodes.
+
+    Local index images are verified in an executor thread, as the file system is
+    accessed.  The library map is not modified.
+    """
+    _logsi.LogVerbose("'%s': BrowseMedia library index '%s' is being built" % (playerName, libraryIndex.value))
+
+    # get parent media atttributes based upon selected media content type.
+    parentAttrs:dict[str, Any] = libraryMap.get(libraryIndex.value, None)
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, "'%s': BrowseMedia attributes for parent media content type: '%s'" % (playerName, libraryIndex.value), parentAttrs)
+
+    # get child media attributes of the items to display in the index.
+    indexItems:list[tuple[str, dict[str, Any]]] = []
+    for mediaType, childAttrs in libraryMap.items():
+        if not childAttrs.get("is_index_item", True):
+            continue
+        if (hiddenMediaTypes is not None) and (mediaType in hiddenMediaTypes):
+            continue
+        indexItems.append((mediaType, childAttrs))
+
+    # if a LOCAL index image was specified, then ensure it exists.
+    # otherwise, default to null.
+    images:list[str] = [childAttrs.get("image", None) for _, childAttrs in indexItems]
+    images = await hass.async_add_executor_job(_GetExistingLocalImages, hass.config.config_dir, images)
+
+    # create the index.
+    browseMedia:BrowseMedia = BrowseMedia(
+        can_expand=True,
+        can_play=False,
+        children=[],
+        children_media_class=parentAttrs["children"],
+        media_class=parentAttrs["parent"],
+        media_content_id=libraryIndex.value,
+        media_content_type=libraryIndex.value,
+        thumbnail=parentAttrs["image"],
+        title=title or parentAttrs["title"],
+        )
+
+    # add child items to the index.
+    for (mediaType, childAttrs), image in zip(indexItems, images):
+
+        browseMediaChild:BrowseMedia = BrowseMedia(
+            can_expand=True,
+            can_play=False,
+            children=None,
+            children_media_class=childAttrs["children"],
+            media_class=childAttrs["parent"],
+            media_content_id=f"{mediaType}",
+            media_content_type=f"{mediaType}",
+            thumbnail=image,
+            title=childAttrs["title"],
+            )
+        browseMedia.children.append(browseMediaChild)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': BrowseMedia Child Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMediaChild.media_content_type, browseMediaChild.media_content_id, browseMediaChild.title), browseMediaChild)
+
+    # add base media library items to the MAIN index.
+    if libraryIndex == BrowsableMedia.LIBRARY_INDEX:
+        media:BrowseMedia = await media_source.async_browse_media(hass, None)
+        mediaChild:BrowseMedia
+        for mediaChild in media.children:
+            TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': adding base media library child item: '%s'" % (playerName, mediaChild.title), mediaChild)
+            browseMedia.children.append(mediaChild)
+            
+    # trace.
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': BrowseMedia Parent Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMedia.media_content_type, browseMedia.media_content_id, browseMedia.title), browseMedia)
+
+    return browseMedia
+
+
+def _GetExistingLocalImages(configDir:str, images:list[str|None]) -> list[str|None]:
+    """
+    Returns the list of images, with LOCAL images that do not exist replaced by None.
+
+    This method accesses the file system, so it should be called from an executor thread.
+    """
+    result:list[str|None] = []
+    for image in images:
+        if image is not None and image.startswith(LOCAL_IMAGE_PREFIX):
+            imagePath:str = "%s/www/%s" % (configDir, image[len(LOCAL_IMAGE_PREFIX):])
+            if not os.path.exists(imagePath):
+                image = None
+        result.append(image)
+    return result
+
+
+async def async_browse_media_node(hass:HomeAssistant,
+                                  data:InstanceDataSoundTouchPlus,
+                                  playerName:str,
+                                  source:str|None,
+                                  libraryMap:dict,
+                                  media_content_type:str|None,
+                                  media_content_id:str|None,
+                                  ) -> BrowseMedia:
+    """
+    Builds a BrowseMedia object for a selected media content type, and all of it's
+    child nodes.
+    
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+        data (InstanceDataSoundTouchPlus):
+            Component instance data that contains the SoundTouchClient instance.
+        playerName (str):
+            Name of the media player that is calling this method (for tracing purposes).
+        source (str):
+            Currently selected source value.
+        libraryMap (dict):
+            The library map that contains media content attributes for each library index entry.
+        media_content_type (str):
+            Selected media content type in the media browser.
+            This value will be None upon the initial entry to the media browser.
+        media_content_id (str):
+            Selected media content id in the media browser.
+            This value will be None upon the initial entry to the media browser.
+
+    Spotify content is retrieved via SpotifyPlus integration service calls, which are
+    awaited on the event loop so that no executor thread is held while waiting on the 
+    response.  SoundTouch content is retrieved via the SoundTouchClient, which is NOT 
+    async, so it is processed in an executor thread.
+    """
+    if is_spotify_media_content_type(media_content_type):
+        return await _async_browse_media_node_spotify(hass, data, playerName, libraryMap, media_content_type, media_content_id)
+
+    return await hass.async_add_executor_job(
+        browse_media_node,
+        hass,
+        data,
+        playerName,
+        source,
+        libraryMap,
+        media_content_type,
+        media_content_id,
+    )
+
+
+def is_spotify_media_content_type(media_content_type:str|None) -> bool:
+    """
+    Returns True if the media content type is retrieved via the SpotifyPlus integration;
+    otherwise, False.
+    """
+    if media_content_type is None:
+        return False
+    return media_content_type.startswith('spotify_') or media_content_type in SPOTIFY_MEDIA_TYPES
+
+
 def browse_media_node(hass:HomeAssistant,
                       data:InstanceDataSoundTouchPlus,
                       playerName:str,
@@ -546,8 +810,8 @@ def browse_media_node(hass:HomeAssistant,
                       media_content_id:str|None,
                       ) -> BrowseMedia:
     """
-    Builds a BrowseMedia object for a selected media content type, and all of it's
-    child nodes.
+    Builds a BrowseMedia object for a selected SoundTouch media content type, and all 
+    of it's child nodes.
     
     Args:
         hass (HomeAssistant):
@@ -566,6 +830,9 @@ def browse_media_node(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+
+    This method is NOT async, as the SoundTouchClient is not async; it should be
+    called from an executor thread.
     """
     methodParms:SIMethodParmListContext = None
         
@@ -583,18 +850,23 @@ def browse_media_node(hass:HomeAssistant,
         # validations.
         if source is None:
             source = "unknownSource"
+
+        # if the node is cached for the current device version then use it; no
+        # device i/o or child serialization is required until the device reports a change.
+        cacheVersion:int = _GetBrowseCacheVersion(data, media_content_type)
+        if cacheVersion is not None:
+            cacheEntry:tuple = data.browse_cache.get(media_content_type, None)
+            if (cacheEntry is not None) and (cacheEntry[0] == cacheVersion):
+                _logsi.LogVerbose("'%s': BrowseMedia node '%s' was served from cache (version %s)" % (playerName, media_content_type, str(cacheVersion)))
+                return cacheEntry[1]
             
         # initialize child item attributes.
-        title:str = None
-        image:str = None
         media:object = None
         items:list = []
         
         # build selection list based upon the browsable media type.
         # - media: will contain the result of the soundtouch api call.
         # - items: will contain the child items to display for the media item.
-        # - title: the title to display in the media browser.
-        # - image: the image (if any) to display in the media browser (can be none).
         if media_content_type == BrowsableMedia.SOUNDTOUCH_PRESETS:
             _logsi.LogVerbose("'%s': querying client device for SoundTouch presets" % playerName)
             media:PresetList = data.client.GetPresetList(refresh=True, resolveSourceTitles=True)
@@ -610,6 +882,14 @@ def browse_media_node(hass:HomeAssistant,
         #     media:PresetList = data.client.GetPresetList(refresh=True, resolveSourceTitles=True)
         #     items = media.Presets
 
+        elif media_content_type == BrowsableMedia.PLAY_HISTORY:
+            _logsi.LogVerbose("'%s': querying play history index for most played items" % playerName)
+            media:list[tuple] = PLAY_HISTORY_INDEX.GetMostPlayed(since=time.time() - (PLAY_HISTORY_BROWSE_DAYS * 86400), limit=PLAY_HISTORY_BROWSE_LIMIT)
+            items = [item for item, _ in media]
+
+        elif media_content_type in [BrowsableMedia.STORED_MUSIC, BrowsableMedia.STORED_MUSIC_CONTAINER]:
+            return _BrowseStoredMusic(hass, data, playerName, libraryMap, media_content_type, media_content_id)
+
         elif media_content_type == BrowsableMedia.PANDORA_STATIONS:
             _logsi.LogVerbose("'%s': querying client device for Pandora stations" % playerName)
             sourceItems:SourceList = data.client.GetSourceList(refresh=False)
@@ -617,231 +897,578 @@ def browse_media_node(hass:HomeAssistant,
             for sourceItem in sourceItems:
                 if sourceItem.Source == SoundTouchSources.PANDORA.value:
                     criteria:Navigate = Navigate(sourceItem.Source, sourceItem.SourceAccount)
-                    media:NavigateResponse = data.client.GetMusicServiceStations(criteria)
+                    media:NavigateResponse = data.navigate_cache.GetMusicServiceStations(data.client, criteria)
                     items = media.Items
                     break
             if media is None:
                 raise MediaSourceNotFoundError("'%s': could not find SoundTouch Source for '%s' content" % (playerName, media_content_type))
             
-        elif media_content_type == BrowsableMedia.SPOTIFY_USER_PLAYLISTS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetPlaylistFavorites(hass, data, playerName, media_content_type, media_content_id)
+        else:
+            raise ValueError("'%s': unrecognized media content type '%s' in browse media node" % (playerName, media_content_type))
+
+        # build the node.
+        browseMedia:BrowseMedia = _BuildBrowseMediaNode(hass, playerName, libraryMap, media_content_type, media_content_id, media, items)
+
+        # cache the node for the device version it was built for.
+        if cacheVersion is not None:
+            data.browse_cache[media_content_type] = (cacheVersion, browseMedia)
+
+        return browseMedia
+
+    except Exception as ex:
+            
+        # trace.
+        _logsi.LogException("'%s': BrowseMedia browse_media_node exception: %s" % (playerName, str(ex)), ex, logToSystemLogger=False)
+        raise HomeAssistantError(str(ex)) from ex
+        
+    finally:
+
+        # trace.
+        _logsi.LeaveMethod(SILevel.Debug)
+
+
+async def _async_browse_media_node_spotify(hass:HomeAssistant,
+                                           data:InstanceDataSoundTouchPlus,
+                                           playerName:str,
+                                           libraryMap:dict,
+                                           media_content_type:str|None,
+                                           media_content_id:str|None,
+                                           ) -> BrowseMedia:
+    """
+    Builds a BrowseMedia object for a selected Spotify media content type, and all 
+    of it's child nodes.
+    
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+        data (InstanceDataSoundTouchPlus):
+            Component instance data that contains the SoundTouchClient instance.
+        playerName (str):
+            Name of the media player that is calling this method (for tracing purposes).
+        libraryMap (dict):
+            The library map that contains media content attributes for each library index entry.
+        media_content_type (str):
+            Selected media content type in the media browser.
+        media_content_id (str):
+            Selected media content id in the media browser.
+
+    Paged media types (see `SPOTIFY_PAGED_MEDIA_TYPES`) only retrieve one page of items;
+    a "Next Page" child node is added that references the next page if more items are
+    available, so that the first page renders quickly and large libraries can still be
+    reached.
+    """
+    methodParms:SIMethodParmListContext = None
+        
+    try:
+
+        # trace.
+        methodParms = _logsi.EnterMethodParmList(SILevel.Debug)
+        methodParms.AppendKeyValue("playerName", playerName)
+        methodParms.AppendKeyValue("libraryMap", libraryMap)
+        methodParms.AppendKeyValue("media_content_type", media_content_type)
+        methodParms.AppendKeyValue("media_content_id", media_content_id)
+        _logsi.LogMethodParmList(SILevel.Verbose, "'%s': browsing for media - selected Spotify node: '%s'" % (playerName, media_content_type), methodParms)
+        
+        # split the page offset (if any) from the media content id.
+        media_content_id, offset = split_page_id(media_content_id)
+        pageBaseId:str = media_content_id
+
+        # initialize child item attributes.
+        title:str = None
+        image:str = None
+        media:object = None
+        items:list = []
+        
+        # build selection list based upon the browsable media type.
+        # - media: will contain the result of the spotifyplus service call.
+        # - items: will contain the child items to display for the media item.
+        # - title: the title to display in the media browser.
+        # - image: the image (if any) to display in the media browser (can be none).
+        _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
+
+        # resolve the soundtouch Spotify source item once for the request; it's reused
+        # by every service call helper that builds child ContentItems.
+        spotifySourceItem:SourceItem = await _async_FindSpotifySourceItem(hass, data)
+
+        if media_content_type == BrowsableMedia.SPOTIFY_USER_PLAYLISTS:
+            media, items = await _SpotifyPlusGetPlaylistFavorites(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_FOLLOWED_ARTISTS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetArtistsFollowed(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetArtistsFollowed(hass, data, playerName, media_content_type, media_content_id, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_SAVED_ALBUMS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetAlbumFavorites(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetAlbumFavorites(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_SAVED_TRACKS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetTrackFavorites(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetTrackFavorites(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_SAVED_SHOWS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetShowFavorites(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetShowFavorites(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_RECENTLY_PLAYED:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetPlayerRecentTracks(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetPlayerRecentTracks(hass, data, playerName, media_content_type, media_content_id, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_TOP_ARTISTS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetUsersTopArtists(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetUsersTopArtists(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_TOP_TRACKS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetUsersTopTracks(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetUsersTopTracks(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_FEATURED_PLAYLISTS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetFeaturedPlaylists(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetFeaturedPlaylists(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
 
         elif media_content_type == BrowsableMedia.SPOTIFY_NEW_RELEASES:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetAlbumNewReleases(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetAlbumNewReleases(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_CATEGORYS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetBrowseCategorysList(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetBrowseCategorysList(hass, data, playerName, media_content_type, media_content_id, spotifySourceItem=spotifySourceItem)
 
         elif media_content_type == BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
             
-            # was a base64 encoded category object supplied?  if not, then it's a problem! 
-            if not media_content_id.startswith(CATEGORY_BASE64):
-                raise ValueError("'%s': media content type '%s' is not a serialized Category object!" % (playerName, media_content_type))
-
-            # drop the eye-catcher and deserialize the category object.
-            category:Category = Category()
-            media_content_id = media_content_id[len(CATEGORY_BASE64):]
-            category = deserialize_object(media_content_id)
-            _logsi.LogObject(SILevel.Verbose, "'%s': deserialized %s" % (playerName, category.ToString()), category, excludeNonPublic=True)
+            # was a category id supplied?  if not, then it's a problem! 
+            category:Category = resolve_category_id(media_content_id)
+            if category is None:
+                raise ValueError("'%s': media content type '%s' is not a Category object id!" % (playerName, media_content_type))
+            TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': resolved %s" % (playerName, category.ToString()), category, excludeNonPublic=True)
             media_content_id = category.Uri   # Spotify URI that contains the category id.
 
             # get the playlists for the category id.
-            media, items = _SpotifyPlusGetCategoryPlaylists(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetCategoryPlaylists(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
             title = category.Name
             image = category.ImageUrl
                                        
         elif media_content_type == BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS_MADEFORYOU:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
             media_content_id = 'spotify:category:0JQ5DAt0tbjZptfcdMSKl3'   # special hidden category "Made For You"
-            media, items = _SpotifyPlusGetCategoryPlaylists(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetCategoryPlaylists(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem)
 
         elif media_content_type == MediaType.ALBUM:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetAlbum(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetAlbum(hass, data, playerName, media_content_type, media_content_id, spotifySourceItem=spotifySourceItem)
             title = media.Name
             image = media.ImageUrl
             
         elif media_content_type == MediaType.ARTIST:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            artist:Artist = _SpotifyPlusGetArtist(hass, data, playerName, media_content_type, media_content_id)  # for cover image
-            media, items = _SpotifyPlusGetArtistAlbums(hass, data, playerName, media_content_type, media_content_id)
+            # the artist (for cover image) and artist albums are independent, so get them concurrently.
+            artist:Artist
+            artist, (media, items) = await asyncio.gather(
+                _SpotifyPlusGetArtist(hass, data, playerName, media_content_type, media_content_id),
+                _SpotifyPlusGetArtistAlbums(hass, data, playerName, media_content_type, media_content_id, offset, spotifySourceItem=spotifySourceItem),
+            )
             title = artist.Name
             image = artist.ImageUrl
             
         elif media_content_type == MediaType.PLAYLIST:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetPlaylist(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetPlaylist(hass, data, playerName, media_content_type, media_content_id, spotifySourceItem=spotifySourceItem)
             title = media.Name
             image = media.ImageUrl
             
         elif media_content_type == MediaType.PODCAST or media_content_type == MEDIA_TYPE_SHOW:
-            _logsi.LogVerbose(STAppMessages.MSG_SPOTIFYPLUS_SERVICE_EXECUTE % (playerName, DOMAIN_SPOTIFYPLUS, media_content_type))
-            media, items = _SpotifyPlusGetShow(hass, data, playerName, media_content_type, media_content_id)
+            media, items = await _SpotifyPlusGetShow(hass, data, playerName, media_content_type, media_content_id, spotifySourceItem=spotifySourceItem)
             title = media.Name
             image = media.ImageUrl
             
         else:
             raise ValueError("'%s': unrecognized media content type '%s' in browse media node" % (playerName, media_content_type))
 
-        # if media was not set then we are done.
-        if media is None:
-            raise ValueError("'%s': could not find media items for content type '%s'" % (playerName, media_content_type))
+        # build the node.
+        browseMedia:BrowseMedia = _BuildBrowseMediaNode(hass, playerName, libraryMap, media_content_type, media_content_id, media, items, title, image)
+
+        # add paging details for paged media types.
+        if (media_content_type in SPOTIFY_PAGED_MEDIA_TYPES) and (isinstance(media, PageObject)):
+            _AddBrowseMediaNodePaging(playerName, browseMedia, pageBaseId, offset, media.ItemsCount, media.Total, SPOTIFY_BROWSE_LIMIT)
+
+        return browseMedia
 
-        # set index flag indicating if index media can be played or not.
-        canPlay:bool = media_content_type in PLAYABLE_MEDIA_TYPES
+    except Exception as ex:
+            
+        # trace.
+        _logsi.LogException("'%s': BrowseMedia browse_media_node exception: %s" % (playerName, str(ex)), ex, logToSystemLogger=False)
+        raise HomeAssistantError(str(ex)) from ex
         
+    finally:
+
+        # trace.
+        _logsi.LeaveMethod(SILevel.Debug)
+
+
+def _BuildBrowseMediaNode(hass:HomeAssistant,
+                          playerName:str,
+                          libraryMap:dict,
+                          media_content_type:str|None,
+                          media_content_id:str|None,
+                          media:object,
+                          items:list,
+                          title:str=None,
+                          image:str=None,
+                          ) -> BrowseMedia:
+    """
+    Builds a BrowseMedia object for a selected media content type from the media
+    and child items that were retrieved for it.
+
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+        playerName (str):
+            Name of the media player that is calling this method (for tracing purposes).
+        libraryMap (dict):
+            The library map that contains media content attributes for each library index entry.
+        media_content_type (str):
+            Selected media content type in the media browser.
+        media_content_id (str):
+            Selected media content id in the media browser.
+        media (object):
+            The result of the soundtouch api / spotifyplus service call.
+        items (list):
+            The child items to display for the media item.
+        title (str):
+            The title to display in the media browser; if None, the library map title is used.
+        image (str):
+            The image (if any) to display in the media browser (can be none).
+    """
+    # if media was not set then we are done.
+    if media is None:
+        raise ValueError("'%s': could not find media items for content type '%s'" % (playerName, media_content_type))
+
+    # set index flag indicating if index media can be played or not.
+    canPlay:bool = media_content_type in PLAYABLE_MEDIA_TYPES
+    
+    # track and episode media items cannot be expanded (only played);
+    # other media types can be expanded to display child items (e.g. Album, Artist, Playlist, etc).
+    canExpand = media_content_type not in [
+        MediaType.TRACK,
+        MediaType.EPISODE,
+    ]
+    
+    # if a LOCAL index image was specified, then ensure it exists.
+    # otherwise, default to null.
+    if image is not None and image.startswith(LOCAL_IMAGE_PREFIX):
+        imagePath:str = "%s/www/%s" % (hass.config.config_dir, image[len(LOCAL_IMAGE_PREFIX):])
+        if not os.path.exists(imagePath):
+            #_logsi.LogVerbose("'%s': could not find logo image path '%s'; image will be reset to null" % (playerName, imagePath))
+            image = None
+
+    # get parent media atttributes based upon selected media content type.
+    parentAttrs:dict[str, Any] = libraryMap.get(media_content_type, None)
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, "'%s': BrowseMedia attributes for parent media content type: '%s'" % (playerName, media_content_type), parentAttrs)
+    
+    # get parent attributes that are not set.
+    if title is None:
+        title = parentAttrs.get("title_node", media_content_id)
+
+    # create the index.
+    browseMedia:BrowseMedia = BrowseMedia(
+        can_expand=canExpand,
+        can_play=canPlay,
+        children=[],
+        children_media_class=parentAttrs["children"],
+        media_class=parentAttrs["parent"],
+        media_content_id=media_content_id,
+        media_content_type=media_content_type,
+        thumbnail=image,
+        title=title,
+        )
+
+    # measure child media content id payload size against the legacy (pickled base64)
+    # encoding if tracing is enabled, as the legacy encoding is costly to produce.
+    isMeasurePayload:bool = _logsi.IsOn(SILevel.Verbose)
+    payloadBytes:int = 0
+    payloadBytesLegacy:int = 0
+
+    # add child items to the index.
+    for item in items:
+
+        # resolve media content type.
+        mediaType:str = parentAttrs["children"]
+
+        # get child media atttributes based upon child item media content type.
+        childAttrs:dict[str, Any] = libraryMap.get(mediaType, None)
+        #_logsi.LogDictionary(SILevel.Verbose, "'%s': BrowseMedia attributes for child media content type: '%s'" % (playerName, mediaType), childAttrs)
+
+        # set child flag indicating if media can be played or not.
+        canPlay:bool = mediaType in PLAYABLE_MEDIA_TYPES
+    
         # track and episode media items cannot be expanded (only played);
         # other media types can be expanded to display child items (e.g. Album, Artist, Playlist, etc).
-        canExpand = media_content_type not in [
+        canExpand = mediaType not in [
             MediaType.TRACK,
             MediaType.EPISODE,
         ]
-        
-        # if a LOCAL index image was specified, then ensure it exists.
-        # otherwise, default to null.
-        if image is not None and image.startswith(LOCAL_IMAGE_PREFIX):
-            imagePath:str = "%s/www/%s" % (hass.config.config_dir, image[len(LOCAL_IMAGE_PREFIX):])
-            if not os.path.exists(imagePath):
-                #_logsi.LogVerbose("'%s': could not find logo image path '%s'; image will be reset to null" % (playerName, imagePath))
-                image = None
 
-        # get parent media atttributes based upon selected media content type.
-        parentAttrs:dict[str, Any] = libraryMap.get(media_content_type, None)
-        _logsi.LogDictionary(SILevel.Verbose, "'%s': BrowseMedia attributes for parent media content type: '%s'" % (playerName, media_content_type), parentAttrs)
-        
-        # get parent attributes that are not set.
-        if title is None:
-            title = parentAttrs.get("title_node", media_content_id)
+        # resolve media content id and image to use.
+        # Default the value to the media type.
+        image:str = None
+        mediaId:str = mediaType
+        if canPlay:
+            
+            # if it is playable then register the ContentItem and use it's id instead - we pass the
+            # ContentItem to the play_media function so the SoundTouch knows how to play the content.
+            mediaId = CONTENT_ID_REGISTRY.RegisterContentItem(item.ContentItem)
+            image = item.ContentItem.ContainerArt
+            if isMeasurePayload:
+                payloadBytesLegacy += len(CONTENT_ITEM_BASE64) + len(serialize_object(item.ContentItem))
+            
+        elif mediaType == MediaType.GENRE:
+            
+            # if it's GENRE content, then register the Category object and use it's id instead so that
+            # we don't have to go get it again - we will resolve it when the child node is
+            # selected, and use it to resolve the category Id, Name, and imageUrl values.
+            mediaId = CONTENT_ID_REGISTRY.RegisterCategory(item)
+            mediaType = BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS.value
+            image = item.ImageUrl  # category image.
+            if isMeasurePayload:
+                payloadBytesLegacy += len(CATEGORY_BASE64) + len(serialize_object(item))
+            
+        else:
+            
+            image = item.ContentItem.ContainerArt
+            if isMeasurePayload:
+                payloadBytesLegacy += len(mediaId)
 
-        # create the index.
-        browseMedia:BrowseMedia = BrowseMedia(
+        payloadBytes += len(mediaId)
+        
+        # build the chile node.
+        browseMediaChild:BrowseMedia = BrowseMedia(
             can_expand=canExpand,
             can_play=canPlay,
-            children=[],
-            children_media_class=parentAttrs["children"],
-            media_class=parentAttrs["parent"],
-            media_content_id=media_content_id,
-            media_content_type=media_content_type,
+            children=None,
+            children_media_class=childAttrs["children"],
+            media_class=childAttrs["parent"],
+            media_content_id=mediaId,
+            media_content_type=mediaType,
             thumbnail=image,
-            title=title,
+            title=item.Name,
             )
+        browseMedia.children.append(browseMediaChild)
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': BrowseMedia Child Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMediaChild.media_content_type, browseMediaChild.media_content_id, browseMediaChild.title), browseMediaChild)
+
+    # trace.
+    if isMeasurePayload:
+        CONTENT_ID_REGISTRY.RecordPayloadBytesSaved(payloadBytesLegacy - payloadBytes)
+        _logsi.LogVerbose("'%s': BrowseMedia child content id payload for '%s' is %d bytes (%d children); legacy encoding would be %d bytes (%d bytes saved, %d total saved)" % (playerName, media_content_type, payloadBytes, len(browseMedia.children), payloadBytesLegacy, payloadBytesLegacy - payloadBytes, CONTENT_ID_REGISTRY.PayloadBytesSaved))
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': BrowseMedia Parent Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMedia.media_content_type, browseMedia.media_content_id, browseMedia.title), browseMedia)
+
+    return browseMedia
+
+
+def _AddBrowseMediaNodePaging(playerName:str,
+                              browseMedia:BrowseMedia,
+                              pageBaseId:str|None,
+                              offset:int,
+                              itemsCount:int,
+                              total:int,
+                              pageSize:int,
+                              ) -> None:
+    """
+    Adds paging details to a BrowseMedia object that was built from a page of items.
 
-        # add child items to the index.
-        for item in items:
+    Args:
+        playerName (str):
+            Name of the media player that is calling this method (for tracing purposes).
+        browseMedia (BrowseMedia):
+            The BrowseMedia object that was built from the page of items.
+        pageBaseId (str):
+            Media content id of the node that is paged (without page offset).
+        offset (int):
+            The index of the first item on the page.
+        itemsCount (int):
+            The number of items on the page.
+        total (int):
+            The total number of items available.
+        pageSize (int):
+            The maximum number of items on a page.
+
+    If the page is not the first page, then the node title is suffixed with the range of
+    items displayed.  If more items are available, then a "Next Page" child node is added 
+    that references the next page of items.
+    """
+    total = total or 0
+    nextOffset:int = offset + itemsCount
+
+    # if not the first page, then the node references the page; it cannot be played, as
+    # it's media content id is not a content item id.
+    if offset > 0:
+        browseMedia.can_play = False
+        browseMedia.media_content_id = build_page_id(pageBaseId, offset)
+        browseMedia.title = "%s (%d - %d of %d)" % (browseMedia.title, offset + 1, nextOffset, total)
+
+    # if more items are available, then add a node for the next page.
+    if (itemsCount > 0) and (nextOffset < total):
+        browseMediaChild:BrowseMedia = BrowseMedia(
+            can_expand=True,
+            can_play=False,
+            children=None,
+            children_media_class=browseMedia.children_media_class,
+            media_class=MediaClass.DIRECTORY,
+            media_content_id=build_page_id(pageBaseId, nextOffset),
+            media_content_type=browseMedia.media_content_type,
+            thumbnail=None,
+            title="Next Page (%d - %d of %d)" % (nextOffset + 1, min(nextOffset + pageSize, total), total),
+            )
+        browseMedia.children.append(browseMediaChild)
+        _logsi.LogVerbose("'%s': BrowseMedia node '%s' has more items; next page offset is %d of %d" % (playerName, browseMedia.media_content_type, nextOffset, total))
 
-            # resolve media content type.
-            mediaType:str = parentAttrs["children"]
 
-            # get child media atttributes based upon child item media content type.
-            childAttrs:dict[str, Any] = libraryMap.get(mediaType, None)
-            #_logsi.LogDictionary(SILevel.Verbose, "'%s': BrowseMedia attributes for child media content type: '%s'" % (playerName, mediaType), childAttrs)
+def _BrowseStoredMusic(hass:HomeAssistant,
+                       data:InstanceDataSoundTouchPlus,
+                       playerName:str,
+                       libraryMap:dict,
+                       media_content_type:str,
+                       media_content_id:str|None,
+                       ) -> BrowseMedia:
+    """
+    Builds a BrowseMedia object for a STORED_MUSIC (e.g. DLNA / NAS) music library node.
 
-            # set child flag indicating if media can be played or not.
-            canPlay:bool = mediaType in PLAYABLE_MEDIA_TYPES
-        
-            # track and episode media items cannot be expanded (only played);
-            # other media types can be expanded to display child items (e.g. Album, Artist, Playlist, etc).
-            canExpand = mediaType not in [
-                MediaType.TRACK,
-                MediaType.EPISODE,
-            ]
-
-            # resolve media content id and image to use.
-            # Default the value to the media type.
-            image:str = None
-            mediaId:str = mediaType
-            if canPlay:
-                
-                # if it is playable then serialize the ContentItem and use it instead - we pass the
-                # ContentItem to the play_media function so the SoundTouch knows how to play the content.
-                mediaId = "%s%s" % (CONTENT_ITEM_BASE64, serialize_object(item.ContentItem))
-                image = item.ContentItem.ContainerArt
-                
-            elif mediaType == MediaType.GENRE:
-                
-                # if it's GENRE content, then serialize the Category object and use it instead so that
-                # we don't have to go get it again - we will deserialize it when the child node is
-                # selected, and use it to resolve the category Id, Name, and imageUrl values.
-                mediaId = "%s%s" % (CATEGORY_BASE64, serialize_object(item))
-                mediaType = BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS.value
-                image = item.ImageUrl  # category image.
-                
-            else:
-                
-                image = item.ContentItem.ContainerArt
-            
-            # build the chile node.
-            browseMediaChild:BrowseMedia = BrowseMedia(
-                can_expand=canExpand,
-                can_play=canPlay,
-                children=None,
-                children_media_class=childAttrs["children"],
-                media_class=childAttrs["parent"],
-                media_content_id=mediaId,
-                media_content_type=mediaType,
-                thumbnail=image,
-                title=item.Name,
-                )
-            browseMedia.children.append(browseMediaChild)
-            _logsi.LogObject(SILevel.Verbose, "'%s': BrowseMedia Child Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMediaChild.media_content_type, browseMediaChild.media_content_id, browseMediaChild.title), browseMediaChild)
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+        data (InstanceDataSoundTouchPlus):
+            Component instance data that contains the SoundTouchClient instance.
+        playerName (str):
+            Name of the media player that is calling this method (for tracing purposes).
+        libraryMap (dict):
+            The library map that contains media content attributes for each library index entry.
+        media_content_type (str):
+            Selected media content type in the media browser; either `STORED_MUSIC` (lists 
+            the music library accounts) or `STORED_MUSIC_CONTAINER` (lists a container).
+        media_content_id (str):
+            Selected media content id in the media browser.  For containers, this is the
+            registered ContentItem id of the container, optionally followed by a page offset.
 
-        # trace.
-        _logsi.LogObject(SILevel.Verbose, "'%s': BrowseMedia Parent Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMedia.media_content_type, browseMedia.media_content_id, browseMedia.title), browseMedia)
+    Music library containers can hold thousands of items, so they are navigated one page
+    (`STORED_MUSIC_PAGE_SIZE` items) at a time; each page is cached in the device navigate
+    cache, and a "Next Page" child node is added if more items are available.
 
+    This method is NOT async, as the SoundTouchClient is not async; it should be
+    called from an executor thread.
+    """
+    parentAttrs:dict[str, Any] = libraryMap.get(media_content_type, None)
+
+    # the library node lists the STORED_MUSIC accounts (e.g. media servers) of the device.
+    if media_content_type == BrowsableMedia.STORED_MUSIC:
+
+        _logsi.LogVerbose("'%s': querying client device for SoundTouch music library accounts" % playerName)
+        browseMedia:BrowseMedia = BrowseMedia(
+            can_expand=True,
+            can_play=False,
+            children=[],
+            children_media_class=parentAttrs["children"],
+            media_class=parentAttrs["parent"],
+            media_content_id=media_content_id,
+            media_content_type=media_content_type,
+            thumbnail=None,
+            title=parentAttrs.get("title_node", media_content_id),
+            )
+        sourceItems:SourceList = data.client.GetSourceList(refresh=False)
+        sourceItem:SourceItem
+        for sourceItem in sourceItems:
+            if sourceItem.Source == SoundTouchSources.STORED_MUSIC.value:
+                title:str = sourceItem.FriendlyName or sourceItem.SourceAccount
+                contentItem:ContentItem = ContentItem(sourceItem.Source, "dir", None, sourceItem.SourceAccount, False, name=title)
+                browseMedia.children.append(BrowseMedia(
+                    can_expand=True,
+                    can_play=False,
+                    children=None,
+                    children_media_class=MediaClass.TRACK,
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_id=CONTENT_ID_REGISTRY.RegisterContentItem(contentItem),
+                    media_content_type=BrowsableMedia.STORED_MUSIC_CONTAINER.value,
+                    thumbnail=None,
+                    title=title,
+                    ))
+        if len(browseMedia.children) == 0:
+            raise MediaSourceNotFoundError("'%s': could not find SoundTouch Source for '%s' content" % (playerName, media_content_type))
         return browseMedia
 
-    except Exception as ex:
-            
-        # trace.
-        _logsi.LogException("'%s': BrowseMedia browse_media_node exception: %s" % (playerName, str(ex)), ex, logToSystemLogger=False)
-        raise HomeAssistantError(str(ex)) from ex
-        
-    finally:
+    # resolve the container to navigate, and the page to display.
+    pageBaseId, offset = split_page_id(media_content_id)
+    container:ContentItem = resolve_content_item_id(pageBaseId)
+    if container is None:
+        raise ValueError("'%s': could not resolve music library container '%s'" % (playerName, media_content_id))
+    containerItem:NavigateItem = None
+    if container.Location is not None:
+        containerItem = NavigateItem(container.Source, container.SourceAccount, container.Name, container.TypeValue, contentItem=container)
+
+    # get the page of container items; the device numbers items starting at 1.
+    _logsi.LogVerbose("'%s': querying client device for SoundTouch music library container '%s' items (offset %d)" % (playerName, container.Name, offset))
+    criteria:Navigate = Navigate(container.Source, container.SourceAccount, containerItem, offset + 1, STORED_MUSIC_PAGE_SIZE)
+    media:NavigateResponse = data.navigate_cache.GetMusicLibraryItems(data.client, criteria)
+
+    browseMedia:BrowseMedia = BrowseMedia(
+        can_expand=True,
+        can_play=(container.Location is not None),
+        children=[],
+        children_media_class=parentAttrs["children"],
+        media_class=parentAttrs["parent"],
+        media_content_id=pageBaseId,
+        media_content_type=media_content_type,
+        thumbnail=container.ContainerArt,
+        title=container.Name,
+        )
+
+    # add child items to the node; containers can be expanded (and played), while all 
+    # other items (e.g. tracks) can only be played.
+    item:NavigateItem
+    for item in media.Items:
+        if item.ContentItem is None:
+            continue
+        isContainer:bool = (item.TypeValue == "dir")
+        browseMedia.children.append(BrowseMedia(
+            can_expand=isContainer,
+            can_play=True,
+            children=None,
+            children_media_class=MediaClass.TRACK if isContainer else None,
+            media_class=MediaClass.DIRECTORY if isContainer else MediaClass.TRACK,
+            media_content_id=CONTENT_ID_REGISTRY.RegisterContentItem(item.ContentItem),
+            media_content_type=BrowsableMedia.STORED_MUSIC_CONTAINER.value if isContainer else MediaType.TRACK,
+            thumbnail=item.ContentItem.ContainerArt,
+            title=item.Name or item.ContentItem.Name,
+            ))
+
+    # add paging details.
+    _AddBrowseMediaNodePaging(playerName, browseMedia, pageBaseId, offset, len(media.Items), media.TotalItems, STORED_MUSIC_PAGE_SIZE)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': BrowseMedia Parent Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMedia.media_content_type, browseMedia.media_content_id, browseMedia.title), browseMedia)
+
+    return browseMedia
+
+
+def _GetBrowseCacheVersion(data:InstanceDataSoundTouchPlus,
+                           media_content_type:str|None,
+                           ) -> int | None:
+    """
+    Returns the device version value that a cached browse node is keyed by, or None
+    if the media content type cannot be cached.
+
+    Presets and recently played nodes are versioned by the presets / recents last
+    updated values that are maintained by the media player websocket event handlers.
+    If websocket notifications are disabled (or the media player has fallen back to
+    polling due to a websocket error) then there are no events to invalidate the cache, 
+    so nothing is cached.
+    """
+    if (data.socket is None) or (data.media_player is None) or (data.media_player.should_poll):
+        return None
+    if media_content_type == BrowsableMedia.SOUNDTOUCH_PRESETS:
+        return data.media_player.soundtouchplus_presets_lastupdated
+    if media_content_type == BrowsableMedia.SOUNDTOUCH_RECENTLY_PLAYED:
+        return data.media_player.soundtouchplus_recents_lastupdated
+    return None
 
-        # trace.
-        _logsi.LeaveMethod(SILevel.Debug)
 
+async def _async_FindSpotifySourceItem(hass:HomeAssistant,
+                                       data:InstanceDataSoundTouchPlus,
+                                       ) -> SourceItem:
+    """
+    Returns the Spotify sourceitem from the SoundTouch device source list.
 
-def _GetSpotifySourceItem(playerName:str, 
-                          data:InstanceDataSoundTouchPlus,
-                          userProfile:UserProfile
-                          ) -> SourceItem:
+    This is resolved once per browse request, and passed to each of the spotifyPlus
+    service call helpers so that the source list is not rescanned for every call.  The
+    source list is normally cached; if it's not, then the device is queried in an 
+    executor thread so that the event loop is not blocked.
+    """
+    if SoundTouchNodes.sources.Path in data.client.ConfigurationCache:
+        return _FindSpotifySourceItem(data)
+    return await hass.async_add_executor_job(_FindSpotifySourceItem, data)
+
+
+def _FindSpotifySourceItem(data:InstanceDataSoundTouchPlus) -> SourceItem:
     """
     Returns the Spotify sourceitem from the SoundTouch device source list.
     """
@@ -856,6 +1483,25 @@ def _GetSpotifySourceItem(playerName:str,
             if sourceItem.SourceAccount != "SpotifyConnectUserName" and sourceItem.SourceAccount != "SpotifyAlexaUserName":
                 break
             
+    # return source item to caller.
+    return sourceItem
+
+
+def _GetSpotifySourceItem(playerName:str, 
+                          data:InstanceDataSoundTouchPlus,
+                          userProfile:UserProfile,
+                          spotifySourceItem:SourceItem=None,
+                          ) -> SourceItem:
+    """
+    Returns the Spotify sourceitem from the SoundTouch device source list.
+
+    If a Spotify sourceitem was already resolved for the browse request, then it is
+    used instead of scanning the source list again.
+    """
+    sourceItem:SourceItem = spotifySourceItem
+    if sourceItem is None:
+        sourceItem = _FindSpotifySourceItem(data)
+            
     # log a warning message if there is a mismatch between the soundtouch source userid
     # and the spotifyPlus integration userid that obtained the results.
     if sourceItem.SourceAccount != userProfile.Id:
@@ -865,11 +1511,12 @@ def _GetSpotifySourceItem(playerName:str,
     return sourceItem
 
 
-def _SpotifyPlusGetAlbum(hass:HomeAssistant,
+async def _SpotifyPlusGetAlbum(hass:HomeAssistant,
                          data:InstanceDataSoundTouchPlus,
                          playerName:str,
                          media_content_type:str|None,
                          media_content_id:str|None,
+                         spotifySourceItem:SourceItem=None,
                          ) -> Tuple[Album, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_album", and returns the media and items results.
@@ -887,6 +1534,9 @@ def _SpotifyPlusGetAlbum(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -894,50 +1544,45 @@ def _SpotifyPlusGetAlbum(hass:HomeAssistant,
         - list[NavigateItem] list of items that will be loaded to child nodes.   
     """
     
-    # was a content item in base64 encoded format supplied?  
-    # this can happen for meia content that could be played as well as expanded (e..g playlist, album, etc).
-    if media_content_id.startswith(CONTENT_ITEM_BASE64):
-
-        # drop the eye-ctacher prefix before we deserialize.
-        media_content_id = media_content_id[len(CONTENT_ITEM_BASE64):]
-        contentItem:ContentItem = deserialize_object(media_content_id)
-        _logsi.LogObject(SILevel.Verbose, "'%s': ContentItem is deserialized %s" % (playerName, contentItem.ToString()), contentItem)
+    # was a content item id supplied?  
+    # this can happen for media content that could be played as well as expanded (e.g. playlist, album, etc).
+    contentItem:ContentItem = resolve_content_item_id(media_content_id)
+    if contentItem is not None:
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': ContentItem is resolved %s" % (playerName, contentItem.ToString()), contentItem)
         media_content_id = contentItem.Location   # Spotify URI
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_album',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "album_id": SpotifyClient.GetIdFromUri(media_content_id),
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_album',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "album_id": SpotifyClient.GetIdFromUri(media_content_id),
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:Album = Album(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Track] = media.Tracks.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -951,11 +1596,13 @@ def _SpotifyPlusGetAlbum(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetAlbumFavorites(hass:HomeAssistant,
+async def _SpotifyPlusGetAlbumFavorites(hass:HomeAssistant,
                                   data:InstanceDataSoundTouchPlus,
                                   playerName:str,
                                   media_content_type:str|None,
                                   media_content_id:str|None,
+                                  offset:int=0,
+                                  spotifySourceItem:SourceItem=None,
                                   ) -> Tuple[PlaylistPageSimplified, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_album_favorites", and returns the media and items results.
@@ -973,6 +1620,12 @@ def _SpotifyPlusGetAlbumFavorites(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -981,39 +1634,37 @@ def _SpotifyPlusGetAlbumFavorites(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_album_favorites',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit": SPOTIFY_BROWSE_LIMIT,
-                "offset": 0
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_album_favorites',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:AlbumPageSaved = AlbumPageSaved(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Album] = media.GetAlbums()
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1027,11 +1678,13 @@ def _SpotifyPlusGetAlbumFavorites(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetAlbumNewReleases(hass:HomeAssistant,
+async def _SpotifyPlusGetAlbumNewReleases(hass:HomeAssistant,
                                     data:InstanceDataSoundTouchPlus,
                                     playerName:str,
                                     media_content_type:str|None,
                                     media_content_id:str|None,
+                                    offset:int=0,
+                                    spotifySourceItem:SourceItem=None,
                                     ) -> Tuple[AlbumPageSimplified, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_album_new_releases", and returns the media and items results.
@@ -1049,6 +1702,12 @@ def _SpotifyPlusGetAlbumNewReleases(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -1057,40 +1716,37 @@ def _SpotifyPlusGetAlbumNewReleases(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_album_new_releases',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit": SPOTIFY_BROWSE_LIMIT,
-                "offset": 0,
-                "limit_total": SPOTIFY_BROWSE_LIMIT_TOTAL,
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_album_new_releases',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:AlbumPageSimplified = AlbumPageSimplified(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[AlbumSimplified] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1104,7 +1760,7 @@ def _SpotifyPlusGetAlbumNewReleases(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetArtist(hass:HomeAssistant,
+async def _SpotifyPlusGetArtist(hass:HomeAssistant,
                           data:InstanceDataSoundTouchPlus,
                           playerName:str,
                           media_content_type:str|None,
@@ -1131,53 +1787,50 @@ def _SpotifyPlusGetArtist(hass:HomeAssistant,
         An `Artist` object that contains artist information.  
     """
     
-    # was a content item in base64 encoded format supplied?  
-    # this can happen for meia content that could be played as well as expanded (e..g playlist, album, etc).
-    if media_content_id.startswith(CONTENT_ITEM_BASE64):
-
-        # drop the eye-ctacher prefix before we deserialize.
-        media_content_id = media_content_id[len(CONTENT_ITEM_BASE64):]
-        contentItem:ContentItem = deserialize_object(media_content_id)
-        _logsi.LogObject(SILevel.Verbose, "'%s': ContentItem is deserialized %s" % (playerName, contentItem.ToString()), contentItem)
+    # was a content item id supplied?  
+    # this can happen for media content that could be played as well as expanded (e.g. playlist, album, etc).
+    contentItem:ContentItem = resolve_content_item_id(media_content_id)
+    if contentItem is not None:
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': ContentItem is resolved %s" % (playerName, contentItem.ToString()), contentItem)
         media_content_id = contentItem.Location   # Spotify URI
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_artist',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "artist_id": SpotifyClient.GetIdFromUri(media_content_id),
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_artist',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "artist_id": SpotifyClient.GetIdFromUri(media_content_id),
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:Artist = Artist(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, media)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, media)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     return media
 
 
-def _SpotifyPlusGetArtistAlbums(hass:HomeAssistant,
+async def _SpotifyPlusGetArtistAlbums(hass:HomeAssistant,
                                 data:InstanceDataSoundTouchPlus,
                                 playerName:str,
                                 media_content_type:str|None,
                                 media_content_id:str|None,
+                                offset:int=0,
+                                spotifySourceItem:SourceItem=None,
                                 ) -> Tuple[ArtistPage, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_artist_albums", and returns the media and items results.
@@ -1195,58 +1848,60 @@ def _SpotifyPlusGetArtistAlbums(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
         - `ArtistPage` object that contains artists followed information.  
         - list[NavigateItem] list of items that will be loaded to child nodes.   
     """
-    # was a content item in base64 encoded format supplied?  
-    # this can happen for meia content that could be played as well as expanded (e..g playlist, album, etc).
-    if media_content_id.startswith(CONTENT_ITEM_BASE64):
-
-        # drop the eye-ctacher prefix before we deserialize.
-        media_content_id = media_content_id[len(CONTENT_ITEM_BASE64):]
-        contentItem:ContentItem = deserialize_object(media_content_id)
-        _logsi.LogObject(SILevel.Verbose, "'%s': ContentItem is deserialized %s" % (playerName, contentItem.ToString()), contentItem)
+    # was a content item id supplied?  
+    # this can happen for media content that could be played as well as expanded (e.g. playlist, album, etc).
+    contentItem:ContentItem = resolve_content_item_id(media_content_id)
+    if contentItem is not None:
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': ContentItem is resolved %s" % (playerName, contentItem.ToString()), contentItem)
         media_content_id = contentItem.Location   # Spotify URI
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_artist_albums',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "artist_id": SpotifyClient.GetIdFromUri(media_content_id),
-                "include_groups": "album",
-                "limit": SPOTIFY_BROWSE_LIMIT
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_artist_albums',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "artist_id": SpotifyClient.GetIdFromUri(media_content_id),
+            "include_groups": "album",
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:ArtistPage = ArtistPage(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Artist] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1260,11 +1915,12 @@ def _SpotifyPlusGetArtistAlbums(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetArtistsFollowed(hass:HomeAssistant,
+async def _SpotifyPlusGetArtistsFollowed(hass:HomeAssistant,
                                    data:InstanceDataSoundTouchPlus,
                                    playerName:str,
                                    media_content_type:str|None,
                                    media_content_id:str|None,
+                                   spotifySourceItem:SourceItem=None,
                                    ) -> Tuple[ArtistPage, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_artists_followed", and returns the media and items results.
@@ -1282,6 +1938,9 @@ def _SpotifyPlusGetArtistsFollowed(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -1290,38 +1949,36 @@ def _SpotifyPlusGetArtistsFollowed(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_artists_followed',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit": SPOTIFY_BROWSE_LIMIT
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_artists_followed',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:ArtistPage = ArtistPage(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Artist] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1335,11 +1992,12 @@ def _SpotifyPlusGetArtistsFollowed(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetBrowseCategorysList(hass:HomeAssistant,
+async def _SpotifyPlusGetBrowseCategorysList(hass:HomeAssistant,
                                        data:InstanceDataSoundTouchPlus,
                                        playerName:str,
                                        media_content_type:str|None,
                                        media_content_id:str|None,
+                                       spotifySourceItem:SourceItem=None,
                                        ) -> Tuple[CategoryPage, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_browse_categorys", and returns the media and items results.
@@ -1357,56 +2015,54 @@ def _SpotifyPlusGetBrowseCategorysList(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
         - `CategoryPage` object that contains artists followed information.  
         - list[NavigateItem] list of items that will be loaded to child nodes.   
     """
-    # was a content item in base64 encoded format supplied?  
-    # this can happen for meia content that could be played as well as expanded (e..g playlist, album, etc).
-    if media_content_id.startswith(CONTENT_ITEM_BASE64):
-
-        # drop the eye-ctacher prefix before we deserialize.
-        media_content_id = media_content_id[len(CONTENT_ITEM_BASE64):]
-        contentItem:ContentItem = deserialize_object(media_content_id)
-        _logsi.LogObject(SILevel.Verbose, "'%s': ContentItem is deserialized %s" % (playerName, contentItem.ToString()), contentItem)
+    # was a content item id supplied?  
+    # this can happen for media content that could be played as well as expanded (e.g. playlist, album, etc).
+    contentItem:ContentItem = resolve_content_item_id(media_content_id)
+    if contentItem is not None:
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': ContentItem is resolved %s" % (playerName, contentItem.ToString()), contentItem)
         media_content_id = contentItem.Location   # Spotify URI
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_browse_categorys_list',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "refresh": False
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_browse_categorys_list',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "refresh": False
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:CategoryPage = CategoryPage(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Category] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # add a "Uri" attribute to each category in the category list.
     # this is so we can process categories just like other index types, as
@@ -1423,11 +2079,13 @@ def _SpotifyPlusGetBrowseCategorysList(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetCategoryPlaylists(hass:HomeAssistant,
+async def _SpotifyPlusGetCategoryPlaylists(hass:HomeAssistant,
                                      data:InstanceDataSoundTouchPlus,
                                      playerName:str,
                                      media_content_type:str|None,
                                      media_content_id:str|None,
+                                     offset:int=0,
+                                     spotifySourceItem:SourceItem=None,
                                      ) -> Tuple[PlaylistPageSimplified, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_category_playlists", and returns the media and items results.
@@ -1445,6 +2103,12 @@ def _SpotifyPlusGetCategoryPlaylists(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -1456,39 +2120,38 @@ def _SpotifyPlusGetCategoryPlaylists(hass:HomeAssistant,
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_category_playlists',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "category_id": categoryId,
-                "limit_total": SPOTIFY_BROWSE_LIMIT_TOTAL
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_category_playlists',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "category_id": categoryId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:PlaylistPageSimplified = PlaylistPageSimplified(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[PlaylistSimplified] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1502,11 +2165,13 @@ def _SpotifyPlusGetCategoryPlaylists(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetFeaturedPlaylists(hass:HomeAssistant,
+async def _SpotifyPlusGetFeaturedPlaylists(hass:HomeAssistant,
                                      data:InstanceDataSoundTouchPlus,
                                      playerName:str,
                                      media_content_type:str|None,
                                      media_content_id:str|None,
+                                     offset:int=0,
+                                     spotifySourceItem:SourceItem=None,
                                      ) -> Tuple[PlaylistPageSimplified, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_featured_playlists", and returns the media and items results.
@@ -1524,58 +2189,58 @@ def _SpotifyPlusGetFeaturedPlaylists(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
         - `PlaylistPageSimplified` object that contains artists followed information.  
         - list[NavigateItem] list of items that will be loaded to child nodes.   
     """
-    # was a content item in base64 encoded format supplied?  
-    # this can happen for meia content that could be played as well as expanded (e..g playlist, album, etc).
-    if media_content_id.startswith(CONTENT_ITEM_BASE64):
-
-        # drop the eye-ctacher prefix before we deserialize.
-        media_content_id = media_content_id[len(CONTENT_ITEM_BASE64):]
-        contentItem:ContentItem = deserialize_object(media_content_id)
-        _logsi.LogObject(SILevel.Verbose, "'%s': ContentItem is deserialized %s" % (playerName, contentItem.ToString()), contentItem)
+    # was a content item id supplied?  
+    # this can happen for media content that could be played as well as expanded (e.g. playlist, album, etc).
+    contentItem:ContentItem = resolve_content_item_id(media_content_id)
+    if contentItem is not None:
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': ContentItem is resolved %s" % (playerName, contentItem.ToString()), contentItem)
         media_content_id = contentItem.Location   # Spotify URI
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_featured_playlists',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit": SPOTIFY_BROWSE_LIMIT,
-                "offset": 0,
-                "limit_total": SPOTIFY_BROWSE_LIMIT_TOTAL
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_featured_playlists',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:PlaylistPageSimplified = PlaylistPageSimplified(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[PlaylistSimplified] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1589,11 +2254,12 @@ def _SpotifyPlusGetFeaturedPlaylists(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetPlayerRecentTracks(hass:HomeAssistant,
+async def _SpotifyPlusGetPlayerRecentTracks(hass:HomeAssistant,
                                       data:InstanceDataSoundTouchPlus,
                                       playerName:str,
                                       media_content_type:str|None,
                                       media_content_id:str|None,
+                                      spotifySourceItem:SourceItem=None,
                                       ) -> Tuple[PlayHistoryPage, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_player_recent_tracks", and returns the media and items results.
@@ -1611,6 +2277,9 @@ def _SpotifyPlusGetPlayerRecentTracks(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -1618,51 +2287,46 @@ def _SpotifyPlusGetPlayerRecentTracks(hass:HomeAssistant,
         - list[NavigateItem] list of items that will be loaded to child nodes.   
     """
     
-    # was a content item in base64 encoded format supplied?  
-    # this can happen for meia content that could be played as well as expanded (e..g playlist, album, etc).
-    if media_content_id.startswith(CONTENT_ITEM_BASE64):
-
-        # drop the eye-ctacher prefix before we deserialize.
-        media_content_id = media_content_id[len(CONTENT_ITEM_BASE64):]
-        contentItem:ContentItem = deserialize_object(media_content_id)
-        _logsi.LogObject(SILevel.Verbose, "'%s': ContentItem is deserialized %s" % (playerName, contentItem.ToString()), contentItem)
+    # was a content item id supplied?  
+    # this can happen for media content that could be played as well as expanded (e.g. playlist, album, etc).
+    contentItem:ContentItem = resolve_content_item_id(media_content_id)
+    if contentItem is not None:
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': ContentItem is resolved %s" % (playerName, contentItem.ToString()), contentItem)
         media_content_id = contentItem.Location   # Spotify URI
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_player_recent_tracks',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit": SPOTIFY_BROWSE_LIMIT,
-                "after": 0          # get last 50 regardless of timeframe
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_player_recent_tracks',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "after": 0          # get last 50 regardless of timeframe
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
                
     # convert results dictionary to managed code instances.
     media:PlayHistoryPage = PlayHistoryPage(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Track] = media.GetTracks()
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1676,11 +2340,12 @@ def _SpotifyPlusGetPlayerRecentTracks(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetPlaylist(hass:HomeAssistant,
+async def _SpotifyPlusGetPlaylist(hass:HomeAssistant,
                             data:InstanceDataSoundTouchPlus,
                             playerName:str,
                             media_content_type:str|None,
                             media_content_id:str|None,
+                            spotifySourceItem:SourceItem=None,
                             ) -> Tuple[Playlist, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_playlist", and returns the media and items results.
@@ -1698,6 +2363,9 @@ def _SpotifyPlusGetPlaylist(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -1705,52 +2373,47 @@ def _SpotifyPlusGetPlaylist(hass:HomeAssistant,
         - list[NavigateItem] list of items that will be loaded to child nodes.   
     """
     
-    # was a content item in base64 encoded format supplied?  
-    # this can happen for meia content that could be played as well as expanded (e..g playlist, album, etc).
-    if media_content_id.startswith(CONTENT_ITEM_BASE64):
-
-        # drop the eye-ctacher prefix before we deserialize.
-        media_content_id = media_content_id[len(CONTENT_ITEM_BASE64):]
-        contentItem:ContentItem = deserialize_object(media_content_id)
-        _logsi.LogObject(SILevel.Verbose, "'%s': ContentItem is deserialized %s" % (playerName, contentItem.ToString()), contentItem)
+    # was a content item id supplied?  
+    # this can happen for media content that could be played as well as expanded (e.g. playlist, album, etc).
+    contentItem:ContentItem = resolve_content_item_id(media_content_id)
+    if contentItem is not None:
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': ContentItem is resolved %s" % (playerName, contentItem.ToString()), contentItem)
         media_content_id = contentItem.Location   # Spotify URI
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_playlist',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "playlist_id": SpotifyClient.GetIdFromUri(media_content_id),
-                "fields": "description,id,images,name,public,snapshot_id,type,uri,tracks(limit,next,offset,previous,total,items(track(id,name,track_number,type,uri,album(id,images,name,total_tracks,type,uri,artists(id,name,type,uri)))))",
-                "additional_types": "episode"
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_playlist',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "playlist_id": SpotifyClient.GetIdFromUri(media_content_id),
+            "fields": "description,id,images,name,public,snapshot_id,type,uri,tracks(limit,next,offset,previous,total,items(track(id,name,track_number,type,uri,album(id,images,name,total_tracks,type,uri,artists(id,name,type,uri)))))",
+            "additional_types": "episode"
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:Playlist = Playlist(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Track] = media.GetTracks()
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1764,11 +2427,13 @@ def _SpotifyPlusGetPlaylist(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetPlaylistFavorites(hass:HomeAssistant,
+async def _SpotifyPlusGetPlaylistFavorites(hass:HomeAssistant,
                                      data:InstanceDataSoundTouchPlus,
                                      playerName:str,
                                      media_content_type:str|None,
                                      media_content_id:str|None,
+                                     offset:int=0,
+                                     spotifySourceItem:SourceItem=None,
                                      ) -> Tuple[PlaylistPageSimplified, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_playlist_favorites", and returns the media and items results.
@@ -1786,6 +2451,12 @@ def _SpotifyPlusGetPlaylistFavorites(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -1794,39 +2465,37 @@ def _SpotifyPlusGetPlaylistFavorites(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_playlist_favorites',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit": SPOTIFY_BROWSE_LIMIT,
-                "offset": 0
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_playlist_favorites',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:PlaylistPageSimplified = PlaylistPageSimplified(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[PlaylistSimplified] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtained the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1840,11 +2509,12 @@ def _SpotifyPlusGetPlaylistFavorites(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetShow(hass:HomeAssistant,
+async def _SpotifyPlusGetShow(hass:HomeAssistant,
                         data:InstanceDataSoundTouchPlus,
                         playerName:str,
                         media_content_type:str|None,
                         media_content_id:str|None,
+                        spotifySourceItem:SourceItem=None,
                         ) -> Tuple[Show, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_show", and returns the media and items results.
@@ -1862,6 +2532,9 @@ def _SpotifyPlusGetShow(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -1869,50 +2542,45 @@ def _SpotifyPlusGetShow(hass:HomeAssistant,
         - list[NavigateItem] list of items that will be loaded to child nodes.   
     """
     
-    # was a content item in base64 encoded format supplied?  
-    # this can happen for meia content that could be played as well as expanded (e..g playlist, album, etc).
-    if media_content_id.startswith(CONTENT_ITEM_BASE64):
-
-        # drop the eye-ctacher prefix before we deserialize.
-        media_content_id = media_content_id[len(CONTENT_ITEM_BASE64):]
-        contentItem:ContentItem = deserialize_object(media_content_id)
-        _logsi.LogObject(SILevel.Verbose, "'%s': ContentItem is deserialized %s" % (playerName, contentItem.ToString()), contentItem)
+    # was a content item id supplied?  
+    # this can happen for media content that could be played as well as expanded (e.g. playlist, album, etc).
+    contentItem:ContentItem = resolve_content_item_id(media_content_id)
+    if contentItem is not None:
+        TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': ContentItem is resolved %s" % (playerName, contentItem.ToString()), contentItem)
         media_content_id = contentItem.Location   # Spotify URI
 
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_show',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "show_id": SpotifyClient.GetIdFromUri(media_content_id),
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_show',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "show_id": SpotifyClient.GetIdFromUri(media_content_id),
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:Show = Show(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[EpisodeSimplified] = media.Episodes.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -1926,11 +2594,13 @@ def _SpotifyPlusGetShow(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetShowFavorites(hass:HomeAssistant,
+async def _SpotifyPlusGetShowFavorites(hass:HomeAssistant,
                                  data:InstanceDataSoundTouchPlus,
                                  playerName:str,
                                  media_content_type:str|None,
                                  media_content_id:str|None,
+                                 offset:int=0,
+                                 spotifySourceItem:SourceItem=None,
                                  ) -> Tuple[PlaylistPageSimplified, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_show_favorites", and returns the media and items results.
@@ -1948,6 +2618,12 @@ def _SpotifyPlusGetShowFavorites(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -1956,39 +2632,37 @@ def _SpotifyPlusGetShowFavorites(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_show_favorites',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit": SPOTIFY_BROWSE_LIMIT,
-                "offset": 0
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_show_favorites',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:ShowPageSaved = ShowPageSaved(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[ShowSaved] = media.GetShows()
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -2002,11 +2676,13 @@ def _SpotifyPlusGetShowFavorites(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetTrackFavorites(hass:HomeAssistant,
+async def _SpotifyPlusGetTrackFavorites(hass:HomeAssistant,
                                   data:InstanceDataSoundTouchPlus,
                                   playerName:str,
                                   media_content_type:str|None,
                                   media_content_id:str|None,
+                                  offset:int=0,
+                                  spotifySourceItem:SourceItem=None,
                                   ) -> Tuple[PlaylistPageSimplified, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_track_favorites", and returns the media and items results.
@@ -2024,6 +2700,12 @@ def _SpotifyPlusGetTrackFavorites(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -2032,39 +2714,37 @@ def _SpotifyPlusGetTrackFavorites(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_track_favorites',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit": SPOTIFY_BROWSE_LIMIT,
-                "offset": 0
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_track_favorites',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:TrackPageSaved = TrackPageSaved(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Track] = media.GetTracks()
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -2078,11 +2758,13 @@ def _SpotifyPlusGetTrackFavorites(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetUsersTopArtists(hass:HomeAssistant,
+async def _SpotifyPlusGetUsersTopArtists(hass:HomeAssistant,
                                    data:InstanceDataSoundTouchPlus,
                                    playerName:str,
                                    media_content_type:str|None,
                                    media_content_id:str|None,
+                                   offset:int=0,
+                                   spotifySourceItem:SourceItem=None,
                                    ) -> Tuple[ArtistPage, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_users_top_artists", and returns the media and items results.
@@ -2100,6 +2782,12 @@ def _SpotifyPlusGetUsersTopArtists(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -2108,38 +2796,37 @@ def _SpotifyPlusGetUsersTopArtists(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_users_top_artists',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit_total": SPOTIFY_BROWSE_LIMIT_TOTAL,
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_users_top_artists',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:ArtistPage = ArtistPage(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Artist] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -2153,11 +2840,13 @@ def _SpotifyPlusGetUsersTopArtists(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusGetUsersTopTracks(hass:HomeAssistant,
+async def _SpotifyPlusGetUsersTopTracks(hass:HomeAssistant,
                                   data:InstanceDataSoundTouchPlus,
                                   playerName:str,
                                   media_content_type:str|None,
                                   media_content_id:str|None,
+                                  offset:int=0,
+                                  spotifySourceItem:SourceItem=None,
                                   ) -> Tuple[TrackPage, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "get_users_top_tracks", and returns the media and items results.
@@ -2175,6 +2864,12 @@ def _SpotifyPlusGetUsersTopTracks(hass:HomeAssistant,
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        offset (int):
+            The index of the first item to return; use with the `SPOTIFY_BROWSE_LIMIT`
+            page size to retrieve the next page of items.
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -2183,38 +2878,37 @@ def _SpotifyPlusGetUsersTopTracks(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'get_users_top_tracks',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "limit_total": SPOTIFY_BROWSE_LIMIT_TOTAL,
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'get_users_top_tracks',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "limit": SPOTIFY_BROWSE_LIMIT,
+            "offset": offset
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:TrackPage = TrackPage(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[Track] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
@@ -2228,13 +2922,14 @@ def _SpotifyPlusGetUsersTopTracks(hass:HomeAssistant,
     return media, items
 
 
-def _SpotifyPlusSearchPlaylists(hass:HomeAssistant,
+async def _SpotifyPlusSearchPlaylists(hass:HomeAssistant,
                                 data:InstanceDataSoundTouchPlus,
                                 playerName:str,
                                 media_content_type:str|None,
                                 media_content_id:str|None,
                                 criteria:str,
                                 limitTotal:int,
+                                spotifySourceItem:SourceItem=None,
                                 ) -> Tuple[PlaylistPageSimplified, list[NavigateItem]]:
     """
     Calls the spotifyPlus integration service "search_playlist", and returns the media and items results.
@@ -2260,6 +2955,9 @@ def _SpotifyPlusSearchPlaylists(hass:HomeAssistant,
             and paging is automatically used to retrieve all available items up to the
             maximum number specified.  
             Default: None (disabled)
+        spotifySourceItem (SourceItem):
+            The SoundTouch Spotify source item, if it was already resolved for the browse
+            request; otherwise, None to resolve it from the device source list.
 
     Returns:
         A tuple of 2 objects:  
@@ -2268,40 +2966,38 @@ def _SpotifyPlusSearchPlaylists(hass:HomeAssistant,
     """
     # call SpotifyPlus integration service.
     # this returns a dictionary of a partial user profile, as well as the items retrieved.
-    result:dict = run_coroutine_threadsafe(
-        hass.services.async_call(
-            DOMAIN_SPOTIFYPLUS,
-            'search_playlists',
-            {
-                "entity_id": data.OptionSpotifyMediaPlayerEntityId,
-                "criteria": criteria,
-                "offset": 0,
-                "limit_total": limitTotal
-            },      
-            blocking=True,          # wait for service to complete before returning
-            return_response=True    # returns service response data.
-        ), hass.loop
-    ).result()
-    _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
+    result:dict = await hass.services.async_call(
+        DOMAIN_SPOTIFYPLUS,
+        'search_playlists',
+        {
+            "entity_id": data.OptionSpotifyMediaPlayerEntityId,
+            "criteria": criteria,
+            "offset": 0,
+            "limit_total": limitTotal
+        },      
+        blocking=True,          # wait for service to complete before returning
+        return_response=True    # returns service response data.
+    )
+    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_DICTIONARY % playerName, result, prettyPrint=True)
             
     # convert results dictionary to managed code instances.
     media:PlaylistPageSimplified = PlaylistPageSimplified(root=result.get("result", None))
     if media is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS_FORMAT_ERROR % (playerName, media_content_type))
     mediaItems:list[PlaylistSimplified] = media.Items
-    _logsi.LogArray(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
+    TRACE_SINK.LogArray(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_RESULT_ITEMS % playerName, mediaItems)
 
     userProfile:UserProfile = UserProfile(root=result.get("user_profile", None))
     if userProfile is None:
         raise MediaSourceNotFoundError(STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE_FORMAT_ERROR % (playerName, media_content_type))
-    _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
+    TRACE_SINK.LogObject(_logsi, SILevel.Verbose, STAppMessages.MSG_SPOTIFYPLUS_USERPROFILE % playerName, userProfile, excludeNonPublic=True)
 
     result = None
 
     # verify that the soundtouch Spotify source userid matches the spotifyPlus integration
     # userid that obtatined the results.  if they don't match, then it's a problem because
     # the soundtouch device won't be able to play it!
-    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile)
+    spotifySourceItem:SourceItem = _GetSpotifySourceItem(playerName, data, userProfile, spotifySourceItem)
 
     # build a list of soundtouchapi NavigateItems (which also contain ContentItem) to 
     # use in the child load process.
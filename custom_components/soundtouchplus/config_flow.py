@@ -47,6 +47,7 @@ from .const import (
     CONF_OPTION_SPOTIFY_MEDIAPLAYER_ENTITY_ID,
     CONF_OPTION_TTS_FORCE_GOOGLE_TRANSLATE,
     CONF_OPTION_RECENTS_CACHE_MAX_ITEMS,
+    CONF_OPTION_ZONE_MASTER_FAILOVER,
     CONF_PING_WEBSOCKET_INTERVAL,
     CONF_PORT_WEBSOCKET,
     DEFAULT_PING_WEBSOCKET_INTERVAL,
@@ -453,6 +454,7 @@ class SoundTouchPlusOptionsFlow(OptionsFlow):
                 self._Options[CONF_OPTION_SPOTIFY_MEDIAPLAYER_ENTITY_ID] = user_input.get(CONF_OPTION_SPOTIFY_MEDIAPLAYER_ENTITY_ID, None)
                 self._Options[CONF_OPTION_TTS_FORCE_GOOGLE_TRANSLATE] = user_input.get(CONF_OPTION_TTS_FORCE_GOOGLE_TRANSLATE, None)
                 self._Options[CONF_OPTION_RECENTS_CACHE_MAX_ITEMS] = user_input.get(CONF_OPTION_RECENTS_CACHE_MAX_ITEMS, 0)
+                self._Options[CONF_OPTION_ZONE_MASTER_FAILOVER] = user_input.get(CONF_OPTION_ZONE_MASTER_FAILOVER, False)
                 
                 # store the updated config entry options.
                 return await self._update_options(self._Options)
@@ -499,6 +501,9 @@ class SoundTouchPlusOptionsFlow(OptionsFlow):
                     vol.Optional(CONF_OPTION_TTS_FORCE_GOOGLE_TRANSLATE, 
                                  default=self._Options.get(CONF_OPTION_TTS_FORCE_GOOGLE_TRANSLATE, False)
                                  ): cv.boolean,
+                    vol.Optional(CONF_OPTION_ZONE_MASTER_FAILOVER, 
+                                 default=self._Options.get(CONF_OPTION_ZONE_MASTER_FAILOVER, False)
+                                 ): cv.boolean,
                 }
             )
             
@@ -15,9 +15,18 @@ CONF_OPTION_SOURCE_LIST = "source_list"
 CONF_OPTION_SPOTIFY_MEDIAPLAYER_ENTITY_ID = "spotify_mediaplayer_entity_id"
 CONF_OPTION_TTS_FORCE_GOOGLE_TRANSLATE = "tts_force_google_translate"
 CONF_OPTION_RECENTS_CACHE_MAX_ITEMS = "recents_cache_max_items"
+CONF_OPTION_ZONE_MASTER_FAILOVER = "zone_master_failover"
+
+SNAPSHOT_RESTORE_MODE_CHANGES = "changes"
+SNAPSHOT_RESTORE_MODE_FULL = "full"
+
+ZONE_VOLUME_MODE_OFFSET = "offset"
+ZONE_VOLUME_MODE_SCALE = "scale"
+ZONE_VOLUME_MODE_SET = "set"
 
 DEFAULT_PING_WEBSOCKET_INTERVAL = 0
 DEFAULT_PORT = 8090
 DEFAULT_PORT_WEBSOCKET = 8080
 DEFAULT_SSL = False
 DEFAULT_TIMEOUT = 15
+DEFAULT_TTS_URL = "http://translate.google.com/translate_tts?ie=UTF-8&tl=EN&client=tw-ob&q={saytext}"
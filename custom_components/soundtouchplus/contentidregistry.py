@@ -0,0 +1,265 @@
+"""
+Content id registry for the SoundTouchPlus media browser.
+
+Browse media nodes that reference a ContentItem (playable items) or a Spotify Category
+(genre nodes) need to carry enough information in their `media_content_id` value to
+resolve the object again when the node is selected.  Previously this was done by
+pickling the object and base64 encoding the result, which produces ids that are several
+hundred bytes long and costs pickle / unpickle cpu on every browse and selection.
+
+The registry replaces this with a compact, deterministic id that encodes only the
+values required to rebuild the object, plus a bounded LRU cache that maps ids to the
+original objects.  Cache hits return the original object (including values that are
+not encoded, such as container art); ids that have been evicted from the cache (or
+that were generated before a restart) are decoded from the id itself.
+"""
+import base64
+from collections import OrderedDict
+import json
+import threading
+
+from bosesoundtouchapi.models import ContentItem
+from spotifywebapipython.models import Category
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+CATEGORY_ID:str = "cat::"
+""" Eye-catcher used to denote a registry encoded Category. """
+
+CONTENT_ITEM_ID:str = "ci::"
+""" Eye-catcher used to denote a registry encoded ContentItem. """
+
+CONTENT_ID_REGISTRY_MAX_ITEMS:int = 2000
+""" Maximum number of objects to retain in the content id registry. """
+
+
+class ContentIdRegistry:
+    """
+    Bounded LRU registry that maps compact browse media content ids to ContentItem
+    and Category objects.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, maxItems:int=CONTENT_ID_REGISTRY_MAX_ITEMS) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxItems (int):
+                Maximum number of objects to retain in the registry.
+        """
+        self._evictions:int = 0
+        self._hits:int = 0
+        self._items:OrderedDict[str, object] = OrderedDict()
+        self._lock:threading.Lock = threading.Lock()
+        self._maxItems:int = max(1, maxItems)
+        self._misses:int = 0
+        self._payloadBytesSaved:int = 0
+
+
+    @property
+    def Count(self) -> int:
+        """ Number of objects currently in the registry. """
+        return len(self._items)
+
+
+    @property
+    def Evictions(self) -> int:
+        """ Number of objects that were evicted from the registry due to the size limit. """
+        return self._evictions
+
+
+    @property
+    def Hits(self) -> int:
+        """ Number of id resolutions that were satisfied from the registry. """
+        return self._hits
+
+
+    @property
+    def MaxItems(self) -> int:
+        """ Maximum number of objects to retain in the registry. """
+        return self._maxItems
+
+
+    @property
+    def Misses(self) -> int:
+        """ Number of id resolutions that required the id to be decoded. """
+        return self._misses
+
+
+    @property
+    def PayloadBytesSaved(self) -> int:
+        """
+        Total number of media content id bytes saved when compared to the pickled base64
+        encoding, as recorded via `RecordPayloadBytesSaved`.
+        """
+        return self._payloadBytesSaved
+
+
+    @staticmethod
+    def IsCategoryId(mediaContentId:str) -> bool:
+        """ Returns True if the media content id is an encoded Category; otherwise, False. """
+        return (mediaContentId is not None) and mediaContentId.startswith(CATEGORY_ID)
+
+
+    @staticmethod
+    def IsContentItemId(mediaContentId:str) -> bool:
+        """ Returns True if the media content id is an encoded ContentItem; otherwise, False. """
+        return (mediaContentId is not None) and mediaContentId.startswith(CONTENT_ITEM_ID)
+
+
+    def RecordPayloadBytesSaved(self, value:int) -> None:
+        """
+        Adds to the total number of media content id bytes saved.
+        """
+        with self._lock:
+            self._payloadBytesSaved += value
+
+
+    def RegisterCategory(self, category:Category) -> str:
+        """
+        Registers a Category object, and returns the media content id that references it.
+
+        Args:
+            category (Category):
+                The Category to register.
+
+        Returns:
+            A media content id string.
+        """
+        values:list = [category.Uri, category.Name, category.ImageUrl]
+        return self._Register(CATEGORY_ID + self._Encode(values), category)
+
+
+    def RegisterContentItem(self, contentItem:ContentItem) -> str:
+        """
+        Registers a ContentItem object, and returns the media content id that references it.
+
+        Args:
+            contentItem (ContentItem):
+                The ContentItem to register.
+
+        Returns:
+            A media content id string.
+
+        The container art value is not encoded in the id, as it is not required to play
+        the content and would more than double the size of most ids.
+        """
+        values:list = [
+            contentItem.Source,
+            contentItem.TypeValue,
+            contentItem.Location,
+            contentItem.SourceAccount,
+            contentItem.IsPresetable,
+            contentItem.Name,
+        ]
+        return self._Register(CONTENT_ITEM_ID + self._Encode(values), contentItem)
+
+
+    def ResolveCategory(self, mediaContentId:str) -> Category:
+        """
+        Resolves a media content id to a Category object.
+
+        Args:
+            mediaContentId (str):
+                Media content id returned by `RegisterCategory`.
+
+        Returns:
+            A `Category` object, or None if the id is not an encoded Category.
+        """
+        if not self.IsCategoryId(mediaContentId):
+            return None
+
+        category:Category = self._Lookup(mediaContentId)
+        if category is None:
+            uri, name, imageUrl = self._Decode(mediaContentId[len(CATEGORY_ID):])
+            category = Category(root={
+                "id": uri.split(":")[-1] if uri is not None else None,
+                "name": name,
+                "icons": [{"url": imageUrl}] if imageUrl is not None else [],
+            })
+            self._Register(mediaContentId, category)
+        return category
+
+
+    def ResolveContentItem(self, mediaContentId:str) -> ContentItem:
+        """
+        Resolves a media content id to a ContentItem object.
+
+        Args:
+            mediaContentId (str):
+                Media content id returned by `RegisterContentItem`.
+
+        Returns:
+            A `ContentItem` object, or None if the id is not an encoded ContentItem.
+        """
+        if not self.IsContentItemId(mediaContentId):
+            return None
+
+        contentItem:ContentItem = self._Lookup(mediaContentId)
+        if contentItem is None:
+            source, typeValue, location, sourceAccount, isPresetable, name = self._Decode(mediaContentId[len(CONTENT_ITEM_ID):])
+            contentItem = ContentItem(source, typeValue, location, sourceAccount, isPresetable, name=name)
+            self._Register(mediaContentId, contentItem)
+        return contentItem
+
+
+    @staticmethod
+    def _Decode(text:str) -> list:
+        """
+        Decodes a list of values from an encoded string.
+        """
+        text = text + ("=" * (-len(text) % 4))
+        return json.loads(base64.urlsafe_b64decode(text.encode('ascii')).decode('utf-8'))
+
+
+    @staticmethod
+    def _Encode(values:list) -> str:
+        """
+        Encodes a list of values to a compact, url-safe string.
+        """
+        data:bytes = json.dumps(values, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        return base64.urlsafe_b64encode(data).decode('ascii').rstrip("=")
+
+
+    def _Lookup(self, mediaContentId:str) -> object:
+        """
+        Returns the registered object for a media content id, or None if it is not
+        in the registry.
+        """
+        with self._lock:
+            obj:object = self._items.get(mediaContentId, None)
+            if obj is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._items.move_to_end(mediaContentId)
+            return obj
+
+
+    def _Register(self, mediaContentId:str, obj:object) -> str:
+        """
+        Adds (or refreshes) a registry entry, evicting the least recently used entries
+        if the registry is full.
+        """
+        with self._lock:
+            self._items[mediaContentId] = obj
+            self._items.move_to_end(mediaContentId)
+            while len(self._items) > self._maxItems:
+                self._items.popitem(last=False)
+                self._evictions += 1
+        return mediaContentId
+
+
+CONTENT_ID_REGISTRY:ContentIdRegistry = ContentIdRegistry()
+"""
+Shared content id registry instance used by the media browser and media player.
+"""
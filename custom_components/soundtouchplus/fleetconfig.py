@@ -0,0 +1,302 @@
+"""
+Fleet configuration export / import for the SoundTouchPlus component.
+
+Provisioning (or recovering) a house of speakers means replaying presets, names,
+languages, and audio settings one service call at a time.  A fleet configuration
+document contains every setting that the integration can read for each device, so
+that it can be applied back to the same devices (or copied to other devices) in a
+single call.
+
+A document is applied as a diff: the current settings of a device are read first,
+and only the settings (and preset slots) that differ from the document are written;
+presets are written the same way as the preset_store_bulk service.
+"""
+from bosesoundtouchapi import SoundTouchClient, SoundTouchError
+from bosesoundtouchapi.models import (
+    AudioDspControls,
+    AudioProductLevelControls,
+    AudioProductToneControls,
+    Balance,
+    Preset,
+    PresetList,
+    ProductCecHdmiControl,
+    ProductHdmiAssignmentControls,
+)
+from bosesoundtouchapi.uri import SoundTouchNodes, SoundTouchUri
+
+from .presetlayout import StorePresetLayout
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+FLEET_CONFIG_VERSION:int = 1
+""" Version of the fleet configuration document format. """
+
+FLEET_SECTION_NAME:str = "Name"
+FLEET_SECTION_LANGUAGE:str = "Language"
+FLEET_SECTION_PRESETS:str = "Presets"
+FLEET_SECTION_BASS_LEVEL:str = "BassLevel"
+FLEET_SECTION_BALANCE_LEVEL:str = "BalanceLevel"
+FLEET_SECTION_AUDIO_DSP_CONTROLS:str = "AudioDspControls"
+FLEET_SECTION_AUDIO_PRODUCT_TONE_CONTROLS:str = "AudioProductToneControls"
+FLEET_SECTION_AUDIO_PRODUCT_LEVEL_CONTROLS:str = "AudioProductLevelControls"
+FLEET_SECTION_PRODUCT_CEC_HDMI_CONTROL:str = "ProductCecHdmiControl"
+FLEET_SECTION_PRODUCT_HDMI_ASSIGNMENT_CONTROLS:str = "ProductHdmiAssignmentControls"
+
+FLEET_CONFIG_SECTIONS:dict[str, SoundTouchUri] = {
+    FLEET_SECTION_NAME: SoundTouchNodes.name,
+    FLEET_SECTION_LANGUAGE: SoundTouchNodes.language,
+    FLEET_SECTION_PRESETS: SoundTouchNodes.presets,
+    FLEET_SECTION_BASS_LEVEL: SoundTouchNodes.bass,
+    FLEET_SECTION_BALANCE_LEVEL: SoundTouchNodes.balance,
+    FLEET_SECTION_AUDIO_DSP_CONTROLS: SoundTouchNodes.audiodspcontrols,
+    FLEET_SECTION_AUDIO_PRODUCT_TONE_CONTROLS: SoundTouchNodes.audioproducttonecontrols,
+    FLEET_SECTION_AUDIO_PRODUCT_LEVEL_CONTROLS: SoundTouchNodes.audioproductlevelcontrols,
+    FLEET_SECTION_PRODUCT_CEC_HDMI_CONTROL: SoundTouchNodes.productcechdmicontrol,
+    FLEET_SECTION_PRODUCT_HDMI_ASSIGNMENT_CONTROLS: SoundTouchNodes.producthdmiassignmentcontrols,
+}
+""" Fleet configuration sections, in apply order, and the device uri that each requires. """
+
+_PRESET_KEYS:list[str] = ["Name", "Source", "SourceAccount", "TypeValue", "Location", "ContainerArt"]
+""" Preset values that are exported. """
+
+
+def ApplyDeviceConfig(client:SoundTouchClient, settings:dict, sections:list[str]=None) -> dict:
+    """
+    Applies fleet configuration settings to a device, writing only the settings that
+    differ from the current device settings.
+
+    Args:
+        client (SoundTouchClient):
+            Client of the device to apply the settings to.
+        settings (dict):
+            The `Settings` dictionary of a device entry of a fleet configuration document.
+        sections (list[str]):
+            Sections (e.g. `FLEET_SECTION_PRESETS`) to apply, or None to apply all sections
+            that are in the settings and supported by the device.
+
+    Returns:
+        A dictionary that contains the number of `Writes` issued, the number of writes
+        `Skipped` (because the setting had not changed), the `Changed` section names, and
+        any `Errors` (keyed by section name).
+
+    Settings are applied one section at a time; an error applying a section is reported
+    and does not prevent the remaining sections from being applied.
+    """
+    report:dict = {"Writes": 0, "Skipped": 0, "Changed": [], "Errors": {}}
+    applySections:list[str] = [section for section in FLEET_CONFIG_SECTIONS if (section in settings) and ((sections is None) or (section in sections))]
+    current:dict = ExportDeviceConfig(client, applySections)["Settings"]
+
+    for section in applySections:
+        if section not in current:
+            report["Errors"][section] = "Device '%s' does not support the '%s' settings" % (client.Device.DeviceName, section)
+            continue
+
+        try:
+
+            target = settings[section]
+            if section == FLEET_SECTION_PRESETS:
+                writes, skipped = _ApplyPresets(client, target)
+            elif _IsEqual(current[section], target):
+                writes, skipped = 0, 1
+            else:
+                _ApplySection(client, section, target)
+                writes, skipped = 1, 0
+
+            report["Writes"] += writes
+            report["Skipped"] += skipped
+            if writes > 0:
+                report["Changed"].append(section)
+
+        except SoundTouchError as ex:
+            report["Errors"][section] = ex.Message
+        except Exception as ex:
+            _logsi.LogException("Could not apply '%s' settings to device '%s'" % (section, client.Device.DeviceName), ex, logToSystemLogger=False)
+            report["Errors"][section] = str(ex)
+
+    _logsi.LogVerbose("'%s': Fleet configuration applied (%d writes, %d skipped)" % (client.Device.DeviceName, report["Writes"], report["Skipped"]))
+    return report
+
+
+def ExportDeviceConfig(client:SoundTouchClient, sections:list[str]=None) -> dict:
+    """
+    Reads every fleet configuration setting that a device supports.
+
+    Args:
+        client (SoundTouchClient):
+            Client of the device to read the settings from.
+        sections (list[str]):
+            Sections (e.g. `FLEET_SECTION_PRESETS`) to read, or None to read all sections.
+
+    Returns:
+        A device entry dictionary that contains the `DeviceId`, `DeviceName`, `DeviceType`,
+        and `Settings` dictionary (keyed by section name) of the device.
+
+    Settings are read from the device (not the configuration cache).  Sections that the
+    device does not support (as determined by it's supported urls) are not included.
+    """
+    settings:dict = {}
+    supportedUris:list[SoundTouchUri] = client.Device.SupportedUris
+
+    for section, uri in FLEET_CONFIG_SECTIONS.items():
+        if (sections is not None) and (section not in sections):
+            continue
+        if uri.Path not in supportedUris:
+            continue
+        try:
+            value = _ReadSection(client, section)
+            if value is not None:
+                settings[section] = value
+        except SoundTouchError as ex:
+            _logsi.LogVerbose("'%s': Fleet configuration section '%s' was not exported: %s" % (client.Device.DeviceName, section, ex.Message))
+
+    return {
+        "DeviceId": client.Device.DeviceId,
+        "DeviceName": client.Device.DeviceName,
+        "DeviceType": client.Device.DeviceType,
+        "Settings": settings,
+    }
+
+
+def _ApplyPresets(client:SoundTouchClient, target:list[dict]) -> tuple[int, int]:
+    """
+    Writes the preset slots that differ from the target presets; slots that are not in
+    the target presets are removed.
+
+    Returns:
+        A tuple of the number of device writes issued, and the number of preset slots
+        that were unchanged.
+    """
+    targets:dict[int, Preset] = {}
+    for item in target:
+        presetId:int = int(item["PresetId"])
+        targets[presetId] = Preset(
+            presetId,
+            None,
+            None,
+            item.get("Source"),
+            item.get("TypeValue"),
+            item.get("Location"),
+            item.get("SourceAccount"),
+            True,   # is_presetable must always has to be true, otherwise call will fail
+            item.get("Name") or ("Preset %s" % str(presetId)),
+            item.get("ContainerArt"),
+            )
+
+    layout:dict = StorePresetLayout(client, targets, True)
+    return layout["Writes"], len(layout["Unchanged"])
+
+
+def _ApplySection(client:SoundTouchClient, section:str, value) -> None:
+    """
+    Writes the settings of a (non-preset) section to a device.
+    """
+    if section == FLEET_SECTION_NAME:
+        client.SetName(value)
+
+    elif section == FLEET_SECTION_LANGUAGE:
+        client.SetLanguage(str(value))
+
+    elif section == FLEET_SECTION_BASS_LEVEL:
+        client.SetBassLevel(int(value))
+
+    elif section == FLEET_SECTION_BALANCE_LEVEL:
+        client.SetBalanceLevel(int(value))
+
+    elif section == FLEET_SECTION_AUDIO_DSP_CONTROLS:
+        config:AudioDspControls = client.GetAudioDspControls(False)
+        config.AudioMode = value.get("AudioMode")
+        config.VideoSyncAudioDelay = value.get("VideoSyncAudioDelay")
+        client.SetAudioDspControls(config)
+
+    elif section == FLEET_SECTION_AUDIO_PRODUCT_TONE_CONTROLS:
+        config:AudioProductToneControls = client.GetAudioProductToneControls(False)
+        config.Bass.Value = int(value.get("Bass"))
+        config.Treble.Value = int(value.get("Treble"))
+        client.SetAudioProductToneControls(config)
+
+    elif section == FLEET_SECTION_AUDIO_PRODUCT_LEVEL_CONTROLS:
+        config:AudioProductLevelControls = client.GetAudioProductLevelControls(False)
+        config.FrontCenterSpeakerLevel.Value = int(value.get("FrontCenterSpeakerLevel"))
+        config.RearSurroundSpeakersLevel.Value = int(value.get("RearSurroundSpeakersLevel"))
+        client.SetAudioProductLevelControls(config)
+
+    elif section == FLEET_SECTION_PRODUCT_CEC_HDMI_CONTROL:
+        config:ProductCecHdmiControl = ProductCecHdmiControl()
+        config.CecMode = value
+        client.SetProductCecHdmiControl(config)
+
+    elif section == FLEET_SECTION_PRODUCT_HDMI_ASSIGNMENT_CONTROLS:
+        config:ProductHdmiAssignmentControls = ProductHdmiAssignmentControls()
+        config.HdmiInputSelection01 = value
+        client.SetProductHdmiAssignmentControls(config)
+
+
+def _IsEqual(current, target) -> bool:
+    """
+    Returns True if a target section value matches the current section value; otherwise,
+    False.  Values are compared as strings, and None and empty string values are equivalent.
+    Only the keys of a target dictionary value are compared.
+    """
+    if isinstance(target, dict):
+        if not isinstance(current, dict):
+            return False
+        return all(_IsEqual(current.get(key), value) for key, value in target.items())
+    return str("" if current is None else current) == str("" if target is None else target)
+
+
+def _ReadSection(client:SoundTouchClient, section:str):
+    """
+    Reads the current settings of a section from a device.
+
+    Returns:
+        The section value, or None if the setting is not available on the device.
+    """
+    if section == FLEET_SECTION_NAME:
+        return client.GetName(True).Value
+
+    elif section == FLEET_SECTION_LANGUAGE:
+        return client.GetLanguage(True).Value
+
+    elif section == FLEET_SECTION_PRESETS:
+        presetList:PresetList = client.GetPresetList(True)
+        result:list[dict] = []
+        preset:Preset
+        for preset in presetList:
+            item:dict = {"PresetId": preset.PresetId}
+            for key in _PRESET_KEYS:
+                item[key] = getattr(preset, key)
+            result.append(item)
+        return result
+
+    elif section == FLEET_SECTION_BASS_LEVEL:
+        return client.GetBass(True).Actual
+
+    elif section == FLEET_SECTION_BALANCE_LEVEL:
+        balance:Balance = client.GetBalance(True)
+        return balance.Actual if balance.IsAvailable else None
+
+    elif section == FLEET_SECTION_AUDIO_DSP_CONTROLS:
+        config:AudioDspControls = client.GetAudioDspControls(True)
+        return {"AudioMode": config.AudioMode, "VideoSyncAudioDelay": config.VideoSyncAudioDelay}
+
+    elif section == FLEET_SECTION_AUDIO_PRODUCT_TONE_CONTROLS:
+        config:AudioProductToneControls = client.GetAudioProductToneControls(True)
+        return {"Bass": config.Bass.Value, "Treble": config.Treble.Value}
+
+    elif section == FLEET_SECTION_AUDIO_PRODUCT_LEVEL_CONTROLS:
+        config:AudioProductLevelControls = client.GetAudioProductLevelControls(True)
+        return {"FrontCenterSpeakerLevel": config.FrontCenterSpeakerLevel.Value, "RearSurroundSpeakersLevel": config.RearSurroundSpeakersLevel.Value}
+
+    elif section == FLEET_SECTION_PRODUCT_CEC_HDMI_CONTROL:
+        return client.GetProductCecHdmiControl(True).CecMode
+
+    elif section == FLEET_SECTION_PRODUCT_HDMI_ASSIGNMENT_CONTROLS:
+        return client.GetProductHdmiAssignmentControls(True).HdmiInputSelection01
+
+    return None
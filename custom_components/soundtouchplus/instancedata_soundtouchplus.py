@@ -1,14 +1,20 @@
 from bosesoundtouchapi import SoundTouchClient
 from bosesoundtouchapi.ws import SoundTouchWebSocket
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from homeassistant.components.media_player import MediaPlayerEntity
 from types import MappingProxyType
 from typing import Any
 
+from .mediasearchindex import MediaSearchIndex
+from .navigatecache import NavigateCache
+from .recentsstore import RecentsStore
+from .snapshotstore import SnapshotStore
+from .storedmusicindex import StoredMusicIndex
 from .const import (
     CONF_OPTION_SPOTIFY_MEDIAPLAYER_ENTITY_ID,
     CONF_OPTION_TTS_FORCE_GOOGLE_TRANSLATE,
+    CONF_OPTION_ZONE_MASTER_FAILOVER,
 )
 
 
@@ -43,6 +49,50 @@ class InstanceDataSoundTouchPlus:
     if websocket processing is enabled.
     """
 
+    browse_cache:dict[str, tuple[int, Any]] = field(default_factory=dict)
+    """
+    Media browser node cache, keyed by media content type.  Each entry is a tuple of
+    the device version (e.g. presets / recents last updated value) the node was built
+    for, and the BrowseMedia node itself.
+    """
+
+    media_search_index:MediaSearchIndex = field(default_factory=MediaSearchIndex)
+    """
+    Search index of the device presets, recently played items, and recently played cache
+    items; each is rebuilt when it's last updated value changes.
+    """
+
+    recents_store:RecentsStore = field(default_factory=RecentsStore)
+    """
+    Recently played items history store for the device, which is opened if the recently
+    played items cache is enabled.
+    """
+
+    snapshot_store:SnapshotStore = field(default_factory=SnapshotStore)
+    """
+    Named snapshots of the device, which are persisted to a file (and loaded the first
+    time a snapshot is accessed).
+    """
+
+    stored_music_index:StoredMusicIndex = field(default_factory=StoredMusicIndex)
+    """
+    Search index of the device STORED_MUSIC library containers and items, which is 
+    built by a background crawler and persisted to a file.
+    """
+
+    navigate_cache:NavigateCache = field(default_factory=NavigateCache)
+    """
+    Navigate response cache (e.g. music service station lists) for the device, shared
+    by the media browser and services.
+    """
+
+    library_index:dict[str, tuple[tuple, Any]] = field(default_factory=dict)
+    """
+    Media browser library index cache, keyed by library index media content type.  Each 
+    entry is a tuple of the key (title and hidden media types) the index was built for,
+    and the BrowseMedia index itself.
+    """
+
     @property
     def OptionSpotifyMediaPlayerEntityId(self) -> str | None:
         """
@@ -59,3 +109,12 @@ class InstanceDataSoundTouchPlus:
         Translate); otherwise, use the specified service.
         """
         return self.options.get(CONF_OPTION_TTS_FORCE_GOOGLE_TRANSLATE, False)
+
+    @property
+    def OptionZoneMasterFailover(self) -> bool | None:
+        """
+        Zone master failover option.  If True and the device is the master of a zone, then
+        a surviving zone member is promoted to master (and the zone re-formed with the last
+        known content) when the device is lost; otherwise, the zone members are left idle.
+        """
+        return self.options.get(CONF_OPTION_ZONE_MASTER_FAILOVER, False)
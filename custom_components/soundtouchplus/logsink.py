@@ -0,0 +1,232 @@
+"""
+Buffered trace log sink for the SoundTouchPlus component.
+
+Heavy SmartInspect trace entries (xml, pretty-printed dictionaries, object dumps)
+are serialized and written on a background worker thread, so that enabling verbose
+tracing does not add latency to websocket callbacks or event loop processing.
+"""
+from collections import deque
+from collections.abc import Callable
+import threading
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+TRACE_SINK_MAX_ENTRIES:int = 1000
+""" Maximum number of trace entries that can be queued before the drop policy is applied. """
+
+
+class TraceLogSink:
+    """
+    Bounded queue-backed trace log sink.
+
+    Trace entries are queued by the caller and processed in order by a single
+    background worker thread.  If the queue is full, then the drop policy is applied:
+    either the oldest queued entry is discarded to make room for the new entry
+    (default), or the new entry is discarded.  Either way the `DroppedCount` is
+    incremented, and a warning is logged by the worker once the backlog clears.
+
+    Entries are only queued if the target session is logging at the requested level,
+    so the sink adds no overhead when tracing is disabled.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, maxEntries:int=TRACE_SINK_MAX_ENTRIES, dropOldest:bool=True) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxEntries (int):
+                Maximum number of trace entries that can be queued.
+            dropOldest (bool):
+                True to discard the oldest queued entry when the queue is full;
+                False to discard the new entry instead.
+        """
+        self._condition:threading.Condition = threading.Condition()
+        self._droppedCount:int = 0
+        self._droppedCountReported:int = 0
+        self._dropOldest:bool = dropOldest
+        self._maxEntries:int = max(1, maxEntries)
+        self._queue:deque = deque()
+        self._stopRequested:bool = False
+        self._worker:threading.Thread = None
+
+
+    @property
+    def DroppedCount(self) -> int:
+        """
+        Number of trace entries that were discarded due to the queue being full.
+        """
+        return self._droppedCount
+
+
+    @property
+    def DropOldest(self) -> bool:
+        """
+        True if the oldest queued entry is discarded when the queue is full;
+        False if the new entry is discarded instead.
+        """
+        return self._dropOldest
+
+
+    @property
+    def MaxEntries(self) -> int:
+        """
+        Maximum number of trace entries that can be queued.
+        """
+        return self._maxEntries
+
+
+    @property
+    def QueuedCount(self) -> int:
+        """
+        Number of trace entries that are currently queued for processing.
+        """
+        return len(self._queue)
+
+
+    def LogArray(self, session:SISession, level:SILevel, title:str, value:list, **kwargs) -> None:
+        """
+        Queues a `LogArray` trace entry.  A shallow copy of the list is queued.
+        """
+        if session.IsOn(level):
+            self._Enqueue(session.LogArray, (level, title, list(value) if value is not None else None), kwargs)
+
+
+    def LogDictionary(self, session:SISession, level:SILevel, title:str, value:dict, prettyPrint:bool=False, **kwargs) -> None:
+        """
+        Queues a `LogDictionary` trace entry.  A shallow copy of the dictionary is queued.
+        """
+        if session.IsOn(level):
+            kwargs["prettyPrint"] = prettyPrint
+            self._Enqueue(session.LogDictionary, (level, title, dict(value) if value is not None else None), kwargs)
+
+
+    def LogObject(self, session:SISession, level:SILevel, title:str, value:object, **kwargs) -> None:
+        """
+        Queues a `LogObject` trace entry.
+
+        The object is serialized by the worker thread, so it should not be modified
+        by the caller after it is queued.
+        """
+        if session.IsOn(level):
+            self._Enqueue(session.LogObject, (level, title, value), kwargs)
+
+
+    def LogXml(self, session:SISession, level:SILevel, title:str, value:str, **kwargs) -> None:
+        """
+        Queues a `LogXml` trace entry for an xml string.
+        """
+        if session.IsOn(level):
+            self._Enqueue(session.LogXml, (level, title, value), kwargs)
+
+
+    def LogXmlElement(self, session:SISession, level:SILevel, title:str, element:Element, **kwargs) -> None:
+        """
+        Queues a `LogXml` trace entry for an xml element.
+
+        The element is serialized and pretty-printed by the worker thread; the
+        element itself is not modified.
+        """
+        if session.IsOn(level) and (element is not None):
+            self._Enqueue(self._LogXmlElement, (session, level, title, element), kwargs)
+
+
+    def Stop(self, timeout:float=5.0) -> None:
+        """
+        Processes any queued entries, and stops the worker thread.
+
+        Args:
+            timeout (float):
+                Maximum number of seconds to wait for the worker thread to finish.
+
+        This method blocks, so it should not be called from the event loop.
+        """
+        with self._condition:
+            self._stopRequested = True
+            worker = self._worker
+            self._condition.notify_all()
+
+        if worker is not None:
+            worker.join(timeout)
+
+        with self._condition:
+            self._worker = None
+            self._stopRequested = False
+
+
+    def _Enqueue(self, func:Callable, args:tuple, kwargs:dict) -> None:
+        """
+        Adds an entry to the queue, applying the drop policy if the queue is full.
+        """
+        with self._condition:
+
+            if len(self._queue) >= self._maxEntries:
+                self._droppedCount += 1
+                if not self._dropOldest:
+                    return
+                self._queue.popleft()
+
+            self._queue.append((func, args, kwargs))
+
+            # start the worker on first use (or if it was stopped).
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._WorkerLoop, name="SoundTouchPlusTraceLogSink", daemon=True)
+                self._worker.start()
+
+            self._condition.notify()
+
+
+    @staticmethod
+    def _LogXmlElement(session:SISession, level:SILevel, title:str, element:Element, **kwargs) -> None:
+        """
+        Serializes an xml element to a pretty-printed string and logs it.
+
+        The element is re-parsed prior to indenting, as `ElementTree.indent` modifies
+        the element in place and the caller's element may still be in use.
+        """
+        xmlCopy:Element = ElementTree.fromstring(ElementTree.tostring(element, encoding="unicode"))
+        ElementTree.indent(xmlCopy)
+        session.LogXml(level, title, ElementTree.tostring(xmlCopy, encoding="unicode"), **kwargs)
+
+
+    def _WorkerLoop(self) -> None:
+        """
+        Worker thread processing loop.
+        """
+        while True:
+
+            with self._condition:
+                while (len(self._queue) == 0) and (not self._stopRequested):
+                    self._condition.wait()
+                if len(self._queue) == 0:
+                    return
+                func, args, kwargs = self._queue.popleft()
+                isBacklogCleared:bool = (len(self._queue) == 0)
+                droppedCount:int = self._droppedCount
+
+            try:
+                func(*args, **kwargs)
+            except Exception as ex:
+                # never let a trace failure kill the worker.
+                _logsi.LogVerbose("TraceLogSink could not process trace entry: %s" % str(ex))
+
+            # report any dropped entries once the backlog has cleared.
+            if isBacklogCleared and (droppedCount != self._droppedCountReported):
+                _logsi.LogWarning("TraceLogSink dropped %d trace entries (%d total) as the queue was full (maxEntries=%d, dropOldest=%s)" % (droppedCount - self._droppedCountReported, droppedCount, self._maxEntries, self._dropOldest))
+                self._droppedCountReported = droppedCount
+
+
+TRACE_SINK:TraceLogSink = TraceLogSink()
+"""
+Shared trace log sink instance used by all component modules.
+"""
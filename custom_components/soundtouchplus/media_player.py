@@ -19,16 +19,18 @@ from bosesoundtouchapi.uri import *
 from bosesoundtouchapi.models import *
 from bosesoundtouchapi.ws import SoundTouchWebSocket
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import datetime as dt
 from functools import partial
 import logging
 from os import path
 import re
+import socket
+import threading
 import time
 from typing import Any
 import urllib.parse
 from urllib.parse import unquote
-from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
 from homeassistant.components import media_source
@@ -47,7 +49,8 @@ from homeassistant.components.media_player import (
     async_process_play_media_url
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EVENT_COMPONENT_LOADED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, IntegrationError, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import (
@@ -57,15 +60,17 @@ from homeassistant.helpers.device_registry import (
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity_registry import EntityRegistry, RegistryEntry
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
 from homeassistant.util.dt import utcnow
 
 # our package imports.
+from .artworkcache import ARTWORK_CACHE
 from .browse_media import (
     async_browse_media_library_index, 
+    async_browse_media_node, 
     BrowsableMedia,
-    browse_media_node, 
-    deserialize_object, 
-    CONTENT_ITEM_BASE64, 
+    resolve_content_item_id, 
     LIBRARY_MAP,
     SPOTIFY_LIBRARY_MAP,
 )
@@ -73,10 +78,30 @@ from .const import (
     CONF_OPTION_RECENTS_CACHE_MAX_ITEMS,
     CONF_OPTION_SOURCE_LIST, 
     DOMAIN, 
-    DOMAIN_SPOTIFYPLUS
+    DOMAIN_SPOTIFYPLUS,
+    DEFAULT_TTS_URL,
+    SNAPSHOT_RESTORE_MODE_CHANGES,
+    SNAPSHOT_RESTORE_MODE_FULL,
+    ZONE_VOLUME_MODE_OFFSET,
+    ZONE_VOLUME_MODE_SCALE,
+    ZONE_VOLUME_MODE_SET,
 )
 from .instancedata_soundtouchplus import InstanceDataSoundTouchPlus
+from .logsink import TRACE_SINK
+from .mediasearchindex import (
+    MEDIA_SEARCH_PRESETS,
+    MEDIA_SEARCH_RECENTS,
+    MEDIA_SEARCH_RECENTS_CACHE,
+    MediaSearchIndex,
+)
+from .navigatecache import NAVIGATE_CATEGORY_STATIONS
+from .playhistoryindex import PLAY_HISTORY_INDEX
+from .presetlayout import StorePresetLayout
 from .stappmessages import STAppMessages
+from .storedmusicindex import StoredMusicIndex
+from .ttscache import TTS_CACHE
+from .volumecoalescer import VolumeCoalescer
+from .zonegraph import ZONE_GRAPH
 
 # get smartinspect logger reference; create a new session for this module name.
 from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIColors, SIMethodParmListContext
@@ -87,6 +112,7 @@ _logsi.SystemLogger = logging.getLogger(__name__)
 
 # our extra state attribute names.
 ATTR_SOUNDTOUCHPLUS_DEVICE_TYPE = "stp_device_type"
+ATTR_SOUNDTOUCHPLUS_HANDOFF_LATENCY = "soundtouchplus_handoff_latency"
 ATTR_SOUNDTOUCHPLUS_NOWPLAYING_ISADVERTISEMENT = "soundtouchplus_nowplaying_isadvertisement"
 ATTR_SOUNDTOUCHPLUS_NOWPLAYING_ISFAVORITE = "soundtouchplus_nowplaying_isfavorite"
 ATTR_SOUNDTOUCHPLUS_NOWPLAYING_IMAGE_URL = "stp_nowplaying_image_url"
@@ -106,6 +132,7 @@ ATTR_SOUNDTOUCHPLUS_TONE_BASS_LEVEL_RANGE = "soundtouchplus_tone_bass_level_rang
 ATTR_SOUNDTOUCHPLUS_TONE_TREBLE_LEVEL = "soundtouchplus_tone_treble_level"
 ATTR_SOUNDTOUCHPLUS_TONE_TREBLE_LEVEL_RANGE = "soundtouchplus_tone_treble_level_range"
 ATTR_SOUNDTOUCHPLUS_WEBSOCKETS_ENABLED = "soundtouchplus_websockets_enabled"
+ATTR_SOUNDTOUCHPLUS_ZONE_FAILOVER_SECONDS = "soundtouchplus_zone_failover_seconds"
 ATTRVALUE_NOT_CAPABLE = "not capable"
 
 # constants used for HA media radio browser support.
@@ -118,6 +145,39 @@ BOSETYPE_PLAY_URL_DLNA = "bosetype=play_url_dlna"
 BOSETYPE_RESOLVED = "bosetype=resolved"
 MEDIA_SOURCE_RADIO_BROWSER = "media-source://radio_browser/"
 
+DEVICE_REQUEST_MAX_WORKERS:int = 16
+""" Max number of device requests that services issue concurrently (across all media players). """
+
+PLAY_HANDOFF_PLAYING_TIMEOUT:float = 15.0
+""" Max number of seconds to wait for the TO player of a play handoff to report that it is playing. """
+
+PLAY_HANDOFF_POLL_INTERVAL:float = 0.25
+""" Number of seconds between checks of the TO player status during a play handoff. """
+
+PRESET_STORE_BULK_EVENT_TIMEOUT:float = 10.0
+""" Max number of seconds to defer presets state updates while a bulk preset store is in progress. """
+
+ZONE_BUILD_CONFIRM_INTERVAL:float = 5.0
+""" Number of seconds to wait for zone members to confirm that they joined, before the missing members are retried. """
+
+ZONE_BUILD_POLL_INTERVAL:float = 1.0
+""" Number of seconds between zone status queries of zone build devices that do not receive websocket events. """
+
+ZONE_BUILD_TIMEOUT:float = 20.0
+""" Default max number of seconds that a zone build waits for all members to join. """
+
+ZONE_FAILOVER_BUILD_TIMEOUT:float = 8.0
+""" Max number of seconds that a zone master failover waits for the surviving members to join the new master. """
+
+ZONE_FAILOVER_PROBE_TIMEOUT:float = 1.0
+""" Number of seconds to wait for a lost zone master to accept a connection before it is considered lost. """
+
+_DEVICE_REQUEST_EXECUTOR:ThreadPoolExecutor = ThreadPoolExecutor(max_workers=DEVICE_REQUEST_MAX_WORKERS, thread_name_prefix="SoundTouchPlusDeviceRequest")
+"""
+Executor shared by all media players for device requests that a service issues
+concurrently (e.g. to every device of a zone); threads are only started when needed.
+"""
+
 
 async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry, async_add_entities:AddEntitiesCallback) -> None:
     """
@@ -200,11 +260,20 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             self._client:SoundTouchClient = data.client
             self._socket:SoundTouchWebSocket = data.socket
             self.data:InstanceDataSoundTouchPlus = data
+            self.soundtouchplus_handoff_latency:float = None
             self.soundtouchplus_presets_lastupdated:int = 0
+            self.soundtouchplus_presets_events_pending:int = 0
+            self.soundtouchplus_presets_events_deadline:float = 0
+            self._presetsEventsDeadlineCancel:CALLBACK_TYPE = None
             self.soundtouchplus_recents_lastupdated:int = 0
             self.soundtouchplus_recents_cache_lastupdated:int = 0
             self.recents_cache_max_items:int = 20
             self.websocket_error_count:int = 0
+            self.soundtouchplus_zone_failover_seconds:float = None
+            self.zone_snapshot:dict = None
+            self._zoneFailoverLock:threading.Lock = threading.Lock()
+            self._zoneFailoverActive:bool = False
+            self._volumeCoalescer:VolumeCoalescer = VolumeCoalescer(self._client.SetVolumeLevel, self._OnVolumeWritten)
 
             # initialize base class attributes (MediaPlayerEntity).
             self._attr_icon = "mdi:speaker"
@@ -305,6 +374,7 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         # build list of our extra state attributes to return to HA UI.
         attributes = {}
         attributes[ATTR_SOUNDTOUCHPLUS_DEVICE_TYPE] = self._client.Device.DeviceType
+        attributes[ATTR_SOUNDTOUCHPLUS_HANDOFF_LATENCY] = self.soundtouchplus_handoff_latency
         attributes[ATTR_SOUNDTOUCHPLUS_NOWPLAYING_ISADVERTISEMENT] = False
         attributes[ATTR_SOUNDTOUCHPLUS_NOWPLAYING_ISFAVORITE] = False
         attributes[ATTR_SOUNDTOUCHPLUS_NOWPLAYING_IMAGE_URL] = self.media_image_url
@@ -315,6 +385,7 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         attributes[ATTR_SOUNDTOUCHPLUS_RECENTS_CACHE_ENABLED] = self._client.RecentListCacheEnabled
         attributes[ATTR_SOUNDTOUCHPLUS_RECENTS_CACHE_MAX_ITEMS] = self._client.RecentListCacheMaxItems
         attributes[ATTR_SOUNDTOUCHPLUS_WEBSOCKETS_ENABLED] = (self._socket is not None)
+        attributes[ATTR_SOUNDTOUCHPLUS_ZONE_FAILOVER_SECONDS] = self.soundtouchplus_zone_failover_seconds
         attributes[ATTR_SOUNDTOUCHPLUS_POLLING_ENABLED] = (self._attr_should_poll)
         
         if SoundTouchNodes.audiodspcontrols.Path in self._client.ConfigurationCache:
@@ -350,7 +421,7 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
     @property
     def group_members(self) -> list[str] | None:
         """ List of members which are currently grouped together. """
-        return self._attr_group_members
+        return ZONE_GRAPH.GetGroupEntityIds(self._client.Device.DeviceId)
 
 
     @property
@@ -409,6 +480,16 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         return None
 
 
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """
+        Fetch media image of current playing media.
+
+        Artwork is served from the shared artwork cache, so that multiple frontends (and
+        state changes) do not refetch the same image from the device or art host.
+        """
+        return await ARTWORK_CACHE.async_get(self.hass, self.media_image_url, self._async_fetch_image)
+
+
     @property
     def media_title(self):
         """ Title of current playing media. """
@@ -611,7 +692,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             parms['volume'] = volume
             _logsi.LogDictionary(SILevel.Verbose, STAppMessages.MSG_MEDIAPLAYER_SERVICE_WITH_PARMS % (self.name, "set_volume_level", str(parms)), parms)
             
-        self._client.SetVolumeLevel(int(volume * 100))
+        # slider changes are coalesced; only the latest level is written if a write is in progress.
+        self._volumeCoalescer.Set(int(volume * 100))
 
 
     def turn_off(self) -> None:
@@ -679,10 +761,10 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LogVerbose("'%s': MediaPlayer is getting zone status" % self.name)
             config:Zone = self._client.GetZoneStatus(self._attr_should_poll)
 
-            # if we are polling, then we need to rebuild the group_members in case it changes;
-            # otherwise, the group_members are rebuilt in the zoneupdated event.
+            # if we are polling, then we need to update the zone graph in case it changes;
+            # otherwise, the zone graph is updated in the zoneupdated event.
             if self._attr_should_poll == True:
-                self._attr_group_members = self._BuildZoneMemberEntityIdList(config)
+                self._UpdateZoneGraph(config)
                 
             # does this device support audiodspcontrols?
             if SoundTouchNodes.audiodspcontrols.Path in self._client.Device.SupportedUris:
@@ -737,18 +819,10 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
 
             # the master zone is the entity_id of the media_player that received the join_players request.
             # group_members is a list of entity_id's to add to the master zone.
-            masterZone:Zone = Zone(self._client.Device.DeviceId, self._client.Device.Host, True) # <- master
-
-            # create zone members from specified list of entity id's.
-            for entity_id in group_members:
-                entity_client:SoundTouchClient = self._FindClientInstanceFromEntityId(entity_id, serviceName)
-                if (entity_client is not None):
-                    # we only need to add group members that are NOT the master.
-                    if entity_client.Device.DeviceId != self._client.Device.DeviceId:
-                        masterZone.AddMember(ZoneMember(entity_client.Device.Host, entity_client.Device.DeviceId)) # <- member
-
-            # create a new master zone configuration on the device.
-            self._client.CreateZone(masterZone)
+            # create the zone; member confirmations (and retries) are processed in the
+            # background, so that the caller does not wait for them (use the zone_build
+            # service to wait).
+            self._BuildZone(group_members, ZONE_BUILD_TIMEOUT, False)
 
         except Exception as ex:
             
@@ -778,12 +852,19 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             # we will let the zoneUpdated event take care of updating HA state, as ALL
             # players receive a zoneUpdated event when zone members change.
 
-            # get master zone status.
-            # we do this to retrieve the master zone device id.
-            masterZone:Zone = self._client.GetZoneStatus(refresh=True)
+            # get master zone device id from the zone graph; only query the device
+            # if the graph has not received this device's zone status yet.
+            deviceId:str = self._client.Device.DeviceId
+            if ZONE_GRAPH.IsKnown(deviceId):
+                masterDeviceId:str = ZONE_GRAPH.GetMasterDeviceId(deviceId)
+                if masterDeviceId is None:
+                    _logsi.LogVerbose("'%s': MediaPlayer is not in a zone - nothing to unjoin" % self.name)
+                    return
+            else:
+                masterDeviceId:str = self._client.GetZoneStatus(refresh=True).MasterDeviceId
 
             # if we are the master, then we will remove the zone.
-            if masterZone.MasterDeviceId == self._client.Device.DeviceId:
+            if masterDeviceId == deviceId:
                 _logsi.LogVerbose("'%s': MediaPlayer is the Master zone - removing zone" % self.name)
                 self._client.RemoveZone()
             else:
@@ -949,13 +1030,11 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                 if announce:
                     announceValue = "Announcement"
 
-            # was a content item in base64 encoded format supplied?  
+            # was a content item id supplied?  
             # this would be coming from a browse media selection.
-            if media_id is not None and media_id.startswith(CONTENT_ITEM_BASE64):
+            contentItem:ContentItem = resolve_content_item_id(media_id)
+            if contentItem is not None:
 
-                # drop the eye-ctacher prefix before we deserialize.
-                media_id = media_id[len(CONTENT_ITEM_BASE64):]
-                contentItem:ContentItem = deserialize_object(media_id)
                 _logsi.LogObject(SILevel.Verbose, "'%s': MediaPlayer is playing media from %s" % (self.name, contentItem.ToString()), contentItem, excludeNonPublic=True)
                 self._client.PlayContentItem(contentItem)
                 
@@ -1222,6 +1301,9 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         if (args != None):
             _logsi.LogVerbose("'%s': MediaPlayer client device websocket close event: (%s) %s" % (self.name, str(statCode), str(args)), colorValue=SIColors.Coral)
 
+        # if we are a zone master then we may have been lost.
+        self._StartZoneMasterFailover("websocket close")
+
 
     @callback
     def _OnSoundTouchWebSocketErrorEvent(self, client:SoundTouchClient, ex:Exception) -> None:
@@ -1233,6 +1315,10 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             if (self.websocket_error_count %60 == 0) or (self.websocket_error_count == 1):
                 _logsi.LogError("'%s': MediaPlayer client device websocket error event - count=%d: (%s) %s" % (self.name, self.websocket_error_count, str(type(ex)), str(ex)), colorValue=SIColors.Coral)
 
+            # if we are a zone master then we may have been lost; this must be done before the
+            # nowPlayingStatus is reset, as the zone is re-formed with the last known content.
+            self._StartZoneMasterFailover("websocket error")
+
             # at this point we will assume that the websocket connection is lost or in an unusable state.
             # this can happen when the SoundTouch device loses power or network connectivity.
             
@@ -1240,6 +1326,10 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LogVerbose("'%s': MediaPlayer will now enable polling of the device for updates going forward, until websocket processing can be restarted" % self.name, colorValue=SIColors.Coral)
             self._attr_should_poll = True
             
+            # clear the media browser cache, as presets / recents events could be missed while
+            # websocket notifications are down.
+            self.data.browse_cache.clear()
+
             # reset nowPlayingStatus, which will drive a MediaPlayerState.IDLE state.
             _logsi.LogVerbose("'%s': MediaPlayer is resetting nowPlayingStatus to force an IDLE state of the media player" % self.name, colorValue=SIColors.Coral)
             if SoundTouchNodes.nowPlaying.Path in self._client.ConfigurationCache:
@@ -1263,10 +1353,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
     def _OnSoundTouchInfoEvent(self, client:SoundTouchClient, args:Element) -> None:
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # inform Home Assistant of the status update.
             self.update()
@@ -1279,10 +1367,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # create configuration model from update event argument.
             config:AudioDspControls = AudioDspControls(root=args[0])
@@ -1310,10 +1396,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # create configuration model from update event argument and update the cache.
             config:AudioProductToneControls = AudioProductToneControls(root=args[0])
@@ -1331,10 +1415,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # create configuration model from update event argument and update the cache.
             if len(args) > 0:
@@ -1345,10 +1427,18 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                 # update nowplaying attributes.
                 self._UpdateNowPlayingData(config)
                 
+                # if media is playing, then record the play in the play history index.
+                if config.IsPlaying:
+                    PLAY_HISTORY_INDEX.RecordPlay(self._client.Device.DeviceId, self.name, config.ContentItem)
+
                 # if media is playing, then update the recently played cache lastupdated value,
-                # as the api could have added a new entry to the cache.
+                # as the api could have added a new entry to the cache; if it did, then queue 
+                # the entry (which the api places at the top of the cache) to the history store.
                 if config.IsPlaying:
-                    self.soundtouchplus_recents_cache_lastupdated = self._client.RecentListCache.LastUpdatedOn
+                    recentListCache:RecentList = self._client.RecentListCache
+                    if (recentListCache.LastUpdatedOn != self.soundtouchplus_recents_cache_lastupdated) and (len(recentListCache.Recents) > 0):
+                        self.data.recents_store.Add(recentListCache.Recents[0])
+                    self.soundtouchplus_recents_cache_lastupdated = recentListCache.LastUpdatedOn
 
             # inform Home Assistant of the status update.
             self.schedule_update_ha_state(force_refresh=False)
@@ -1364,10 +1454,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # create configuration model from update event argument and update the cache.
             if len(args) > 0:
@@ -1375,6 +1463,11 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                 client.ConfigurationCache[SoundTouchNodes.nowSelection.Path] = config
                 _logsi.LogVerbose("'%s': MediaPlayer NowSelectionUpdated updated: %s" % (self.name, config.ToString()))
 
+                # if stations are cached for the selected source then refresh them, as the
+                # selection may have added a station (e.g. a new Pandora station).
+                if (config.Source is not None) and (self.data.navigate_cache.IsCached(config.Source, NAVIGATE_CATEGORY_STATIONS)):
+                    self.data.navigate_cache.Invalidate(config.Source, NAVIGATE_CATEGORY_STATIONS)
+
                 # is this a "play_url_dlna" redirect?  if so, then redirect it.
                 # this allows prefix content to be played using the local DLNA server, as it would
                 # not normally be playable using the "LOCAL_INTERNET_RADIO" source.
@@ -1399,10 +1492,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # create configuration model from update event argument and update the cache.
             if len(args) > 0:
@@ -1410,12 +1501,57 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             else:
                 config:PresetList = PresetList()
             client.ConfigurationCache[SoundTouchNodes.presets.Path] = config
+            self.soundtouchplus_presets_lastupdated = config.LastUpdatedOn
+
+            # if a bulk preset store is in progress, then defer the state update until
+            # the event for the last preset write arrives (or the deadline passes).
+            if self.soundtouchplus_presets_events_pending > 0:
+                self.soundtouchplus_presets_events_pending -= 1
+                if (self.soundtouchplus_presets_events_pending > 0) and (time.monotonic() < self.soundtouchplus_presets_events_deadline):
+                    _logsi.LogVerbose("'%s': MediaPlayer presets state update deferred (%d preset events pending)" % (self.name, self.soundtouchplus_presets_events_pending))
+                    return
+                self.soundtouchplus_presets_events_pending = 0
 
             # inform Home Assistant of the status update.
-            self.soundtouchplus_presets_lastupdated = config.LastUpdatedOn
             self.schedule_update_ha_state(force_refresh=False)
 
 
+    def _DeferPresetsEvents(self, count:int) -> None:
+        """
+        Defers presets state updates until the presetsUpdated events of a number of preset
+        writes have arrived (or the deadline passes); events are only received if
+        websockets are enabled for the device.
+        """
+        if (count == 0) or (self._socket is None):
+            return
+        self.soundtouchplus_presets_events_pending += count
+        self.soundtouchplus_presets_events_deadline = time.monotonic() + PRESET_STORE_BULK_EVENT_TIMEOUT
+        self.hass.add_job(self._StartPresetsEventsDeadline)
+
+
+    @callback
+    def _StartPresetsEventsDeadline(self) -> None:
+        """
+        Starts (or restarts) the timer that ends a deferral of presets state updates, in
+        case the presetsUpdated event of the last preset write is never received.
+        """
+        if self._presetsEventsDeadlineCancel is not None:
+            self._presetsEventsDeadlineCancel()
+        self._presetsEventsDeadlineCancel = async_call_later(self.hass, PRESET_STORE_BULK_EVENT_TIMEOUT, self._OnPresetsEventsDeadline)
+
+
+    @callback
+    def _OnPresetsEventsDeadline(self, now) -> None:
+        """
+        Ends a deferral of presets state updates when it's deadline passes.
+        """
+        self._presetsEventsDeadlineCancel = None
+        if self.soundtouchplus_presets_events_pending > 0:
+            _logsi.LogVerbose("'%s': MediaPlayer presets state update deadline passed (%d preset events not received)" % (self.name, self.soundtouchplus_presets_events_pending))
+            self.soundtouchplus_presets_events_pending = 0
+            self.async_write_ha_state()
+
+
     @callback
     def _OnSoundTouchUpdateEvent_recentsUpdated(self, client:SoundTouchClient, args:Element) -> None:
         """
@@ -1423,10 +1559,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # create configuration model from update event argument and update the cache.
             if len(args) > 0:
@@ -1435,6 +1569,12 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                 config:RecentList = RecentList()
             client.ConfigurationCache[SoundTouchNodes.recents.Path] = config
 
+            # record recently played items in the play history index; plays that were 
+            # already recorded from now playing events are not counted again.
+            recent:Recent
+            for recent in config.Recents:
+                PLAY_HISTORY_INDEX.RecordPlay(self._client.Device.DeviceId, self.name, recent.ContentItem, recent.CreatedOn, recent.SourceTitle)
+
             # inform Home Assistant of the status update.
             self.soundtouchplus_recents_lastupdated = config.LastUpdatedOn
             self.schedule_update_ha_state(force_refresh=False)
@@ -1447,15 +1587,16 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # refresh the list of sources since the sourcesUpdated event does not supply them.
             config:SourceList = self._client.GetSourceList(True)
             _logsi.LogVerbose("'%s': sources (source_list) updated = %s" % (self.name, config.ToString()))
 
+            # refresh cached station lists, as source accounts may have changed.
+            self.data.navigate_cache.Invalidate(category=NAVIGATE_CATEGORY_STATIONS)
+
             # inform Home Assistant of the status update.
             self.schedule_update_ha_state(force_refresh=False)
 
@@ -1467,20 +1608,36 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # create configuration model from update event argument and update the cache.
+            previous:Volume = client.ConfigurationCache.get(SoundTouchNodes.volume.Path, None)
             config:Volume = Volume(root=args[0])
             client.ConfigurationCache[SoundTouchNodes.volume.Path] = config
             _logsi.LogVerbose("'%s': MediaPlayer volume updated: %s" % (self.name, config.ToString()))
 
+            # if a coalesced volume write is in progress, then the state update is issued once
+            # the latest level is written; we also skip updates that did not change the volume.
+            if self._volumeCoalescer.IsWriting:
+                return
+            if (previous is not None) and (previous.Actual == config.Actual) and (previous.IsMuted == config.IsMuted):
+                return
+
             # inform Home Assistant of the status update.
             self.schedule_update_ha_state(force_refresh=False)
 
 
+    def _OnVolumeWritten(self, level:int) -> None:
+        """
+        Updates the volume cache and informs Home Assistant of the status update, once the
+        volume coalescer has written the latest requested volume level.
+        """
+        previous:Volume = self._client.ConfigurationCache.get(SoundTouchNodes.volume.Path, None)
+        self._client.ConfigurationCache[SoundTouchNodes.volume.Path] = Volume(level, level, previous.IsMuted if previous is not None else None)
+        self.schedule_update_ha_state(force_refresh=False)
+
+
     @callback
     def _OnSoundTouchUpdateEvent_zoneUpdated(self, client:SoundTouchClient, args:Element) -> None:
         """
@@ -1488,18 +1645,15 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         """
         if (args != None):
 
-            if (_logsi.IsOn(SILevel.Verbose)):
-                ElementTree.indent(args)  # for pretty printing
-                argsEncoded = ElementTree.tostring(args, encoding="unicode")
-                _logsi.LogXml(SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), argsEncoded)
+            # trace (xml is serialized by the trace sink worker thread).
+            TRACE_SINK.LogXmlElement(_logsi, SILevel.Verbose, "'%s': MediaPlayer client device event notification - %s" % (self.name, args.tag), args)
 
             # create configuration model from update event argument and update the cache.
             config:Zone = Zone(root=args[0])
             client.ConfigurationCache[SoundTouchNodes.getZone.Path] = config
 
-            # update group_members state.
-            self._attr_group_members = self._BuildZoneMemberEntityIdList(config)
-            _logsi.LogArray(SILevel.Verbose, "'%s': MediaPlayer zone updated - group_members list" % self.name, self._attr_group_members)
+            # update the zone graph (and the group_members state of other zone devices).
+            self._UpdateZoneGraph(config)
 
             # inform Home Assistant of the status update.
             self.schedule_update_ha_state(force_refresh=False)
@@ -1509,27 +1663,131 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
     # Helpfer functions
     # -----------------------------------------------------------------------------------
 
-    def _BuildZoneMemberEntityIdList(self, config:Zone) -> list:
+    def _BuildZone(self, group_members:list[str], timeout:float, wait:bool=True) -> dict:
         """
-        Builds a HA "_attr_group_members" state value from a Zone configuration object.
-        
+        Builds a zone with this device as master, and waits for the members to confirm
+        that they joined.
+
         Args:
-            config (Zone):
-                A Zone configuration object that contains zone member details.
-                
+            group_members (list[str]):
+                Entity id's of the zone members; this device is ignored if it is included.
+            timeout (float):
+                Max number of seconds to wait for all members to join.
+            wait (bool):
+                True to wait for the members to confirm that they joined; otherwise, False
+                to return once the zone is created, and process the confirmations (and 
+                retries) in the background.
+
         Returns:
-            A list object of HA entity id's that represent zone members.
-        """
-        # build group_members state from Zone configuration.
-        members:list[str] = []
-        member:ZoneMember
-        for member in config.Members:
-            entity_id:str = self._FindEntityIdFromClientDeviceId(member.DeviceId, "zoneUpdated")
-            if (entity_id is not None):
-                members.append(entity_id)
-                
-        _logsi.LogArray(SILevel.Verbose, "'%s': MediaPlayer zone group_members entity list was refreshed" % self.name, members)
-        return members
+            A dictionary of the zone build results: `Joined` (entity id's of the members
+            that joined, and the number of seconds each took), `Missing` (entity id's of 
+            the members that did not join), `Attempts`, and `ElapsedSeconds`; None if
+            `wait` is False.
+
+        The zone is created with all members in one request.  Members that have not confirmed
+        (via their zoneUpdated event) within `ZONE_BUILD_CONFIRM_INTERVAL` seconds are 
+        retried concurrently with add member requests, until all members have joined or the
+        timeout is reached.  Devices that do not receive websocket events are polled for 
+        their zone status.
+        """
+        masterId:str = self._client.Device.DeviceId
+        startTime:float = time.monotonic()
+        deadline:float = startTime + timeout
+
+        # resolve the member instances; we only need members that are NOT the master.
+        members:dict[str, InstanceDataSoundTouchPlus] = {}
+        data:InstanceDataSoundTouchPlus = None
+        for entity_id in group_members:
+            for data in self.hass.data[DOMAIN].values():
+                if (data.media_player.entity_id == entity_id) and (data.client.Device.DeviceId != masterId):
+                    members[data.client.Device.DeviceId] = data
+                    break
+            else:
+                if entity_id != self.entity_id:
+                    _logsi.LogError("'%s': MediaPlayer could not resolve entity id value of '%s' to a SoundTouch client instance for the zone build" % (self.name, str(entity_id)))
+        if len(members) == 0:
+            raise SoundTouchError("No zone members were resolved from entity id's: %s" % ", ".join(group_members))
+
+        # if we are already the master of a zone with the same members, then we are done.
+        attempts:int = 0
+        groupDeviceIds:list[str] = ZONE_GRAPH.GetGroupDeviceIds(masterId)
+        if (groupDeviceIds[:1] == [masterId]) and (set(groupDeviceIds[1:]) == set(members.keys())):
+            _logsi.LogVerbose("'%s': MediaPlayer is already the Master zone of the group members - zone not changed" % self.name)
+        else:
+            attempts = 1
+            masterZone:Zone = Zone(masterId, self._client.Device.Host, True) # <- master
+            for data in members.values():
+                masterZone.AddMember(ZoneMember(data.client.Device.Host, data.client.Device.DeviceId)) # <- member
+            # confirmations of an earlier zone of the members must not count for this zone.
+            ZONE_GRAPH.ClearConfirmations(list(members))
+            self._client.CreateZone(masterZone, 0)
+
+        if not wait:
+            self.hass.add_job(self._ConfirmZoneMembers, members, startTime, deadline, attempts)
+            return None
+        return self._ConfirmZoneMembers(members, startTime, deadline, attempts)
+
+
+    def _ConfirmZoneMembers(self, members:dict[str, InstanceDataSoundTouchPlus], startTime:float, deadline:float, attempts:int) -> dict:
+        """
+        Waits for the members of a zone build to confirm that they joined, retrying the
+        missing members until all members have joined or the deadline is reached.
+
+        Args:
+            members (dict[str, InstanceDataSoundTouchPlus]):
+                Instance data of the zone members, keyed by device id.
+            startTime (float):
+                Time (`time.monotonic`) that the zone build started.
+            deadline (float):
+                Time (`time.monotonic`) to stop waiting for the members to join.
+            attempts (int):
+                Number of zone change requests issued so far.
+
+        Returns:
+            A dictionary of the zone build results (see `_BuildZone`).
+        """
+        masterId:str = self._client.Device.DeviceId
+
+        while True:
+
+            # wait for the members to confirm that they joined.
+            confirmed:dict[str, float] = self._WaitForZoneMembers(members, min(deadline, time.monotonic() + ZONE_BUILD_CONFIRM_INTERVAL) - time.monotonic())
+            missing:list[str] = [deviceId for deviceId in members if deviceId not in confirmed]
+            if (len(missing) == 0) or (time.monotonic() >= deadline):
+                break
+
+            # retry the missing members concurrently; if no member joined, then the zone
+            # does not exist and has to be created again.
+            attempts += 1
+            _logsi.LogVerbose("'%s': MediaPlayer zone build is retrying %d missing member(s) (attempt %d)" % (self.name, len(missing), attempts))
+            if len(confirmed) == 0:
+                masterZone:Zone = Zone(masterId, self._client.Device.Host, True)
+                for deviceId in missing:
+                    masterZone.AddMember(ZoneMember(members[deviceId].client.Device.Host, deviceId))
+                try:
+                    self._client.CreateZone(masterZone, 0)
+                except SoundTouchError as ex:
+                    _logsi.LogWarning("'%s': MediaPlayer zone build could not create the zone: %s" % (self.name, ex.Message))
+            else:
+                futures:dict[str, Future] = {}
+                for deviceId in missing:
+                    futures[deviceId] = _DEVICE_REQUEST_EXECUTOR.submit(self._client.AddZoneMembers, [ZoneMember(members[deviceId].client.Device.Host, deviceId)], 0)
+                for deviceId, future in futures.items():
+                    try:
+                        future.result()
+                    except SoundTouchError as ex:
+                        _logsi.LogWarning("'%s': MediaPlayer zone build could not add member '%s': %s" % (self.name, members[deviceId].media_player.entity_id, ex.Message))
+
+        result:dict = {
+            "Joined": {members[deviceId].media_player.entity_id: round(max(0.0, confirmedOn - startTime), 3) for deviceId, confirmedOn in confirmed.items()},
+            "Missing": [members[deviceId].media_player.entity_id for deviceId in missing],
+            "Attempts": attempts,
+            "ElapsedSeconds": round(time.monotonic() - startTime, 3),
+        }
+        _logsi.LogDictionary(SILevel.Verbose, "'%s': MediaPlayer zone build results" % self.name, result, prettyPrint=True)
+        if len(result["Missing"]) > 0:
+            _logsi.LogWarning("'%s': MediaPlayer zone members did not join within %d seconds: %s" % (self.name, round(deadline - startTime), ", ".join(result["Missing"])))
+        return result
 
 
     def _FindClientInstanceFromEntityId(self, entity_id:str, serviceName:str) -> SoundTouchClient:
@@ -1638,6 +1896,373 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             return ""
 
 
+    def _RestoreSnapshotChanges(self, delay:int=5) -> int:
+        """
+        Restores the client snapshot settings, only issuing the commands that are needed
+        to return the device from it's current status to the snapshot status.
+
+        Args:
+            delay (int):
+                Time delay (in seconds) to wait for the playing content to change.
+
+        Returns:
+            The number of commands that were issued to the device.
+
+        The current status is taken from the configuration cache (which is maintained by
+        device update events), and only queried from the device if it is not cached.
+        """
+        client:SoundTouchClient = self.data.client
+        commands:int = 0
+
+        if SoundTouchNodes.nowPlaying.Path in client.SnapshotSettings:
+            status:NowPlayingStatus = client.SnapshotSettings[SoundTouchNodes.nowPlaying.Path]
+            currentStatus:NowPlayingStatus = client.ConfigurationCache.get(SoundTouchNodes.nowPlaying.Path, None)
+            if currentStatus is None:
+                currentStatus = client.GetNowPlayingStatus(True)
+
+            # is the snapshot content still selected?
+            isSameContent:bool = (currentStatus.Source == status.Source) \
+                and (currentStatus.ContentItem is not None) and (status.ContentItem is not None) \
+                and (currentStatus.ContentItem.Source == status.ContentItem.Source) \
+                and ((currentStatus.ContentItem.SourceAccount or "") == (status.ContentItem.SourceAccount or "")) \
+                and ((currentStatus.ContentItem.Location or "") == (status.ContentItem.Location or ""))
+
+            if not isSameContent:
+                # switch the input source if need be, waiting 2 seconds for the change to process.
+                if currentStatus.Source != status.Source:
+                    client.SelectSource(status.Source, status.ContentItem.SourceAccount, 2)
+                    commands += 1
+                client.SelectContentItem(status.ContentItem, delay)
+                commands += 1
+            elif (status.PlayStatus == PlayStatusTypes.Playing.value) and (currentStatus.PlayStatus == PlayStatusTypes.Paused.value):
+                # same content, but it was paused (e.g. by an announcement) - resume it.
+                client.MediaPlay()
+                commands += 1
+
+        if SoundTouchNodes.volume.Path in client.SnapshotSettings:
+            volume:Volume = client.SnapshotSettings[SoundTouchNodes.volume.Path]
+            currentVolume:Volume = client.ConfigurationCache.get(SoundTouchNodes.volume.Path, None)
+            if currentVolume is None:
+                currentVolume = client.GetVolume(True)
+
+            # set volume level also restores mute / unmute status.
+            if currentVolume.Actual != volume.Actual:
+                client.SetVolumeLevel(volume.Actual)
+                commands += 1
+            elif (volume.IsMuted is not None) and (currentVolume.IsMuted != volume.IsMuted):
+                client.Action(SoundTouchKeys.MUTE, KeyStates.Press)
+                commands += 1
+
+        _logsi.LogVerbose("'%s': MediaPlayer snapshot restored with %d device command(s)" % (self.name, commands))
+        return commands
+
+
+    def _RestoreZoneMemberSnapshot(self, data:InstanceDataSoundTouchPlus, settings:dict, isMaster:bool, restore_volume:bool, restore_mode:str) -> None:
+        """
+        Restores the snapshot settings of a zone snapshot device.
+
+        Args:
+            data (InstanceDataSoundTouchPlus):
+                Instance data of the device to restore.
+            settings (dict):
+                Snapshot settings of the device.
+            isMaster (bool):
+                True if the device is the zone master; otherwise, False.  Zone members
+                only restore their volume, as they play the master content once the zone
+                is rebuilt.
+            restore_volume (bool):
+                True to restore volume setting; otherwise, False to not change volume.
+            restore_mode (str):
+                `full` to replay every snapshot setting; otherwise, `changes` to only 
+                issue the commands needed to return to the snapshot.
+
+        The settings replace the in-memory snapshot of the device.
+        """
+        settings = dict(settings)
+        status:NowPlayingStatus = settings.get(SoundTouchNodes.nowPlaying.Path, None)
+        if (not isMaster) or (status is None) or (status.ContentItem is None):
+            settings.pop(SoundTouchNodes.nowPlaying.Path, None)
+        if not restore_volume:
+            settings.pop(SoundTouchNodes.volume.Path, None)
+
+        data.client.SnapshotSettings.clear()
+        data.client.SnapshotSettings.update(settings)
+        if restore_mode == SNAPSHOT_RESTORE_MODE_CHANGES:
+            data.media_player._RestoreSnapshotChanges()
+        else:
+            data.client.RestoreSnapshot()
+
+
+    @staticmethod
+    def _StoreZoneMemberSnapshot(client:SoundTouchClient) -> dict:
+        """
+        Returns the snapshot settings of a zone snapshot device, without changing the
+        in-memory snapshot of the device.
+
+        Args:
+            client (SoundTouchClient):
+                Client of the device to take a snapshot of.
+
+        Returns:
+            A snapshot settings dictionary (in `SoundTouchClient.SnapshotSettings` form).
+        """
+        return {
+            SoundTouchNodes.nowPlaying.Path: client.GetNowPlayingStatus(True),
+            SoundTouchNodes.volume.Path: client.GetVolume(True),
+        }
+
+
+    def _FailoverZoneMaster(self, reason:str, status:NowPlayingStatus, memberIds:list[str], startTime:float) -> None:
+        """
+        Promotes a surviving zone member to master, and re-forms the zone with the last
+        known content, after this device (the zone master) was lost.
+
+        Args:
+            reason (str):
+                What detected the master loss (e.g. "websocket error").
+            status (NowPlayingStatus):
+                Last known now playing status of this device.
+            memberIds (list[str]):
+                Device ids of the zone members (in zone order) when the master loss was
+                detected; the zone graph may have changed by the time the loss is confirmed.
+            startTime (float):
+                Time (`time.monotonic`) that the master loss was detected.
+
+        The time from detection until the new master is playing and the zone has been 
+        re-formed is stored in the new master's `soundtouchplus_zone_failover_seconds` 
+        state attribute.
+        """
+        try:
+
+            # the websocket close event is also raised when notifications are stopped, so make
+            # sure that the device is really gone before failing over.
+            try:
+                with socket.create_connection((self._client.Device.Host, int(self._client.Device.Port)), timeout=ZONE_FAILOVER_PROBE_TIMEOUT):
+                    _logsi.LogVerbose("'%s': MediaPlayer zone master is still reachable (%s) - zone master failover cancelled" % (self.name, reason))
+                    return
+            except OSError:
+                pass
+
+            # nothing to resume if we were not playing.
+            if (status is None) or (status.ContentItem is None) or (status.Source in [SoundTouchSources.STANDBY.value, SoundTouchSources.INVALID.value]):
+                _logsi.LogVerbose("'%s': MediaPlayer zone master was not playing - zone members are left as-is" % self.name)
+                return
+
+            # resolve the surviving zone members, in zone order.
+            instances:dict[str, InstanceDataSoundTouchPlus] = {data.client.Device.DeviceId: data for data in self.hass.data[DOMAIN].values() if data.media_player is not None}
+            survivors:list[InstanceDataSoundTouchPlus] = [instances[deviceId] for deviceId in memberIds if deviceId in instances]
+
+            # promote the first surviving member that accepts the last known content.
+            master:InstanceDataSoundTouchPlus = None
+            for data in survivors:
+                try:
+                    data.client.SelectContentItem(status.ContentItem, 0)
+                    master = data
+                    break
+                except SoundTouchError as ex:
+                    _logsi.LogWarning("'%s': MediaPlayer zone member '%s' could not be promoted to master: %s" % (self.name, data.media_player.name, ex.Message))
+            if master is None:
+                _logsi.LogWarning("'%s': MediaPlayer zone master failover failed - no zone member could be promoted to master" % self.name)
+                return
+
+            # re-form the zone with the remaining members.
+            members:list[str] = [data.media_player.entity_id for data in survivors if data is not master]
+            if len(members) > 0:
+                master.media_player._BuildZone(members, ZONE_FAILOVER_BUILD_TIMEOUT)
+
+            # record the time-to-recovery.
+            master.media_player.soundtouchplus_zone_failover_seconds = round(time.monotonic() - startTime, 3)
+            master.media_player.schedule_update_ha_state(force_refresh=False)
+            _logsi.LogWarning("'%s': MediaPlayer zone master failover (%s) promoted '%s' to master in %.3f seconds" % (self.name, reason, master.media_player.name, master.media_player.soundtouchplus_zone_failover_seconds))
+
+        except Exception as ex:
+
+            # trace.
+            _logsi.LogException("'%s': MediaPlayer zone master failover exception: %s" % (self.name, str(ex)), ex, logToSystemLogger=False)
+
+        finally:
+
+            with self._zoneFailoverLock:
+                self._zoneFailoverActive = False
+
+
+    def _StartZoneMasterFailover(self, reason:str) -> None:
+        """
+        Starts a zone master failover (in an executor thread) if the zone master failover
+        option is enabled, and this device is the master of a zone.
+
+        Args:
+            reason (str):
+                What detected the master loss (e.g. "websocket error", "zeroconf removal").
+
+        The last known now playing status and zone members are captured here, as the
+        websocket error handler resets the status, and the members' zone updates may
+        change the zone graph before the master loss is confirmed.
+        """
+        deviceId:str = self._client.Device.DeviceId
+        if (not self.data.OptionZoneMasterFailover) or (self.hass is None) or (ZONE_GRAPH.GetMasterDeviceId(deviceId) != deviceId):
+            return
+        with self._zoneFailoverLock:
+            if self._zoneFailoverActive:
+                return
+            self._zoneFailoverActive = True
+
+        status:NowPlayingStatus = self._client.ConfigurationCache.get(SoundTouchNodes.nowPlaying.Path, None)
+        memberIds:list[str] = ZONE_GRAPH.GetGroupDeviceIds(deviceId)[1:]
+        _logsi.LogWarning("'%s': MediaPlayer zone master loss detected (%s) - starting zone master failover" % (self.name, reason))
+        self.hass.add_job(self._FailoverZoneMaster, reason, status, memberIds, time.monotonic())
+
+
+    def _UpdateZoneGraph(self, config:Zone) -> None:
+        """
+        Updates the zone graph from this device's zone status, and informs Home Assistant
+        of the group_members change of other devices whose zone changed.
+        
+        Args:
+            config (Zone):
+                A Zone configuration object that contains zone member details.
+
+        Other devices of the zone receive their own zone update, but it does not change 
+        the graph (and is ignored) if this device's update was processed first.
+        """
+        deviceIds:list[str] = ZONE_GRAPH.Update(self._client.Device.DeviceId, config)
+        _logsi.LogArray(SILevel.Verbose, "'%s': MediaPlayer zone updated - group_members list" % self.name, self.group_members)
+        self._NotifyZoneGraphChanged(deviceIds)
+
+
+    def _NotifyZoneGraphChanged(self, deviceIds:list[str]) -> None:
+        """
+        Informs Home Assistant of the group_members change of other devices whose zone 
+        changed in the zone graph.
+
+        Args:
+            deviceIds (list[str]):
+                Device ids whose zone changed.
+        """
+        if len(deviceIds) == 0:
+            return
+        data:InstanceDataSoundTouchPlus = None
+        for data in self.hass.data[DOMAIN].values():
+            if (data.media_player is not None) and (data.media_player is not self) \
+                and (data.client.Device.DeviceId in deviceIds) and (data.media_player.hass is not None):
+                data.media_player.schedule_update_ha_state(force_refresh=False)
+
+
+    def _WaitForZoneMembers(self, members:dict[str, InstanceDataSoundTouchPlus], timeout:float) -> dict[str, float]:
+        """
+        Waits for zone members to confirm that they joined our zone.
+
+        Args:
+            members (dict[str, InstanceDataSoundTouchPlus]):
+                Instance data of the members to wait for, keyed by device id.
+            timeout (float):
+                Max number of seconds to wait.
+
+        Returns:
+            A dictionary of the confirmed device id's, and the time (`time.monotonic`) 
+            that each device confirmed that it joined the zone.
+
+        Confirmations are received from the zone graph, which is updated by the members'
+        zoneUpdated events; devices that do not receive websocket events are polled for
+        their zone status instead.
+        """
+        masterId:str = self._client.Device.DeviceId
+        deviceIds:set[str] = set(members.keys())
+        deadline:float = time.monotonic() + max(0.0, timeout)
+
+        while True:
+
+            # poll the devices that do not receive zoneUpdated events.
+            confirmed:dict[str, float] = ZONE_GRAPH.WaitForMembers(masterId, deviceIds, 0)
+            polled:list[InstanceDataSoundTouchPlus] = [data for deviceId, data in members.items() if (deviceId not in confirmed) and (data.media_player._socket is None)]
+            if (len(polled) > 0) and (self._socket is None):
+                polled.insert(0, self.data)
+            data:InstanceDataSoundTouchPlus = None
+            for data in polled:
+                try:
+                    data.media_player._UpdateZoneGraph(data.client.GetZoneStatus(True))
+                except SoundTouchError as ex:
+                    _logsi.LogVerbose("'%s': MediaPlayer could not get zone status for zone build: %s" % (data.media_player.name, ex.Message))
+
+            # wait for the confirmations.
+            remaining:float = deadline - time.monotonic()
+            wait:float = min(remaining, ZONE_BUILD_POLL_INTERVAL) if len(polled) > 0 else remaining
+            confirmed = ZONE_GRAPH.WaitForMembers(masterId, deviceIds, max(0.0, wait))
+            if (len(confirmed) == len(deviceIds)) or (time.monotonic() >= deadline):
+                return confirmed
+
+
+    @staticmethod
+    def _GetZoneVolumeLevels(current:dict[str, int], volume_mode:str, volume_level:int) -> dict[str, int]:
+        """
+        Returns the new volume levels of zone devices for a zone volume operation.
+
+        Args:
+            current (dict[str, int]):
+                Current volume levels (0 - 100), keyed by device id.
+            volume_mode (str):
+                `set` to set every device to the level; `offset` to add the level to every
+                device; `scale` to set the loudest device to the level, and scale the
+                others proportionally.
+            volume_level (int):
+                Volume level (or offset) of the operation.
+
+        Returns:
+            The new volume levels (0 - 100), keyed by device id.
+        """
+        levels:dict[str, int] = {}
+        reference:int = max(current.values()) if len(current) > 0 else 0
+        for deviceId, level in current.items():
+            if volume_mode == ZONE_VOLUME_MODE_OFFSET:
+                level = level + volume_level
+            elif volume_mode == ZONE_VOLUME_MODE_SCALE:
+                # if every device is silent there is nothing to scale, so set the level.
+                level = round(level * volume_level / reference) if reference > 0 else volume_level
+            elif volume_mode == ZONE_VOLUME_MODE_SET:
+                level = volume_level
+            levels[deviceId] = max(0, min(100, level))
+        return levels
+
+
+    def _WaitForPlaying(self, player:MediaPlayerEntity, timeout:float, contentItem:ContentItem) -> bool:
+        """
+        Waits for a player to report that it is playing a content item.
+
+        Args:
+            player (MediaPlayerEntity):
+                The SoundTouch MediaPlayerEntity to wait for.
+            timeout (float):
+                Max number of seconds to wait.
+            contentItem (ContentItem):
+                The content item that the player was asked to play; the player must report
+                the same source and location, as a playing status can also belong to what
+                the player was already playing (or resumed when it was powered on).
+
+        Returns:
+            True if the player reported that it is playing the content item; otherwise,
+            False if it did not do so within the timeout.
+
+        The status is taken from the player configuration cache if websockets are enabled
+        for the player (as it is maintained by nowPlaying update events); otherwise, the
+        status is queried from the device.
+        """
+        client:SoundTouchClient = player._client
+        deadline:float = time.monotonic() + timeout
+        while True:
+            if player._socket is not None:
+                status:NowPlayingStatus = client.ConfigurationCache.get(SoundTouchNodes.nowPlaying.Path, None)
+            else:
+                status:NowPlayingStatus = client.GetNowPlayingStatus(True)
+            if (status is not None) and (status.PlayStatus == PlayStatusTypes.Playing.value) \
+                and (status.ContentItem is not None) \
+                and (status.ContentItem.Source == contentItem.Source) \
+                and (status.ContentItem.Location == contentItem.Location):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(PLAY_HANDOFF_POLL_INTERVAL)
+
+
     def _GetSourceItemByTitle(self, title:str) -> SourceItem:
         """
         Returns a `SourceItem` instance for the given source title value
@@ -2380,8 +3005,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             # build criteria object.
             criteria:Navigate = Navigate(source, sourceAccount, sortType=sortType)
                 
-            # request information from SoundTouch Web API.
-            result = self.data.client.GetMusicServiceStations(criteria)
+            # request information from SoundTouch Web API (or the station cache).
+            result = self.data.navigate_cache.GetMusicServiceStations(self.data.client, criteria)
 
             # return the result dictionary.
             return result.ToDictionary()
@@ -2492,7 +3117,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         self, 
         to_player:MediaPlayerEntity, 
         restore_volume:bool, 
-        snapshot_only:bool
+        snapshot_only:bool,
+        volume_level:int=None,
         ) -> None:
         """
         Handoff playing source from one SoundTouch MediaPlayerEntity to another.
@@ -2507,6 +3133,15 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                 True to only handoff the snapshot and not trigger the restore and 
                 power off; False (default) to handoff the snapshot, restore it, 
                 and power off the FROM player.
+            volume_level (int):
+                Volume level (0 - 100) to set on the TO player before playback starts;
+                overrides the `restore_volume` argument.  Default is None.
+
+        The TO player is woken while the snapshot is taken, it's volume is set before
+        playback starts, and the FROM player is only powered off once the TO player
+        reports that it is playing.  The time taken (in seconds) from the start of the
+        handoff until the TO player is playing is stored in the `soundtouchplus_handoff_latency`
+        state attribute.
         """
         apiMethodName:str = 'service_play_handoff'
         apiMethodParms:SIMethodParmListContext = None
@@ -2518,35 +3153,63 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             apiMethodParms.AppendKeyValue("to_player", to_player.name)
             apiMethodParms.AppendKeyValue("restore_volume", restore_volume)
             apiMethodParms.AppendKeyValue("snapshot_only", snapshot_only)
+            apiMethodParms.AppendKeyValue("volume_level", volume_level)
             _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Play Handoff Service", apiMethodParms)
 
-            # # validations.
-            # if to_player is None:
-            #     _logsi.LogWarning("'%s': MediaPlayer service 'service_play_handoff' argument 'to_player' cannot be null")
-            #     return
-        
-            # take a snapshot of what we are currently playing.
+            startTime:float = time.monotonic()
+            toClient:SoundTouchClient = to_player._client
+
+            # wake the TO player while we take a snapshot of what we are currently playing.
+            wake:Future = None
+            if not snapshot_only:
+                _logsi.LogVerbose("'%s': MediaPlayer TO player '%s' is being powered on", self.name, to_player.name)
+                wake = _DEVICE_REQUEST_EXECUTOR.submit(toClient.PowerOn)
+
             _logsi.LogVerbose("'%s': MediaPlayer is taking a snapshot", self.name)
             self.data.client.StoreSnapshot()
 
             # copy our snapshot settings to the TO player snapshot settings.
             _logsi.LogVerbose("'%s': MediaPlayer is copying snapshot settings TO player '%s'", self.name, to_player.name)
-            to_player._client.SnapshotSettings.clear()
+            toClient.SnapshotSettings.clear()
             for key in self.data.client.SnapshotSettings.keys():
-                to_player._client.SnapshotSettings[key] = self.data.client.SnapshotSettings[key]
+                toClient.SnapshotSettings[key] = self.data.client.SnapshotSettings[key]
 
             # if only taking a snapshot then we are done.
             if snapshot_only:
                 _logsi.LogVerbose("'%s': MediaPlayer snapshot copy only selected - play handoff complete", self.name)
                 return
-        
-            # restore snapshot on TO player.
-            _logsi.LogVerbose("'%s': MediaPlayer TO player '%s' is restoring snapshot settings", self.name, to_player.name)
-            to_player._client.RestoreSnapshot(restore_volume)
+
+            wake.result()
+
+            # set the TO player volume before playback starts.
+            if volume_level is None and restore_volume and (SoundTouchNodes.volume.Path in toClient.SnapshotSettings):
+                volume_level = toClient.SnapshotSettings[SoundTouchNodes.volume.Path].Actual
+            if volume_level is not None:
+                _logsi.LogVerbose("'%s': MediaPlayer TO player '%s' volume is being set to %s", self.name, to_player.name, str(volume_level))
+                toClient.SetVolumeLevel(int(volume_level))
+
+            # start playback on the TO player; the content item selects the source, so
+            # there is no need to select the source first.
+            status:NowPlayingStatus = toClient.SnapshotSettings.get(SoundTouchNodes.nowPlaying.Path, None)
+            if (status is None) or (status.ContentItem is None):
+                _logsi.LogWarning("'%s': MediaPlayer snapshot contains no content to handoff" % (self.name))
+                return
+            _logsi.LogVerbose("'%s': MediaPlayer TO player '%s' is starting playback", self.name, to_player.name)
+            toClient.SelectContentItem(status.ContentItem, 0)
+
+            # wait for the TO player to report that it is playing before powering off the FROM player.
+            if not self._WaitForPlaying(to_player, PLAY_HANDOFF_PLAYING_TIMEOUT, status.ContentItem):
+                _logsi.LogWarning("'%s': MediaPlayer TO player '%s' did not report playing within %d seconds; FROM player was left on" % (self.name, to_player.name, PLAY_HANDOFF_PLAYING_TIMEOUT))
+                return
+
+            # record the handoff latency.
+            self.soundtouchplus_handoff_latency = round(time.monotonic() - startTime, 3)
+            _logsi.LogVerbose("'%s': MediaPlayer TO player '%s' is playing (handoff latency %.3f seconds)" % (self.name, to_player.name, self.soundtouchplus_handoff_latency))
 
             # turn FROM player off.
             _logsi.LogVerbose("'%s': MediaPlayer is being powered off", self.name)
             self.turn_off()
+            self.schedule_update_ha_state(force_refresh=False)
 
             _logsi.LogVerbose("'%s': MediaPlayer play handoff to player '%s' is complete", self.name, to_player.name)
 
@@ -2561,6 +3224,64 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
 
 
+    def service_play_history(
+        self,
+        periodDays:int,
+        thisDeviceOnly:bool,
+        limit:int,
+        ) -> dict:
+        """
+        Retrieves the most played content items from the play history of all SoundTouch
+        devices (or this device only).
+
+        Args:
+            periodDays (int):
+                Number of days of plays to rank items by (e.g. 7 for "this week"), or 0 to
+                rank items by all recorded plays.
+            thisDeviceOnly (bool):
+                True to only count plays on this device; otherwise, False to count plays on
+                all devices.
+            limit (int):
+                Max number of items to return.
+
+        Returns:
+            A dictionary that contains the most played items (with their play count for the 
+            period, and per-device play counts and last played times).
+        """
+        apiMethodName:str = 'service_play_history'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("periodDays", periodDays)
+            apiMethodParms.AppendKeyValue("thisDeviceOnly", thisDeviceOnly)
+            apiMethodParms.AppendKeyValue("limit", limit)
+            _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Play History Service", apiMethodParms)
+
+            # query the play history index.
+            since:float = (time.time() - (periodDays * 86400)) if (periodDays or 0) > 0 else None
+            deviceId:str = self._client.Device.DeviceId if thisDeviceOnly else None
+            deviceNames:dict[str, str] = PLAY_HISTORY_INDEX.GetDeviceNames()
+            items:list[dict] = []
+            for item, playCount in PLAY_HISTORY_INDEX.GetMostPlayed(since, deviceId, limit):
+                itemDict:dict = item.ToDictionary(deviceNames)
+                itemDict["PeriodPlayCount"] = playCount
+                items.append(itemDict)
+
+            # return the result dictionary.
+            return {
+                "PeriodDays": periodDays,
+                "Items": items,
+            }
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
     def service_play_tts(
         self, 
         message:str, 
@@ -2609,6 +3330,15 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             apiMethodParms.AppendKeyValue("appKey", appKey)
             _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Play TTS Notification Service", apiMethodParms)
 
+            # play the rendered message from the tts cache if possible, so that repeated
+            # messages do not have to be rendered (or reached) upstream every time.
+            if ttsUrl is None:
+                ttsUrl = DEFAULT_TTS_URL
+            cacheUrl:str = TTS_CACHE.GetUrl(message, ttsUrl)
+            if cacheUrl is not None:
+                _logsi.LogVerbose("'%s': MediaPlayer is playing TTS message from the cache: '%s'" % (self.name, cacheUrl))
+                ttsUrl = cacheUrl
+
             # play tts notification message.
             self.data.client.PlayNotificationTTS(message, ttsUrl, artist, album, track, volumeLevel, appKey)
 
@@ -2954,6 +3684,112 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
 
 
+    def service_preset_store_bulk(
+        self,
+        presets:list[dict],
+        removeUnlisted:bool=False,
+        ) -> dict:
+        """
+        Stores a complete preset layout to the device's list of presets, writing only the
+        preset slots that differ from the current preset list.
+
+        Args:
+            presets (list[dict]):
+                The target presets; each dictionary contains the same keys as the `preset_store`
+                service (`preset_id`, `name`, `source`, `source_account`, `item_type`,
+                `location`, `container_art`).
+                Source title values (e.g. "Jellyfin Media Server") are resolved the same way
+                as the `preset_store` service.
+            removeUnlisted (bool):
+                True to remove presets from slots that are not in the target presets;
+                otherwise, False (default) to leave them as-is.
+
+        Returns:
+            A dictionary that contains the preset ids that were `Stored`, `Removed`, and
+            `Unchanged`, and the resulting `PresetList` dictionary.  The removed and
+            unchanged preset ids are taken from the resulting preset list, as the device
+            empties a slot whose preset is stored to another slot (e.g. a moved preset).
+
+        Each write to the device causes a presetsUpdated event; state updates are deferred
+        until the event of the last write arrives (or a deadline passes), so that a layout
+        change results in a single state update instead of one per preset slot.
+        """
+        apiMethodName:str = 'service_preset_store_bulk'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("presets", presets)
+            apiMethodParms.AppendKeyValue("removeUnlisted", removeUnlisted)
+            _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Preset Store Bulk Service", apiMethodParms)
+
+            # build the target preset for each slot.
+            targets:dict[int, Preset] = {}
+            for item in (presets or []):
+                presetId:int = int(item.get("preset_id"))
+                if presetId in targets:
+                    raise ServiceValidationError("Preset ID %d was specified more than once" % presetId)
+                source:str = item.get("source")
+                sourceAccount:str = item.get("source_account")
+
+                # is source argument a source title value?
+                sourceItem:SourceItem = self._GetSourceItemByTitle(source)
+                if sourceItem is not None:
+                    source = sourceItem.Source
+                    sourceAccount = sourceItem.SourceAccount
+
+                targets[presetId] = Preset(
+                    presetId,
+                    None,
+                    None,
+                    source,
+                    item.get("item_type"),
+                    item.get("location"),
+                    sourceAccount,
+                    True,   # is_presetable must always has to be true, otherwise call will fail
+                    item.get("name") or ("Preset %s" % str(presetId)),
+                    item.get("container_art")
+                    )
+
+            # write the preset slots that differ from the target presets, deferring state
+            # updates until the event of the last write arrives.
+            try:
+                layout:dict = StorePresetLayout(self.data.client, targets, removeUnlisted, self._DeferPresetsEvents)
+            except ValueError as ex:
+                raise ServiceValidationError(str(ex))
+            result:PresetList = layout["PresetList"]
+
+            # if events are not being processed, then inform Home Assistant of the status update.
+            if (layout["Writes"] > 0) and (self._socket is None):
+                self.soundtouchplus_presets_lastupdated = result.LastUpdatedOn
+                self.schedule_update_ha_state(force_refresh=False)
+
+            # return the result dictionary.
+            return {
+                "Stored": layout["Stored"],
+                "Removed": layout["Removed"],
+                "Unchanged": layout["Unchanged"],
+                "PresetList": result.ToDictionary(includeEmptyPresets=True),
+            }
+
+        # the following exceptions have already been logged, so we just need to
+        # pass them back to HA for display in the log (or service UI).
+        except SoundTouchError as ex:
+
+            # stop deferring state updates, as the remaining writes will not take place.
+            if self.soundtouchplus_presets_events_pending > 0:
+                self.soundtouchplus_presets_events_pending = 0
+                self.schedule_update_ha_state(force_refresh=False)
+            raise HomeAssistantError(ex.Message)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
     def service_reboot_device(
         self, 
         sshPort:int,
@@ -3041,12 +3877,31 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
 
     def service_recent_list_cache(
         self,
+        source:str=None,
+        since:int=None,
+        offset:int=None,
+        limit:int=None,
         ) -> dict:
         """
         Retrieves the list of recently played cache items defined for a device.
 
+        Args:
+            source (str):
+                Source (e.g. "TUNEIN") of the items to return, or None for all sources.
+            since (int):
+                Only return items played on or after this date and time (epoch seconds).
+            offset (int):
+                The index of the first item to return.
+            limit (int):
+                Max number of items to return.
+
         Returns:
             A `RecentList` object dictionary that contains defined recently played cache items.
+
+        If any of the arguments are specified (and the recently played history store is 
+        open), then the page of items is queried from the history store, and the dictionary
+        also contains the `Offset`, `Limit`, and `Total` (number of matching items) values.
+        Otherwise, all items of the recently played cache are returned.
         """
         apiMethodName:str = 'service_recent_list_cache'
         apiMethodParms:SIMethodParmListContext = None
@@ -3056,8 +3911,26 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
 
             # trace.
             apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("source", source)
+            apiMethodParms.AppendKeyValue("since", since)
+            apiMethodParms.AppendKeyValue("offset", offset)
+            apiMethodParms.AppendKeyValue("limit", limit)
             _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Get Recent List Cache Service", apiMethodParms)
-                
+
+            # if a page was requested, then query the history store.
+            if (self.data.recents_store.IsOpen) and ((source is not None) or (since is not None) or (offset is not None) or (limit is not None)):
+                offset = offset or 0
+                limit = limit or 50
+                recents, total = self.data.recents_store.Query(source, since, None, offset, limit)
+                result = RecentList()
+                result.Recents.extend(recents)
+                result.LastUpdatedOn = self.data.recents_store.LastUpdatedOn
+                resultDict:dict = result.ToDictionary()
+                resultDict["Offset"] = offset
+                resultDict["Limit"] = limit
+                resultDict["Total"] = total
+                return resultDict
+
             # request information from SoundTouch Web API.
             result = self.data.client.RecentListCache
 
@@ -3129,6 +4002,162 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
 
 
+    def service_search(
+        self,
+        criteria:str,
+        collections:list[str],
+        limit:int,
+        ) -> dict:
+        """
+        Searches the device presets, recently played items, and recently played cache items 
+        for items whose name, source, or location match all of the words in the search criteria.
+
+        Args:
+            criteria (str):
+                Search criteria (e.g. "jazz station"); the search is case-insensitive.
+            collections (list[str]):
+                Lists to search ("presets", "recents", "recents_cache"), or None to search
+                all lists.
+            limit (int):
+                Max number of items to return.
+
+        Returns:
+            A dictionary that contains the matching items, ranked by score (highest first).
+        """
+        apiMethodName:str = 'service_search'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("criteria", criteria)
+            apiMethodParms.AppendKeyValue("collections", collections)
+            apiMethodParms.AppendKeyValue("limit", limit)
+            _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Search Service", apiMethodParms)
+
+            # rebuild index collections that have changed since they were indexed.
+            self._UpdateMediaSearchIndex(collections)
+
+            # return the result dictionary.
+            return {
+                "Criteria": criteria,
+                "Items": self.data.media_search_index.Search(criteria, collections, limit),
+            }
+
+        # the following exceptions have already been logged, so we just need to
+        # pass them back to HA for display in the log (or service UI).
+        except SoundTouchError as ex:
+            raise ServiceValidationError(ex.Message)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    def _UpdateMediaSearchIndex(self, collections:list[str]=None) -> None:
+        """
+        Rebuilds media search index collections that have changed since they were indexed.
+
+        Collections are versioned by the presets / recents / recents cache last updated 
+        values that are maintained by the websocket event handlers.  If websocket 
+        notifications are disabled (or the media player has fallen back to polling) then
+        there are no events to version them by, so the lists are retrieved from the device
+        and versioned by their own last updated values.
+        """
+        index:MediaSearchIndex = self.data.media_search_index
+        isEventDriven:bool = (self._socket is not None) and (not self.should_poll)
+
+        if (collections is None) or (MEDIA_SEARCH_PRESETS in collections):
+            if (not isEventDriven) or (not index.IsCurrent(MEDIA_SEARCH_PRESETS, self.soundtouchplus_presets_lastupdated)):
+                presetList:PresetList = self._client.GetPresetList(refresh=not isEventDriven, resolveSourceTitles=True)
+                index.Update(MEDIA_SEARCH_PRESETS, self.soundtouchplus_presets_lastupdated if isEventDriven else presetList.LastUpdatedOn, presetList.Presets)
+
+        if (collections is None) or (MEDIA_SEARCH_RECENTS in collections):
+            if (not isEventDriven) or (not index.IsCurrent(MEDIA_SEARCH_RECENTS, self.soundtouchplus_recents_lastupdated)):
+                recentList:RecentList = self._client.GetRecentList(not isEventDriven, resolveSourceTitles=True)
+                index.Update(MEDIA_SEARCH_RECENTS, self.soundtouchplus_recents_lastupdated if isEventDriven else recentList.LastUpdatedOn, recentList.Recents)
+
+        if ((collections is None) or (MEDIA_SEARCH_RECENTS_CACHE in collections)) and (self._client.RecentListCacheEnabled):
+            recentListCache:RecentList = self._client.RecentListCache
+            index.Update(MEDIA_SEARCH_RECENTS_CACHE, recentListCache.LastUpdatedOn, recentListCache.Recents)
+
+
+    def service_search_stored_music(
+        self,
+        criteria:str,
+        limit:int,
+        includeContainers:bool,
+        refreshIndex:bool,
+        ) -> dict:
+        """
+        Searches the stored music (e.g. DLNA / NAS) library search index for items whose
+        name or folder path contains all of the words in the search criteria.
+
+        Args:
+            criteria (str):
+                Search criteria (e.g. "beatles help"); the search is case-insensitive.
+            limit (int):
+                Max number of items to return.
+            includeContainers (bool):
+                True to include containers (e.g. albums, artists) in the results; otherwise,
+                False to only return tracks.
+            refreshIndex (bool):
+                True to start a background crawl of the device stored music sources to
+                refresh the index; otherwise, False.  The results of this request are
+                returned from the current index.
+
+        Returns:
+            A dictionary that contains the matching `ContentItem` objects (playable via
+            the `play_contentitem` service), and the index status.
+
+        The device is not queried to satisfy the search; the index is built by a background
+        crawler when the media player starts (if it is stale) or when a refresh is requested.
+        """
+        apiMethodName:str = 'service_search_stored_music'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("criteria", criteria)
+            apiMethodParms.AppendKeyValue("limit", limit)
+            apiMethodParms.AppendKeyValue("includeContainers", includeContainers)
+            apiMethodParms.AppendKeyValue("refreshIndex", refreshIndex)
+            _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Search Stored Music Service", apiMethodParms)
+
+            index:StoredMusicIndex = self.data.stored_music_index
+            if refreshIndex:
+                index.StartCrawl(self.data.client)
+
+            # search the index.
+            items:list[ContentItem] = index.Search(criteria, limit, includeContainers)
+
+            # return the result dictionary.
+            lastCrawledOn:str = None
+            if index.LastCrawledOn > 0:
+                lastCrawledOn = dt.datetime.fromtimestamp(index.LastCrawledOn, dt.timezone.utc).isoformat()
+            return {
+                "Criteria": criteria,
+                "IndexItemCount": index.Count,
+                "IndexLastCrawledOn": lastCrawledOn,
+                "IsCrawling": index.IsCrawling,
+                "Items": [item.ToDictionary() for item in items],
+            }
+
+        # the following exceptions have already been logged, so we just need to
+        # pass them back to HA for display in the log (or service UI).
+        except SoundTouchError as ex:
+            raise ServiceValidationError(ex.Message)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
     def service_set_audio_dsp_controls(
         self, 
         audio_mode:str=None, 
@@ -3564,6 +4593,8 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
     def service_snapshot_restore(
         self, 
         restore_volume:bool,
+        name:str=None,
+        restore_mode:str=SNAPSHOT_RESTORE_MODE_FULL,
         ) -> None:
         """
         Restore now playing settings from a snapshot that was previously taken by 
@@ -3572,6 +4603,15 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
         Args:
             restore_volume (bool):
                 True to restore volume setting; otherwise, False to not change volume.
+            name (str):
+                Name of a stored snapshot to restore; the stored snapshot also replaces
+                the in-memory snapshot.  Default is None, which restores the in-memory 
+                snapshot.
+            restore_mode (str):
+                `full` (default) to replay every snapshot setting; otherwise, `changes` to
+                compare the snapshot to the current device status, and only issue the 
+                commands needed to return to the snapshot (e.g. no content is re-selected
+                if the snapshot content is still playing).
         """
         apiMethodName:str = 'service_snapshot_restore'
         apiMethodParms:SIMethodParmListContext = None
@@ -3581,15 +4621,28 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             # trace.
             apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
             apiMethodParms.AppendKeyValue("restore_volume", restore_volume)
+            apiMethodParms.AppendKeyValue("name", name)
+            apiMethodParms.AppendKeyValue("restore_mode", restore_mode)
             _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Snapshot Restore Service", apiMethodParms)
 
+            # if restoring a stored snapshot then load it into the snapshot settings.
+            if name is not None:
+                settings:dict = self.data.snapshot_store.Get(name)
+                if settings is None:
+                    raise ServiceValidationError("Snapshot '%s' was not found; stored snapshots: %s" % (name, ", ".join(self.data.snapshot_store.GetNames()) or "(none)"))
+                self.data.client.SnapshotSettings.clear()
+                self.data.client.SnapshotSettings.update(settings)
+
             # if not restoring volume then remove it from the snapshot settings.
             if not restore_volume:
                 if SoundTouchNodes.volume.Path in self.data.client.SnapshotSettings:
                     self.data.client.SnapshotSettings.pop(SoundTouchNodes.volume.Path)
 
             # restore snapshot settings.
-            self.data.client.RestoreSnapshot()
+            if restore_mode == SNAPSHOT_RESTORE_MODE_CHANGES:
+                self._RestoreSnapshotChanges()
+            else:
+                self.data.client.RestoreSnapshot()
 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -3604,10 +4657,17 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
 
     def service_snapshot_store(
         self,
+        name:str=None,
         ) -> None:
         """
         Store now playing settings to a snapshot, which can be restored later via
         the service_snapshot_restore method.
+
+        Args:
+            name (str):
+                Name to store the snapshot under, in addition to the in-memory snapshot;
+                named snapshots are persisted, and survive a restart.  Default is None,
+                which only stores the in-memory snapshot.
         """
         apiMethodName:str = 'service_snapshot_store'
         apiMethodParms:SIMethodParmListContext = None
@@ -3616,11 +4676,16 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
 
             # trace.
             apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("name", name)
             _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Snapshot Store Service", apiMethodParms)
 
             # store snapshot settings.
             self.data.client.StoreSnapshot()
 
+            # persist the snapshot settings if a name was specified.
+            if name is not None:
+                self.data.snapshot_store.Put(name, self.data.client.SnapshotSettings)
+
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
         except SoundTouchError as ex:
@@ -3701,6 +4766,196 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
 
 
+    def service_zone_build(
+        self, 
+        members:list[str],
+        timeout:float=ZONE_BUILD_TIMEOUT,
+        ) -> dict:
+        """
+        Builds a zone with this device as master, confirming that each member joined and
+        retrying the members that did not.
+        
+        Args:
+            members (list[str]):
+                Entity id's of the SoundTouch devices to add to the zone.
+            timeout (float):
+                Max number of seconds to wait for all members to join.  
+                Default is 20 seconds.
+
+        Returns:
+            A dictionary that contains the following keys:
+            - `Joined`: entity id's of the members that joined, and the number of seconds each took.
+            - `Missing`: entity id's of the members that did not join within the timeout.
+            - `Attempts`: number of zone create / add member attempts.
+            - `ElapsedSeconds`: number of seconds the zone build took.
+        """
+        apiMethodName:str = 'service_zone_build'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("members", members)
+            apiMethodParms.AppendKeyValue("timeout", timeout)
+            _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Zone Build Service", apiMethodParms)
+
+            # build the zone.
+            return self._BuildZone(members, timeout)
+
+        # the following exceptions have already been logged, so we just need to
+        # pass them back to HA for display in the log (or service UI).
+        except SoundTouchError as ex:
+            raise ServiceValidationError(ex.Message)
+        
+        finally:
+                
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    def service_zone_snapshot_restore(
+        self, 
+        restore_volume:bool,
+        restore_mode:str=SNAPSHOT_RESTORE_MODE_FULL,
+        ) -> None:
+        """
+        Restore now playing settings of every device of a zone, and the zone itself, from
+        a snapshot that was previously taken by the service_zone_snapshot_store method.
+        
+        Args:
+            restore_volume (bool):
+                True to restore volume settings; otherwise, False to not change volume.
+            restore_mode (str):
+                `full` (default) to replay every snapshot setting; otherwise, `changes` to
+                compare the snapshot to the current device status, and only issue the 
+                commands needed to return to the snapshot.
+
+        The zone master content and every device volume are restored concurrently; the
+        zone is then rebuilt if it's members have changed.
+        """
+        apiMethodName:str = 'service_zone_snapshot_restore'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("restore_volume", restore_volume)
+            apiMethodParms.AppendKeyValue("restore_mode", restore_mode)
+            _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Zone Snapshot Restore Service", apiMethodParms)
+
+            snapshot:dict = self.zone_snapshot
+            if snapshot is None:
+                raise ServiceValidationError("'%s': MediaPlayer has not taken a zone snapshot; nothing to restore" % self.name)
+
+            # resolve the snapshot devices; devices that are no longer configured are skipped.
+            instances:dict[str, InstanceDataSoundTouchPlus] = {data.client.Device.DeviceId: data for data in self.hass.data[DOMAIN].values()}
+            masterDeviceId:str = snapshot["MasterDeviceId"]
+            master:InstanceDataSoundTouchPlus = instances.get(masterDeviceId, None)
+            if master is None:
+                raise ServiceValidationError("'%s': MediaPlayer zone snapshot master device '%s' is no longer configured" % (self.name, masterDeviceId))
+            members:list[InstanceDataSoundTouchPlus] = []
+            for deviceId in snapshot["MemberDeviceIds"]:
+                if deviceId in instances:
+                    members.append(instances[deviceId])
+                else:
+                    _logsi.LogWarning("'%s': MediaPlayer zone snapshot member device '%s' is no longer configured; it will not be restored" % (self.name, deviceId))
+
+            # restore the master and members concurrently.
+            _logsi.LogVerbose("'%s': MediaPlayer is restoring a zone snapshot of %d device(s)" % (self.name, 1 + len(members)))
+            futures:list[Future] = [_DEVICE_REQUEST_EXECUTOR.submit(self._RestoreZoneMemberSnapshot, master, snapshot["Settings"][masterDeviceId], True, restore_volume, restore_mode)]
+            for data in members:
+                futures.append(_DEVICE_REQUEST_EXECUTOR.submit(self._RestoreZoneMemberSnapshot, data, snapshot["Settings"][data.client.Device.DeviceId], False, restore_volume, restore_mode))
+            for future in futures:
+                future.result()
+
+            # rebuild the zone if it's members have changed.
+            if len(members) > 0:
+                zone:Zone = master.client.GetZoneStatus(False)
+                memberIds:set[str] = set()
+                if (zone is not None) and (zone.MasterDeviceId == masterDeviceId):
+                    memberIds = {member.DeviceId for member in zone.Members if member.DeviceId != masterDeviceId}
+                if memberIds != {data.client.Device.DeviceId for data in members}:
+                    _logsi.LogVerbose("'%s': MediaPlayer is rebuilding the zone of master device '%s'" % (self.name, master.client.Device.DeviceName))
+                    zone = Zone(masterDeviceId, master.client.Device.Host, True)
+                    for data in members:
+                        zone.AddMember(ZoneMember(data.client.Device.Host, data.client.Device.DeviceId))
+                    master.client.CreateZone(zone)
+
+        # the following exceptions have already been logged, so we just need to
+        # pass them back to HA for display in the log (or service UI).
+        except SoundTouchError as ex:
+            raise HomeAssistantError(ex.Message)
+        
+        finally:
+                
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    def service_zone_snapshot_store(
+        self,
+        ) -> None:
+        """
+        Store now playing settings of every device of the zone that this device belongs to,
+        and the zone members, to a zone snapshot which can be restored later via the 
+        service_zone_snapshot_restore method.
+
+        The zone members are taken from the cached zone status, and the device snapshots
+        are taken concurrently.  If this device is not in a zone, then only this device is
+        stored.  The in-memory snapshots of the devices are not changed.
+
+        The zone snapshot is kept in memory only (it is not persisted like named snapshots),
+        so it is lost when Home Assistant is restarted.
+        """
+        apiMethodName:str = 'service_zone_snapshot_store'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Zone Snapshot Store Service", apiMethodParms)
+
+            # get the zone members from the cached zone status.
+            masterDeviceId:str = self._client.Device.DeviceId
+            memberIds:list[str] = []
+            if SoundTouchNodes.getZone.Path in self._client.Device.SupportedUris:
+                zone:Zone = self._client.GetZoneStatus(False)
+                if (zone is not None) and (zone.MasterDeviceId is not None):
+                    masterDeviceId = zone.MasterDeviceId
+                    memberIds = [member.DeviceId for member in zone.Members if member.DeviceId != masterDeviceId]
+
+            # all zone devices must be configured, as we need their clients.
+            instances:dict[str, InstanceDataSoundTouchPlus] = {data.client.Device.DeviceId: data for data in self.hass.data[DOMAIN].values()}
+            deviceIds:list[str] = [masterDeviceId] + memberIds
+            missing:list[str] = [deviceId for deviceId in deviceIds if deviceId not in instances]
+            if len(missing) > 0:
+                raise ServiceValidationError("'%s': MediaPlayer zone devices are not configured: %s; zone snapshot was not taken" % (self.name, ", ".join(missing)))
+
+            # take a snapshot of each device concurrently.
+            _logsi.LogVerbose("'%s': MediaPlayer is taking a zone snapshot of %d device(s)" % (self.name, len(deviceIds)))
+            futures:dict[str, Future] = {deviceId: _DEVICE_REQUEST_EXECUTOR.submit(self._StoreZoneMemberSnapshot, instances[deviceId].client) for deviceId in deviceIds}
+            settings:dict[str, dict] = {deviceId: future.result() for deviceId, future in futures.items()}
+
+            self.zone_snapshot = {
+                "MasterDeviceId": masterDeviceId,
+                "MemberDeviceIds": memberIds,
+                "Settings": settings,
+            }
+
+        # the following exceptions have already been logged, so we just need to
+        # pass them back to HA for display in the log (or service UI).
+        except SoundTouchError as ex:
+            raise HomeAssistantError(ex.Message)
+        
+        finally:
+                
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
     def service_zone_toggle_member(
         self, 
         zone_member_player:MediaPlayerEntity,
@@ -3744,6 +4999,74 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
 
 
+    def service_zone_volume(
+        self, 
+        volume_mode:str,
+        volume_level:int,
+        ) -> None:
+        """
+        Changes the volume of every device of the zone that this device belongs to.
+        
+        Args:
+            volume_mode (str):
+                `set` to set every device to the volume level; `offset` to add the volume
+                level (which can be negative) to every device; `scale` to set the loudest
+                device to the volume level, and scale the others proportionally so that 
+                the balance between rooms is kept.
+            volume_level (int):
+                Volume level (or offset) of the operation.
+
+        The zone devices are taken from the zone graph, and the current volume levels from
+        the volume cache; if this device is not in a zone, then only it's volume is changed.
+        The devices are updated concurrently via their volume coalescers.
+        """
+        apiMethodName:str = 'service_zone_volume'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("volume_mode", volume_mode)
+            apiMethodParms.AppendKeyValue("volume_level", volume_level)
+            _logsi.LogMethodParmList(SILevel.Verbose, "SoundTouch Zone Volume Service", apiMethodParms)
+
+            # validations.
+            if (volume_mode != ZONE_VOLUME_MODE_OFFSET) and (volume_level < 0):
+                raise ServiceValidationError("'%s': MediaPlayer volume level cannot be negative for volume mode '%s'" % (self.name, volume_mode))
+
+            # resolve the zone devices.
+            deviceIds:list[str] = ZONE_GRAPH.GetGroupDeviceIds(self._client.Device.DeviceId) or [self._client.Device.DeviceId]
+            instances:dict[str, InstanceDataSoundTouchPlus] = {}
+            data:InstanceDataSoundTouchPlus = None
+            for data in self.hass.data[DOMAIN].values():
+                if data.client.Device.DeviceId in deviceIds:
+                    instances[data.client.Device.DeviceId] = data
+
+            # calculate the new volume levels from the cached volume levels.
+            current:dict[str, int] = {deviceId: data.client.GetVolume(False).Actual for deviceId, data in instances.items()}
+            levels:dict[str, int] = self._GetZoneVolumeLevels(current, volume_mode, volume_level)
+            _logsi.LogDictionary(SILevel.Verbose, "'%s': MediaPlayer zone volume levels (mode '%s')" % (self.name, volume_mode), levels)
+
+            # set the volume levels concurrently.
+            futures:list[Future] = []
+            for deviceId, data in instances.items():
+                if levels[deviceId] != current[deviceId]:
+                    futures.append(_DEVICE_REQUEST_EXECUTOR.submit(data.media_player._volumeCoalescer.Set, levels[deviceId]))
+            for future in futures:
+                future.result()
+
+        # the following exceptions have already been logged, so we just need to
+        # pass them back to HA for display in the log (or service UI).
+        except SoundTouchError as ex:
+            raise HomeAssistantError(ex.Message)
+        
+        finally:
+                
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
     async def async_added_to_hass(self) -> None:
         """
         Run when this Entity has been added to HA.
@@ -3801,11 +5124,23 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             else:
                 _logsi.LogVerbose("'%s': MediaPlayer device does not support tone level adjustments (audioproducttonecontrols)" % self.name)
 
+            # register with the zone graph, so that zone devices that were added before
+            # us can report our entity id in their group_members state.
+            self._NotifyZoneGraphChanged(ZONE_GRAPH.RegisterEntity(self._client.Device.DeviceId, self.entity_id))
+
             # load zone configuration.
             if SoundTouchNodes.getZone.Path in self._client.Device.SupportedUris:
                 _logsi.LogVerbose("'%s': MediaPlayer is loading zone configuration" % self.name)
                 config:Zone = await self.hass.async_add_executor_job(self._client.GetZoneStatus, True)
-                self._attr_group_members = self._BuildZoneMemberEntityIdList(config)
+                self._UpdateZoneGraph(config)
+
+            # the main media library index includes media sources from other integrations, so 
+            # clear it when an integration is loaded; build it once home assistant has started.
+            self.async_on_remove(self.hass.bus.async_listen(EVENT_COMPONENT_LOADED, self._OnComponentLoadedEvent))
+            self.async_on_remove(async_at_started(self.hass, self._async_PrebuildLibraryIndex))
+
+            # refresh the stored music search index (if it's stale) once home assistant has started.
+            self.async_on_remove(async_at_started(self.hass, self._async_StartStoredMusicIndexCrawl))
 
             # if websocket support is disabled then we are done at this point.
             if self._socket is None:
@@ -3846,6 +5181,53 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LeaveMethod(SILevel.Debug)
 
 
+    @callback
+    def _OnComponentLoadedEvent(self, event:Event) -> None:
+        """
+        Handles the Home Assistant component loaded event.
+
+        Clears the main media library index, so that it is rebuilt (with any new media 
+        sources) the next time it is browsed.
+        """
+        if self.data.library_index.pop(BrowsableMedia.LIBRARY_INDEX.value, None) is not None:
+            _logsi.LogVerbose("'%s': MediaPlayer media library index was cleared, as component '%s' was loaded" % (self.name, event.data.get("component", None)))
+
+
+    async def _async_PrebuildLibraryIndex(self, hass:HomeAssistant) -> None:
+        """
+        Builds the main media library index, so that the first media browser request is
+        served from memory.
+        """
+        try:
+
+            await self.async_browse_media()
+
+        except Exception as ex:
+
+            # trace.
+            _logsi.LogVerbose("'%s': MediaPlayer could not prebuild the media library index: %s" % (self.name, str(ex)))
+
+
+    async def _async_StartStoredMusicIndexCrawl(self, hass:HomeAssistant) -> None:
+        """
+        Starts a background crawl of the device STORED_MUSIC sources if the stored music
+        search index is stale, and the device has a STORED_MUSIC source.
+        """
+        try:
+
+            if not self.data.stored_music_index.IsStale:
+                return
+            sourceList:SourceList = await self.hass.async_add_executor_job(self._client.GetSourceList, False)
+            if any(item.Source == SoundTouchSources.STORED_MUSIC.value for item in sourceList):
+                _logsi.LogVerbose("'%s': MediaPlayer is starting a stored music search index crawl" % self.name)
+                self.data.stored_music_index.StartCrawl(self._client)
+
+        except Exception as ex:
+
+            # trace.
+            _logsi.LogVerbose("'%s': MediaPlayer could not start the stored music search index crawl: %s" % (self.name, str(ex)))
+
+
     async def async_will_remove_from_hass(self) -> None:
         """
         Entity being removed from hass (the opposite of async_added_to_hass).
@@ -3864,6 +5246,9 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                 self._socket.ClearListeners()
                 self._socket = None
 
+            # remove the device from the zone graph.
+            self._NotifyZoneGraphChanged(ZONE_GRAPH.UnregisterEntity(self._client.Device.DeviceId))
+
         except Exception as ex:
             
             # trace.
@@ -3903,8 +5288,15 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             if media_content_type is None and media_content_id is None:
 
                 # if SpotifyPlus integration is not installed, then hide spotify icon.
-                isSpotifyPlusInstalled:bool = self._IsSpotifyPlusIntegrationInstalled()
-                LIBRARY_MAP[BrowsableMedia.SPOTIFY_LIBRARY_INDEX]["is_index_item"] = isSpotifyPlusInstalled
+                hiddenMediaTypes:list[str] = []
+                if not self._IsSpotifyPlusIntegrationInstalled():
+                    hiddenMediaTypes.append(BrowsableMedia.SPOTIFY_LIBRARY_INDEX.value)
+
+                # if the device has no music library (STORED_MUSIC) sources, then hide music library icon.
+                # only the cached source list is checked, so that the device is not queried on the event loop.
+                sourceList:SourceList = self._client.ConfigurationCache.get(SoundTouchNodes.sources.Path, None)
+                if (sourceList is not None) and (not any(item.Source == SoundTouchSources.STORED_MUSIC.value for item in sourceList)):
+                    hiddenMediaTypes.append(BrowsableMedia.STORED_MUSIC.value)
 
                 # handle initial media browser selection (e.g. show the starting index).
                 _logsi.LogVerbose("'%s': MediaPlayer is browsing main media library index content id '%s'" % (self.name, media_content_id))
@@ -3917,12 +5309,13 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                     BrowsableMedia.LIBRARY_INDEX,
                     media_content_type,
                     media_content_id,
+                    hiddenMediaTypes=hiddenMediaTypes,
                 )
 
             elif media_content_type == BrowsableMedia.SPOTIFY_LIBRARY_INDEX.value:
 
                 # verify SpotifyPlus integration configuration.
-                self._VerifySpotifyPlusIntegrationSetup()
+                title:str = self._VerifySpotifyPlusIntegrationSetup()
 
                 # handle spotify media browser selection (e.g. show the starting Spotify index).
                 _logsi.LogVerbose("'%s': MediaPlayer is browsing Spotify media library index content id '%s'" % (self.name, media_content_id))
@@ -3935,6 +5328,7 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                     BrowsableMedia.SPOTIFY_LIBRARY_INDEX,
                     media_content_type,
                     media_content_id,
+                    title=title,
                 )
 
             elif media_content_id is not None and media_content_id.startswith('media-source://'):
@@ -3972,10 +5366,10 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                     library_map:dict = SPOTIFY_LIBRARY_MAP
                 
                 # handle soundtouchplus media library selection.
-                # note that this is NOT async, as SoundTouchClient is not async!
+                # note that SoundTouch content is retrieved in an executor thread (as SoundTouchClient
+                # is not async), while Spotify content is retrieved natively on the event loop.
                 _logsi.LogVerbose("'%s': MediaPlayer is browsing media node content id '%s'" % (self.name, media_content_id))
-                return await self.hass.async_add_executor_job(
-                    browse_media_node,
+                return await async_browse_media_node(
                     self.hass,
                     self.data,
                     self.name,
@@ -4020,11 +5414,11 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
                 if isSpotifyPlusInstalled:
                     # if SpotifyPlus integration IS installed, then log its services list.
                     service = self.hass.services.async_services().get(DOMAIN_SPOTIFYPLUS.lower(), [])
-                    _logsi.LogDictionary(SILevel.Verbose, "'%s': MediaPlayer SpotifyPlus service list" % self.name, service, prettyPrint=True)
+                    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, "'%s': MediaPlayer SpotifyPlus service list" % self.name, service, prettyPrint=True)
                 else:
                     # if SpotifyPlus integration is NOT installed, then log the services that ARE installed in case we need it.
                     serviceAll = self.hass.services.async_services()
-                    _logsi.LogDictionary(SILevel.Verbose, "'%s': MediaPlayer ALL services list" % self.name, serviceAll, prettyPrint=True)
+                    TRACE_SINK.LogDictionary(_logsi, SILevel.Verbose, "'%s': MediaPlayer ALL services list" % self.name, serviceAll, prettyPrint=True)
 
             return isSpotifyPlusInstalled
 
@@ -4034,10 +5428,14 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             _logsi.LeaveMethod(SILevel.Debug)
 
 
-    def _VerifySpotifyPlusIntegrationSetup(self) -> None:
+    def _VerifySpotifyPlusIntegrationSetup(self) -> str:
         """
         Verifies that the SpotifyPlus integration is installed, and the media player entity id
         is valid and available (not disabled).
+
+        Returns:
+            The Spotify library index title, which includes the SpotifyPlus media player
+            friendly name that will be used to query Spotify for data.
         """
         entity_registry:EntityRegistry = None
         
@@ -4062,7 +5460,7 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             # it WILL be in the entity registry if it is disabled, with disabled property = True.
             entity_registry = er.async_get(self.hass)
             registry_entry:RegistryEntry = entity_registry.async_get(spotifyMPEntityId)
-            _logsi.LogObject(SILevel.Verbose, "'%s': MediaPlayer RegistryEntry for entity_id: '%s'" % (self.name, spotifyMPEntityId), registry_entry)
+            TRACE_SINK.LogObject(_logsi, SILevel.Verbose, "'%s': MediaPlayer RegistryEntry for entity_id: '%s'" % (self.name, spotifyMPEntityId), registry_entry)
 
             # raise exceptions if SpotifyPlus Entity is not configured or is disabled.
             if registry_entry is None:
@@ -4070,11 +5468,11 @@ class SoundTouchMediaPlayer(MediaPlayerEntity):
             if registry_entry.disabled:
                 raise HomeAssistantError("'%s': The SpotifyPlus media player entity '%s' is currently disabled; re-enable the SpotifyPlus media player, or choose another SpotifyPlus media player in the SoundTouchPlus options configuration" % (self.name, spotifyMPEntityId))
 
-            # modify spotify library map title to append the spotifyplus media
+            # build spotify library index title to append the spotifyplus media
             # player friendly name that will be used to query spotify for data.
             titleWithName = SPOTIFY_LIBRARY_MAP[BrowsableMedia.SPOTIFY_LIBRARY_INDEX].get("title_with_name","")
             titleWithName = titleWithName % (registry_entry.name or registry_entry.original_name)
-            SPOTIFY_LIBRARY_MAP[BrowsableMedia.SPOTIFY_LIBRARY_INDEX]["title"] = titleWithName
+            return titleWithName
 
         finally:
 
@@ -0,0 +1,208 @@
+"""
+Media search index for the SoundTouchPlus component.
+
+Automations and voice assistants often need to find an item (e.g. "the jazz station")
+across the presets, recently played items, and recently played cache of a device.  The
+index keeps an in-memory inverted index over the names, sources, and locations of those
+items for each device, so that a search does not have to retrieve and filter each list.
+
+Each list is indexed as a separate collection, which is versioned by the last updated
+value that the media player maintains from device update events; a collection is only
+rebuilt when it's version changes.
+"""
+from collections import defaultdict
+import re
+import threading
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+MEDIA_SEARCH_PRESETS:str = "presets"
+""" Media search index collection name for device presets. """
+
+MEDIA_SEARCH_RECENTS:str = "recents"
+""" Media search index collection name for device recently played items. """
+
+MEDIA_SEARCH_RECENTS_CACHE:str = "recents_cache"
+""" Media search index collection name for the recently played items cache. """
+
+MEDIA_SEARCH_COLLECTIONS:list[str] = [MEDIA_SEARCH_PRESETS, MEDIA_SEARCH_RECENTS, MEDIA_SEARCH_RECENTS_CACHE]
+""" Media search index collection names, in ranking tie-break order. """
+
+MEDIA_SEARCH_LIMIT:int = 25
+""" Default max number of items to return from a search. """
+
+_NOT_INDEXED:object = object()
+""" Version value of a collection that has not been indexed. """
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+""" Regular expression used to split search text into tokens. """
+
+
+class MediaSearchIndex:
+    """
+    Per device inverted index of preset, recently played, and recently played cache items.
+
+    Items are indexed by the tokens of their name, source (and source title), and location
+    values.  Searches match items that contain every search token (as a whole token or a
+    token prefix), and are ranked by where the tokens matched (name matches outrank
+    source matches, which outrank location matches).
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+        """
+        self._documents:dict[int, tuple] = {}
+        self._documentsByCollection:dict[str, list[int]] = {}
+        self._lock:threading.Lock = threading.Lock()
+        self._nextDocumentId:int = 0
+        self._postings:dict[str, set[int]] = defaultdict(set)
+        self._versions:dict[str, object] = {}
+
+
+    @property
+    def Count(self) -> int:
+        """ Number of items currently in the index. """
+        return len(self._documents)
+
+
+    def IsCurrent(self, collection:str, version:object) -> bool:
+        """
+        Returns True if a collection was indexed for the specified version; otherwise, False.
+        """
+        return self._versions.get(collection, _NOT_INDEXED) == version
+
+
+    def Search(self, criteria:str, collections:list[str]=None, limit:int=MEDIA_SEARCH_LIMIT) -> list[dict]:
+        """
+        Searches the index for items that match all of the words in the search criteria.
+
+        Args:
+            criteria (str):
+                Search criteria (e.g. "jazz station").  The search is case-insensitive.
+            collections (list[str]):
+                Collections to search (e.g. `MEDIA_SEARCH_PRESETS`), or None to search all
+                collections.
+            limit (int):
+                Max number of items to return.
+
+        Returns:
+            A list of dictionaries, ranked by score (highest first).  Each contains the
+            `Collection` name, the `Score`, and the `Item` dictionary.
+        """
+        tokens:list[str] = _TOKEN_PATTERN.findall((criteria or "").lower())
+        if len(tokens) == 0:
+            return []
+        phrase:str = " ".join(tokens)
+
+        with self._lock:
+
+            # find documents that contain every token (as a token or token prefix).
+            candidates:set[int] = None
+            for token in tokens:
+                matches:set[int] = set()
+                for term, postings in self._postings.items():
+                    if term.startswith(token):
+                        matches.update(postings)
+                candidates = matches if candidates is None else (candidates & matches)
+                if len(candidates) == 0:
+                    return []
+
+            # score the candidates.
+            ranked:list[tuple] = []
+            for documentId in candidates:
+                collection, position, item, nameTokens, sourceTokens, locationTokens, nameLower = self._documents[documentId]
+                if (collections is not None) and (collection not in collections):
+                    continue
+                score:int = 0
+                for token in tokens:
+                    score += max(
+                        self._ScoreToken(token, nameTokens, 6, 4),
+                        self._ScoreToken(token, sourceTokens, 3, 2),
+                        self._ScoreToken(token, locationTokens, 1, 1),
+                    )
+                if nameLower == phrase:
+                    score += 10
+                elif phrase in nameLower:
+                    score += 5
+                ranked.append((-score, MEDIA_SEARCH_COLLECTIONS.index(collection), position, score, collection, item))
+            ranked.sort(key=lambda entry: entry[:3])
+
+            return [{"Collection": collection, "Score": score, "Item": item.ToDictionary()} for _, _, _, score, collection, item in ranked[:max(0, limit)]]
+
+
+    def Update(self, collection:str, version:object, items:list) -> bool:
+        """
+        Replaces the items of a collection, unless it was already indexed for the version.
+
+        Args:
+            collection (str):
+                Collection name (e.g. `MEDIA_SEARCH_PRESETS`).
+            version (object):
+                Version of the items (e.g. the presets last updated value).
+            items (list):
+                The `Preset` or `Recent` items of the collection.
+
+        Returns:
+            True if the collection was rebuilt; otherwise, False.
+        """
+        with self._lock:
+            if self._versions.get(collection, _NOT_INDEXED) == version:
+                return False
+
+            # remove the previously indexed items.
+            for documentId in self._documentsByCollection.pop(collection, []):
+                document:tuple = self._documents.pop(documentId)
+                for token in document[3] | document[4] | document[5]:
+                    postings:set[int] = self._postings.get(token, None)
+                    if postings is not None:
+                        postings.discard(documentId)
+                        if len(postings) == 0:
+                            del self._postings[token]
+
+            # index the items.
+            documentIds:list[int] = []
+            for position, item in enumerate(items or []):
+                nameTokens:set[str] = self._GetTokens(item.Name)
+                sourceTokens:set[str] = self._GetTokens(item.Source) | self._GetTokens(item.SourceTitle)
+                locationTokens:set[str] = self._GetTokens(item.Location)
+                documentId:int = self._nextDocumentId
+                self._nextDocumentId += 1
+                self._documents[documentId] = (collection, position, item, nameTokens, sourceTokens, locationTokens, " ".join(_TOKEN_PATTERN.findall((item.Name or "").lower())))
+                for token in nameTokens | sourceTokens | locationTokens:
+                    self._postings[token].add(documentId)
+                documentIds.append(documentId)
+            self._documentsByCollection[collection] = documentIds
+            self._versions[collection] = version
+
+        _logsi.LogVerbose("MediaSearchIndex rebuilt collection '%s' (%d items)" % (collection, len(documentIds)))
+        return True
+
+
+    @staticmethod
+    def _GetTokens(text:str) -> set[str]:
+        """
+        Returns the set of lower-case word tokens of a text value.
+        """
+        return set(_TOKEN_PATTERN.findall((text or "").lower()))
+
+
+    @staticmethod
+    def _ScoreToken(token:str, fieldTokens:set[str], exactScore:int, prefixScore:int) -> int:
+        """
+        Returns the score of a search token against the tokens of a field.
+        """
+        if token in fieldTokens:
+            return exactScore
+        if any(fieldToken.startswith(token) for fieldToken in fieldTokens):
+            return prefixScore
+        return 0
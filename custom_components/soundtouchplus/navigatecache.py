@@ -0,0 +1,283 @@
+"""
+Navigate response cache for the SoundTouchPlus component.
+
+SoundTouch `navigate` requests (e.g. music service station lists) are among the
+slowest requests a device processes, and can take several seconds to complete.  The
+cache keeps navigate responses per device, keyed by the navigate criteria, and serves
+them with stale-while-revalidate semantics: once an entry is stale (due to age or an
+invalidating device event) it is still returned to the caller, while a fresh response
+is retrieved in the background.
+"""
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from bosesoundtouchapi import SoundTouchClient
+from bosesoundtouchapi.models import Navigate, NavigateResponse
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+NAVIGATE_CACHE_MAX_AGE:float = 900.0
+""" Number of seconds after which a cached navigate response is stale. """
+
+NAVIGATE_CACHE_MAX_ITEMS:int = 200
+""" Maximum number of navigate responses to retain in the cache. """
+
+NAVIGATE_CATEGORY_LIBRARY:str = "library"
+""" Cache key category for music library container pages (e.g. STORED_MUSIC). """
+
+NAVIGATE_CATEGORY_STATIONS:str = "stations"
+""" Cache key category for music service station lists (e.g. PANDORA). """
+
+
+class NavigateCache:
+    """
+    Per device cache of navigate responses, with stale-while-revalidate semantics.
+
+    Background refreshes are processed one at a time by a single worker thread, so
+    that the device is not flooded with navigate requests.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, maxAge:float=NAVIGATE_CACHE_MAX_AGE, maxItems:int=NAVIGATE_CACHE_MAX_ITEMS) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxAge (float):
+                Number of seconds after which a cached navigate response is stale.
+            maxItems (int):
+                Maximum number of navigate responses to retain in the cache.
+        """
+        self._entries:OrderedDict[tuple, list] = OrderedDict()
+        self._executor:ThreadPoolExecutor = None
+        self._hits:int = 0
+        self._hitsStale:int = 0
+        self._lock:threading.Lock = threading.Lock()
+        self._maxAge:float = maxAge
+        self._maxItems:int = max(1, maxItems)
+        self._misses:int = 0
+        self._refreshing:set[tuple] = set()
+
+
+    @property
+    def Count(self) -> int:
+        """ Number of navigate responses currently in the cache. """
+        return len(self._entries)
+
+
+    @property
+    def Hits(self) -> int:
+        """ Number of requests that were satisfied with a fresh cached response. """
+        return self._hits
+
+
+    @property
+    def HitsStale(self) -> int:
+        """ Number of requests that were satisfied with a stale cached response. """
+        return self._hitsStale
+
+
+    @property
+    def Misses(self) -> int:
+        """ Number of requests that required the device to be queried. """
+        return self._misses
+
+
+    def Clear(self) -> None:
+        """
+        Removes all navigate responses from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+    def Get(self, key:tuple, fetch:Callable[[], NavigateResponse]) -> NavigateResponse:
+        """
+        Returns the cached navigate response for a key, querying the device if it is
+        not cached.
+
+        Args:
+            key (tuple):
+                Cache key; the first three values must be the music service source, 
+                source account, and key category (e.g. `NAVIGATE_CATEGORY_STATIONS`).
+            fetch (Callable):
+                Function that queries the device for the navigate response.
+
+        Returns:
+            A `NavigateResponse` object.  It is shared with other callers, so it must
+            not be modified.
+
+        If the cached response is stale, then it is returned and a background refresh
+        is started.  This method blocks while the device is queried (on a miss), so it
+        should not be called from the event loop.
+        """
+        with self._lock:
+            entry:list = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                isStale:bool = entry[2] or ((time.monotonic() - entry[1]) > self._maxAge)
+                if isStale:
+                    self._hitsStale += 1
+                else:
+                    self._hits += 1
+            else:
+                self._misses += 1
+
+        # if not cached, then query the device.
+        if entry is None:
+            _logsi.LogVerbose("NavigateCache is querying the device for %s" % str(key))
+            response:NavigateResponse = fetch()
+            self._Store(key, response, fetch)
+            return response
+
+        # if stale, then refresh in the background.
+        if isStale:
+            _logsi.LogVerbose("NavigateCache is returning a stale response for %s, and refreshing it" % str(key))
+            self._RefreshInBackground(key)
+
+        return entry[0]
+
+
+    def GetMusicLibraryItems(self, client:SoundTouchClient, criteria:Navigate) -> NavigateResponse:
+        """
+        Returns a page of music library items from the specified music library container
+        (e.g. STORED_MUSIC, etc), from the cache if possible.
+
+        Args:
+            client (SoundTouchClient):
+                SoundTouchClient instance used to query the device.
+            criteria (Navigate):
+                Navigate criteria used to search the music library; the `StartItem` and
+                `NumItems` values select the page.
+        """
+        location:str = None
+        if (criteria.ContainerItem is not None) and (criteria.ContainerItem.ContentItem is not None):
+            location = criteria.ContainerItem.ContentItem.Location
+        key:tuple = (criteria.Source, criteria.SourceAccount, NAVIGATE_CATEGORY_LIBRARY, location, criteria.StartItem, criteria.NumItems)
+        return self.Get(key, lambda: client.GetMusicLibraryItems(criteria))
+
+
+    def GetMusicServiceStations(self, client:SoundTouchClient, criteria:Navigate) -> NavigateResponse:
+        """
+        Returns a list of stored stations from the specified music service (e.g. PANDORA, etc),
+        from the cache if possible.
+
+        Args:
+            client (SoundTouchClient):
+                SoundTouchClient instance used to query the device.
+            criteria (Navigate):
+                Navigate criteria used to search the music service.
+        """
+        key:tuple = (criteria.Source, criteria.SourceAccount, NAVIGATE_CATEGORY_STATIONS, criteria.SortType)
+        return self.Get(key, lambda: client.GetMusicServiceStations(criteria))
+
+
+    def Invalidate(self, source:str=None, category:str=None) -> int:
+        """
+        Marks cached navigate responses as stale, and starts a background refresh of them.
+
+        Args:
+            source (str):
+                Music service source (e.g. "PANDORA") whose responses are invalidated, or
+                None to invalidate responses for all sources.
+            category (str):
+                Key category (e.g. `NAVIGATE_CATEGORY_STATIONS`) whose responses are 
+                invalidated, or None to invalidate responses for all categories.
+
+        Returns:
+            The number of responses that were invalidated.
+        """
+        keys:list[tuple] = []
+        with self._lock:
+            for key, entry in self._entries.items():
+                if ((source is None) or (key[0] == source)) and ((category is None) or (key[2] == category)):
+                    entry[2] = True
+                    keys.append(key)
+
+        for key in keys:
+            self._RefreshInBackground(key)
+        return len(keys)
+
+
+    def IsCached(self, source:str, category:str=None) -> bool:
+        """
+        Returns True if any navigate responses are cached for the music service source
+        (and key category, if specified); otherwise, False.
+        """
+        with self._lock:
+            return any((key[0] == source) and ((category is None) or (key[2] == category)) for key in self._entries)
+
+
+    def Shutdown(self) -> None:
+        """
+        Stops the background refresh worker thread; pending refreshes are discarded.
+        """
+        with self._lock:
+            executor:ThreadPoolExecutor = self._executor
+            self._executor = None
+            self._refreshing.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+    def _Refresh(self, key:tuple) -> None:
+        """
+        Queries the device for a fresh navigate response (background worker thread).
+        """
+        try:
+
+            with self._lock:
+                entry:list = self._entries.get(key, None)
+            if entry is None:
+                return
+
+            response:NavigateResponse = entry[3]()
+            self._Store(key, response, entry[3])
+            _logsi.LogVerbose("NavigateCache refreshed %s" % str(key))
+
+        except Exception as ex:
+
+            # keep the stale response; it will be refreshed again on the next request.
+            _logsi.LogVerbose("NavigateCache could not refresh %s: %s" % (str(key), str(ex)))
+
+        finally:
+
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+    def _RefreshInBackground(self, key:tuple) -> None:
+        """
+        Starts a background refresh of a cached navigate response, unless one is already
+        in progress.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SoundTouchPlusNavigateCache")
+            self._executor.submit(self._Refresh, key)
+
+
+    def _Store(self, key:tuple, response:NavigateResponse, fetch:Callable[[], NavigateResponse]) -> None:
+        """
+        Adds (or replaces) a cached navigate response, evicting the least recently used
+        responses if the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = [response, time.monotonic(), False, fetch]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxItems:
+                self._entries.popitem(last=False)
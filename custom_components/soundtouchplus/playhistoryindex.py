@@ -0,0 +1,351 @@
+"""
+Play history index for the SoundTouchPlus component.
+
+Each SoundTouch device keeps it's own recently played list, so the same station or
+playlist is stored once per device and cannot be queried across devices.  The index is
+shared by all media players; it is fed by every device's now playing and recents update
+events, and keeps a single (deduplicated) entry per content item with per-device play
+counts and last played times, so that "most played this week" queries can be answered
+for the whole house (or a single device).
+
+The index is persisted in Home Assistant storage shortly after new plays are recorded
+(plays recorded in quick succession are saved together), and loaded when the component
+is set up.
+"""
+from collections import deque
+import threading
+import time
+
+from bosesoundtouchapi.models import ContentItem
+
+from homeassistant.core import HomeAssistant
+
+from .storepersistence import StorePersistence
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+PLAY_HISTORY_MAX_ITEMS:int = 2000
+""" Max number of content items to retain; the least recently played items are removed first. """
+
+PLAY_HISTORY_REPLAY_SECONDS:float = 1800.0
+"""
+Number of seconds a device must not report an item before playing it again counts as
+a new play; this stops long streams (and repeated now playing events) from being
+counted more than once.
+"""
+
+PLAY_HISTORY_SAVE_DELAY:float = 30.0
+""" Number of seconds after a new play is recorded that the index is saved. """
+
+PLAY_HISTORY_WINDOW_SECONDS:float = 30 * 86400.0
+""" Number of seconds of individual plays retained per item, for period queries. """
+
+PLAY_HISTORY_VERSION:int = 1
+""" Version of the persisted index format. """
+
+
+class PlayHistoryItem:
+    """
+    A deduplicated content item of the play history index.
+    """
+
+    def __init__(self, contentItem:ContentItem, sourceTitle:str=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            contentItem (ContentItem):
+                The content item that was played.
+            sourceTitle (str):
+                Source title (e.g. "TuneIn") of the content item, if known.
+        """
+        self._ContentItem:ContentItem = contentItem
+        self._DevicePlayCounts:dict[str, int] = {}
+        self._DeviceLastPlayedOn:dict[str, float] = {}
+        self._DeviceLastSeenOn:dict[str, float] = {}
+        self._Plays:deque[tuple[float, str]] = deque()
+        self._SourceTitle:str = sourceTitle
+
+
+    @property
+    def ContentItem(self) -> ContentItem:
+        """ The content item that was played (as most recently reported). """
+        return self._ContentItem
+
+
+    @property
+    def LastPlayedOn(self) -> float:
+        """ Date and time (epoch seconds) the item was last played on any device. """
+        return max(self._DeviceLastPlayedOn.values(), default=0)
+
+
+    @property
+    def Name(self) -> str:
+        """ Content item name. """
+        return self._ContentItem.Name
+
+
+    @property
+    def PlayCount(self) -> int:
+        """ Total number of times the item was played on all devices. """
+        return sum(self._DevicePlayCounts.values())
+
+
+    @property
+    def SourceTitle(self) -> str:
+        """ Source title (e.g. "TuneIn") of the content item, if known. """
+        return self._SourceTitle
+
+
+    def GetPlayCount(self, since:float=None, deviceId:str=None) -> int:
+        """
+        Returns the number of times the item was played.
+
+        Args:
+            since (float):
+                Only count plays on or after this date and time (epoch seconds); plays
+                older than `PLAY_HISTORY_WINDOW_SECONDS` are not retained for this purpose.
+            deviceId (str):
+                Only count plays on this device, or None for all devices.
+        """
+        if since is None:
+            if deviceId is None:
+                return self.PlayCount
+            return self._DevicePlayCounts.get(deviceId, 0)
+        return sum(1 for playedOn, playDeviceId in self._Plays if (playedOn >= since) and ((deviceId is None) or (playDeviceId == deviceId)))
+
+
+    def ToDictionary(self, deviceNames:dict[str, str]=None) -> dict:
+        """
+        Returns a dictionary representation of the class.
+
+        Args:
+            deviceNames (dict[str, str]):
+                Device names keyed by device id, used to label the per-device values.
+        """
+        deviceNames = deviceNames or {}
+        return {
+            "ContentItem": self._ContentItem.ToDictionary(),
+            "SourceTitle": self._SourceTitle,
+            "PlayCount": self.PlayCount,
+            "LastPlayedOn": int(self.LastPlayedOn),
+            "Devices": [
+                {
+                    "DeviceId": deviceId,
+                    "DeviceName": deviceNames.get(deviceId, deviceId),
+                    "PlayCount": playCount,
+                    "LastPlayedOn": int(self._DeviceLastPlayedOn.get(deviceId, 0)),
+                }
+                for deviceId, playCount in sorted(self._DevicePlayCounts.items(), key=lambda entry: -entry[1])
+            ],
+        }
+
+
+class PlayHistoryIndex:
+    """
+    Deduplicated play history of all SoundTouch devices.
+
+    Content items are deduplicated by source and location (or source and name, if
+    there is no location).
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, maxItems:int=PLAY_HISTORY_MAX_ITEMS) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxItems (int):
+                Max number of content items to retain.
+        """
+        self._deviceNames:dict[str, str] = {}
+        self._items:dict[tuple, PlayHistoryItem] = {}
+        self._lock:threading.Lock = threading.Lock()
+        self._maxItems:int = max(1, maxItems)
+        self._persistence:StorePersistence = None
+
+
+    @property
+    def Count(self) -> int:
+        """ Number of content items currently in the index. """
+        return len(self._items)
+
+
+    def GetMostPlayed(self, since:float=None, deviceId:str=None, limit:int=25) -> list[tuple[PlayHistoryItem, int]]:
+        """
+        Returns the most played content items.
+
+        Args:
+            since (float):
+                Only count plays on or after this date and time (epoch seconds), or None
+                to count all plays.
+            deviceId (str):
+                Only count plays on this device, or None for all devices.
+            limit (int):
+                Max number of items to return.
+
+        Returns:
+            A list of tuples of the item and it's play count for the period, ordered by
+            play count (highest first) and then by last played time (newest first).
+        """
+        with self._lock:
+            ranked:list[tuple[PlayHistoryItem, int]] = []
+            for item in self._items.values():
+                playCount:int = item.GetPlayCount(since, deviceId)
+                if playCount > 0:
+                    ranked.append((item, playCount))
+        ranked.sort(key=lambda entry: (-entry[1], -entry[0].LastPlayedOn))
+        return ranked[:max(0, limit)]
+
+
+    def GetDeviceNames(self) -> dict[str, str]:
+        """
+        Returns the names of devices that have reported plays, keyed by device id.
+        """
+        with self._lock:
+            return dict(self._deviceNames)
+
+
+    async def async_Load(self, hass:HomeAssistant, key:str) -> None:
+        """
+        Loads the index from Home Assistant storage (if it was stored), and persists
+        the index there from now on.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+            key (str):
+                Storage key of the index.
+        """
+        self._persistence = StorePersistence(hass, key, PLAY_HISTORY_VERSION, self._GetData, PLAY_HISTORY_SAVE_DELAY)
+        data:dict = await self._persistence.async_Load()
+        if data is None:
+            return
+
+        try:
+
+            with self._lock:
+                self._deviceNames.update(data.get("devices", {}))
+                for entry in data.get("items", []):
+                    source, typeValue, location, sourceAccount, isPresetable, name, containerArt = entry["contentItem"]
+                    item:PlayHistoryItem = PlayHistoryItem(ContentItem(source, typeValue, location, sourceAccount, isPresetable, name=name, containerArt=containerArt), entry.get("sourceTitle", None))
+                    item._DevicePlayCounts = entry.get("playCounts", {})
+                    item._DeviceLastPlayedOn = entry.get("lastPlayedOn", {})
+                    item._DeviceLastSeenOn = dict(item._DeviceLastPlayedOn)
+                    item._Plays = deque(tuple(play) for play in entry.get("plays", []))
+                    self._items[self._GetKey(item.ContentItem)] = item
+            _logsi.LogVerbose("PlayHistoryIndex loaded %d items from '%s'" % (len(self._items), self._persistence.Key))
+
+        except (TypeError, ValueError, KeyError) as ex:
+            _logsi.LogWarning("PlayHistoryIndex could not load '%s': %s" % (self._persistence.Key, str(ex)))
+
+
+    def RecordPlay(self, deviceId:str, deviceName:str, contentItem:ContentItem, playedOn:float=None, sourceTitle:str=None) -> bool:
+        """
+        Records that a content item is playing (or was played) on a device.
+
+        Args:
+            deviceId (str):
+                Id of the device that played the item.
+            deviceName (str):
+                Name of the device that played the item.
+            contentItem (ContentItem):
+                The content item that was played.
+            playedOn (float):
+                Date and time (epoch seconds) the item was played; default is now.
+            sourceTitle (str):
+                Source title (e.g. "TuneIn") of the content item, if known.
+
+        Returns:
+            True if a new play was counted; otherwise, False (e.g. the device has reported
+            the item within the last `PLAY_HISTORY_REPLAY_SECONDS`).
+
+        This method can be called repeatedly for the same play (e.g. for every now playing
+        event); a new play is only counted if the device has not reported the item for
+        `PLAY_HISTORY_REPLAY_SECONDS`.
+        """
+        if (contentItem is None) or (contentItem.Source is None) or ((contentItem.Location is None) and (contentItem.Name is None)):
+            return False
+        if playedOn is None:
+            playedOn = time.time()
+
+        with self._lock:
+
+            if deviceName is not None:
+                self._deviceNames[deviceId] = deviceName
+
+            key:tuple = self._GetKey(contentItem)
+            item:PlayHistoryItem = self._items.pop(key, None)
+            if item is None:
+                item = PlayHistoryItem(contentItem, sourceTitle)
+            else:
+                # keep the most descriptive details that have been reported.
+                if (contentItem.Name is not None) and (playedOn >= item.LastPlayedOn):
+                    item._ContentItem = contentItem
+                if sourceTitle is not None:
+                    item._SourceTitle = sourceTitle
+            self._items[key] = item
+
+            # count a new play if the device has not reported the item recently.
+            lastSeenOn:float = item._DeviceLastSeenOn.get(deviceId, None)
+            isNewPlay:bool = (lastSeenOn is None) or (playedOn - lastSeenOn > PLAY_HISTORY_REPLAY_SECONDS)
+            if (lastSeenOn is None) or (playedOn > lastSeenOn):
+                item._DeviceLastSeenOn[deviceId] = playedOn
+            if isNewPlay:
+                item._DevicePlayCounts[deviceId] = item._DevicePlayCounts.get(deviceId, 0) + 1
+                item._DeviceLastPlayedOn[deviceId] = max(playedOn, item._DeviceLastPlayedOn.get(deviceId, 0))
+                item._Plays.append((playedOn, deviceId))
+                while (len(item._Plays) > 0) and (item._Plays[0][0] < time.time() - PLAY_HISTORY_WINDOW_SECONDS):
+                    item._Plays.popleft()
+
+            # remove the least recently reported items if the index is full.
+            while len(self._items) > self._maxItems:
+                self._items.pop(next(iter(self._items)))
+
+        # save the new play shortly, so that it survives an unclean shutdown.
+        if (isNewPlay) and (self._persistence is not None):
+            self._persistence.ScheduleSave()
+
+        return isNewPlay
+
+
+    def _GetData(self) -> dict:
+        """
+        Returns the index data to persist.
+        """
+        with self._lock:
+            items:list[dict] = []
+            for item in self._items.values():
+                ci:ContentItem = item.ContentItem
+                items.append({
+                    "contentItem": [ci.Source, ci.TypeValue, ci.Location, ci.SourceAccount, ci.IsPresetable, ci.Name, ci.ContainerArt],
+                    "sourceTitle": item.SourceTitle,
+                    "playCounts": dict(item._DevicePlayCounts),
+                    "lastPlayedOn": dict(item._DeviceLastPlayedOn),
+                    "plays": list(item._Plays),
+                })
+            return {"devices": dict(self._deviceNames), "items": items}
+
+
+    @staticmethod
+    def _GetKey(contentItem:ContentItem) -> tuple:
+        """
+        Returns the deduplication key of a content item.
+        """
+        if contentItem.Location:
+            return (contentItem.Source, contentItem.Location)
+        return (contentItem.Source, None, contentItem.Name)
+
+
+PLAY_HISTORY_INDEX:PlayHistoryIndex = PlayHistoryIndex()
+"""
+Shared play history index instance used by all media players.
+"""
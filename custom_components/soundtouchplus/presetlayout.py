@@ -0,0 +1,131 @@
+"""
+Preset layout writer for the SoundTouchPlus component.
+
+A preset layout (e.g. from the preset_store_bulk service, or the presets section of a
+fleet configuration document) is applied as a diff: only the preset slots that differ
+from the current preset list are written.  The device keeps one slot per content item;
+storing a preset empties any other slot that held the same content, so moved presets
+empty their old slot as a side effect of the store.  Unlisted slots are removed based
+on the preset list after the stores, and the result is taken from the resulting preset
+list rather than from the planned writes.
+"""
+from collections.abc import Callable
+
+from bosesoundtouchapi import SoundTouchClient
+from bosesoundtouchapi.models import Preset, PresetList
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+def GetPresetContentKey(preset:Preset) -> tuple:
+    """
+    Returns the values of a preset that the device uses to detect duplicate presets.
+    """
+    return (
+        preset.Source or "",
+        preset.SourceAccount or "",
+        preset.Location or "",
+    )
+
+
+def GetPresetDiffKey(preset:Preset) -> tuple:
+    """
+    Returns the values of a preset that are compared to determine if a preset slot
+    has to be written.
+    """
+    return (
+        preset.Source or "",
+        preset.SourceAccount or "",
+        preset.TypeValue or "",
+        preset.Location or "",
+        preset.Name or "",
+        preset.ContainerArt or "",
+    )
+
+
+def StorePresetLayout(
+    client:SoundTouchClient,
+    targets:dict[int, Preset],
+    removeUnlisted:bool,
+    onWrites:Callable[[int], None]=None,
+    ) -> dict:
+    """
+    Writes the preset slots of a device that differ from a preset layout.
+
+    Args:
+        client (SoundTouchClient):
+            Client of the device to write the presets to; the current presets are taken
+            from the configuration cache.
+        targets (dict[int, Preset]):
+            The target presets, keyed by preset id.
+        removeUnlisted (bool):
+            True to remove presets from slots that are not in the target presets;
+            otherwise, False to leave them as-is.
+        onWrites (Callable[[int], None]):
+            Method that is called with the number of device writes that are about to be
+            issued (e.g. to defer presetsUpdated event processing).
+
+    Returns:
+        A dictionary that contains the preset ids that were `Stored`, `Removed`, and
+        `Unchanged`, the number of device `Writes` issued, and the resulting `PresetList`.
+
+    Raises:
+        ValueError:
+            The target presets list the same content in more than one slot, which the
+            device cannot hold.
+    """
+    # the device only keeps one slot per content item, so a layout cannot list content twice.
+    contentSlots:dict[tuple, int] = {}
+    for presetId, target in sorted(targets.items()):
+        contentKey:tuple = GetPresetContentKey(target)
+        if contentKey in contentSlots:
+            raise ValueError("Preset ID %d duplicates the content of preset ID %d" % (presetId, contentSlots[contentKey]))
+        contentSlots[contentKey] = presetId
+
+    # compare the target presets to the current (cached) preset list.
+    currentPresets:dict[int, Preset] = {preset.PresetId: preset for preset in client.GetPresetList(False)}
+    stores:list[Preset] = []
+    for presetId, target in sorted(targets.items()):
+        current:Preset = currentPresets.get(presetId, None)
+        if (current is None) or (GetPresetDiffKey(current) != GetPresetDiffKey(target)):
+            target.CreatedOn = current.CreatedOn if current is not None else None
+            stores.append(target)
+
+    # store the changed preset slots.
+    result:PresetList = None
+    if (onWrites is not None) and (len(stores) > 0):
+        onWrites(len(stores))
+    for target in stores:
+        result = client.StorePreset(target)
+
+    # remove unlisted presets that are still present after the stores (slots of moved
+    # presets were emptied by the device).
+    removes:list[int] = []
+    if removeUnlisted:
+        remaining:PresetList = result if result is not None else client.GetPresetList(False)
+        removes = [preset.PresetId for preset in remaining if preset.PresetId not in targets]
+        if (onWrites is not None) and (len(removes) > 0):
+            onWrites(len(removes))
+        for presetId in removes:
+            result = client.RemovePreset(presetId)
+
+    _logsi.LogVerbose("'%s': Preset layout applied (%d stores, %d removes)" % (client.Device.DeviceName, len(stores), len(removes)))
+
+    # report the result based on the resulting preset list.
+    if result is None:
+        result = client.GetPresetList(False)
+    stored:list[int] = [target.PresetId for target in stores]
+    finalIds:set[int] = {preset.PresetId for preset in result}
+    return {
+        "Stored": stored,
+        "Removed": sorted(presetId for presetId in currentPresets if presetId not in finalIds),
+        "Unchanged": sorted(presetId for presetId in currentPresets if (presetId in finalIds) and (presetId not in stored)),
+        "Writes": len(stores) + len(removes),
+        "PresetList": result,
+    }
@@ -0,0 +1,311 @@
+"""
+Recently played items store for the SoundTouchPlus component.
+
+The recently played items cache that is maintained by the SoundTouch api is a single
+xml file, which is rewritten every time an item is played; it's size has to be kept
+small, as large caches are slow to rewrite and reload.  The store keeps a history of
+recently played items for a device in a SQLite database, so that thousands of items
+can be retained and queried (by source and time) one page at a time.
+
+Items are written asynchronously: they are queued by the caller, and written by a
+background thread in batches (one transaction per batch).
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from bosesoundtouchapi.models import ContentItem, Recent
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+RECENTS_STORE_BATCH_SIZE:int = 50
+""" Max number of queued items to write in a single transaction. """
+
+RECENTS_STORE_FLUSH_INTERVAL:float = 5.0
+""" Max number of seconds that a queued item waits before it is written. """
+
+RECENTS_STORE_MAX_ITEMS:int = 10000
+""" Max number of items to retain in the store; the oldest items are removed first. """
+
+_SCHEMA:list[str] = [
+    """CREATE TABLE IF NOT EXISTS recents (
+        source TEXT NOT NULL,
+        name TEXT NOT NULL,
+        source_account TEXT,
+        source_title TEXT,
+        type_value TEXT,
+        location TEXT,
+        container_art TEXT,
+        is_presetable INTEGER,
+        device_id TEXT,
+        created_on INTEGER NOT NULL,
+        PRIMARY KEY (source, name)
+    )""",
+    "CREATE INDEX IF NOT EXISTS recents_created_on ON recents (created_on)",
+    "CREATE INDEX IF NOT EXISTS recents_source_created_on ON recents (source, created_on)",
+]
+""" Store database schema. """
+
+_COLUMNS:str = "source, name, source_account, source_title, type_value, location, container_art, is_presetable, device_id, created_on"
+""" Store database recents table columns, in `Recent` conversion order. """
+
+
+class RecentsStore:
+    """
+    SQLite backed store of recently played items, with asynchronous batched writes.
+
+    Items are keyed by source and name (the same as the SoundTouch api recently played
+    cache), so playing an item again moves it to the top of the list.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, maxItems:int=RECENTS_STORE_MAX_ITEMS) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxItems (int):
+                Max number of items to retain in the store.
+        """
+        self._connection:sqlite3.Connection = None
+        self._filePath:str = None
+        self._lastUpdatedOn:int = 0
+        self._lock:threading.Lock = threading.Lock()
+        self._maxItems:int = max(1, maxItems)
+        self._queue:queue.Queue = queue.Queue()
+        self._writerThread:threading.Thread = None
+
+
+    @property
+    def FilePath(self) -> str:
+        """ Path of the store database file, or None if the store is not open. """
+        return self._filePath
+
+
+    @property
+    def IsOpen(self) -> bool:
+        """ True if the store is open; otherwise, False. """
+        return self._connection is not None
+
+
+    @property
+    def LastUpdatedOn(self) -> int:
+        """ Date and time (epoch seconds) that an item was last written to the store. """
+        return self._lastUpdatedOn
+
+
+    def Add(self, recent:Recent) -> None:
+        """
+        Queues a recently played item to be written to the store.
+
+        Args:
+            recent (Recent):
+                The recently played item.
+
+        This method does not block, and can be called from the event loop.
+        """
+        if (self._connection is None) or (recent is None) or (recent.ContentItem is None):
+            return
+        self._queue.put(self._ToRow(recent))
+
+
+    def Close(self) -> None:
+        """
+        Writes any queued items, and closes the store.
+
+        This method blocks while queued items are written, so it should be called from
+        an executor thread.
+        """
+        writerThread:threading.Thread = self._writerThread
+        if writerThread is not None:
+            self._queue.put(None)
+            writerThread.join()
+            self._writerThread = None
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+    def Open(self, filePath:str, seedItems:list[Recent]=None) -> None:
+        """
+        Opens (creating if required) the store, and starts the background writer.
+
+        Args:
+            filePath (str):
+                Path of the store database file.
+            seedItems (list[Recent]):
+                Items to add to the store if it is empty (e.g. the items of the SoundTouch
+                api recently played cache, when the store is first created).
+
+        This method accesses the file system, so it should be called from an executor thread.
+        """
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+        connection:sqlite3.Connection = sqlite3.connect(filePath, check_same_thread=False)
+        try:
+
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+
+            with self._lock:
+                self._connection = connection
+                self._filePath = filePath
+                row:tuple = connection.execute("SELECT COUNT(*), MAX(created_on) FROM recents").fetchone()
+                self._lastUpdatedOn = row[1] or 0
+
+            # seed an empty store.
+            if (row[0] == 0) and (seedItems is not None) and (len(seedItems) > 0):
+                self._Write([self._ToRow(recent) for recent in seedItems if recent.ContentItem is not None])
+
+            self._writerThread = threading.Thread(target=self._WriterLoop, name="SoundTouchPlusRecentsStore", daemon=True)
+            self._writerThread.start()
+
+        except Exception:
+
+            # leave the store closed if it could not be opened.
+            with self._lock:
+                self._connection = None
+            connection.close()
+            raise
+
+        _logsi.LogVerbose("RecentsStore opened '%s' (%d items)" % (filePath, max(row[0], len(seedItems or []))))
+
+
+    def Query(self, source:str=None, since:int=None, until:int=None, offset:int=0, limit:int=50) -> tuple[list[Recent], int]:
+        """
+        Returns a page of recently played items, newest first.
+
+        Args:
+            source (str):
+                Source (e.g. "TUNEIN") of the items to return, or None for all sources.
+            since (int):
+                Only return items played on or after this date and time (epoch seconds).
+            until (int):
+                Only return items played before this date and time (epoch seconds).
+            offset (int):
+                The index of the first item to return.
+            limit (int):
+                Max number of items to return.
+
+        Returns:
+            A tuple of the list of `Recent` items, and the total number of items that
+            match the criteria.
+        """
+        conditions:list[str] = []
+        parms:list = []
+        if source is not None:
+            conditions.append("source = ?")
+            parms.append(source)
+        if since is not None:
+            conditions.append("created_on >= ?")
+            parms.append(since)
+        if until is not None:
+            conditions.append("created_on < ?")
+            parms.append(until)
+        where:str = (" WHERE " + " AND ".join(conditions)) if len(conditions) > 0 else ""
+
+        with self._lock:
+            if self._connection is None:
+                return [], 0
+            total:int = self._connection.execute("SELECT COUNT(*) FROM recents" + where, parms).fetchone()[0]
+            rows:list[tuple] = self._connection.execute(
+                "SELECT " + _COLUMNS + " FROM recents" + where + " ORDER BY created_on DESC LIMIT ? OFFSET ?",
+                parms + [max(0, limit), max(0, offset)]).fetchall()
+
+        return [self._ToRecent(row) for row in rows], total
+
+
+    @staticmethod
+    def _ToRecent(row:tuple) -> Recent:
+        """
+        Converts a store row to a `Recent` object.
+        """
+        source, name, sourceAccount, sourceTitle, typeValue, location, containerArt, isPresetable, deviceId, createdOn = row
+        recent:Recent = Recent()
+        recent.ContentItem = ContentItem(source, typeValue, location, sourceAccount, bool(isPresetable) if isPresetable is not None else None, name=name, containerArt=containerArt)
+        recent.CreatedOn = createdOn
+        recent.DeviceId = deviceId
+        recent.RecentId = createdOn
+        recent.SourceTitle = sourceTitle
+        return recent
+
+
+    @staticmethod
+    def _ToRow(recent:Recent) -> tuple:
+        """
+        Converts a `Recent` object to a store row.
+        """
+        contentItem:ContentItem = recent.ContentItem
+        return (
+            contentItem.Source or "",
+            contentItem.Name or "",
+            contentItem.SourceAccount,
+            recent.SourceTitle,
+            contentItem.TypeValue,
+            contentItem.Location,
+            contentItem.ContainerArt,
+            None if contentItem.IsPresetable is None else int(contentItem.IsPresetable),
+            recent.DeviceId,
+            recent.CreatedOn or int(time.time()),
+        )
+
+
+    def _Write(self, rows:list[tuple]) -> None:
+        """
+        Writes a batch of rows in a single transaction, and removes the oldest items if
+        the store exceeds it's max number of items.
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            with self._connection:
+                self._connection.executemany("INSERT OR REPLACE INTO recents (" + _COLUMNS + ") VALUES (?,?,?,?,?,?,?,?,?,?)", rows)
+                self._connection.execute(
+                    "DELETE FROM recents WHERE rowid IN (SELECT rowid FROM recents ORDER BY created_on DESC LIMIT -1 OFFSET ?)",
+                    (self._maxItems,))
+            self._lastUpdatedOn = max(self._lastUpdatedOn, max(row[9] for row in rows))
+
+
+    def _WriterLoop(self) -> None:
+        """
+        Writes queued items in batches (background writer thread); a None item stops
+        the writer once the queue has been written.
+        """
+        isStopping:bool = False
+        while not isStopping:
+
+            # wait for an item, then collect a batch (waiting no longer than the flush interval).
+            rows:list[tuple] = []
+            row:tuple = self._queue.get()
+            deadline:float = time.monotonic() + RECENTS_STORE_FLUSH_INTERVAL
+            while True:
+                if row is None:
+                    isStopping = True
+                    break
+                rows.append(row)
+                if len(rows) >= RECENTS_STORE_BATCH_SIZE:
+                    break
+                try:
+                    row = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            if len(rows) > 0:
+                try:
+                    self._Write(rows)
+                    _logsi.LogVerbose("RecentsStore wrote %d items" % len(rows))
+                except sqlite3.Error as ex:
+                    _logsi.LogWarning("RecentsStore could not write %d items: %s" % (len(rows), str(ex)))
@@ -0,0 +1,237 @@
+"""
+Named snapshot store for the SoundTouchPlus component.
+
+The SoundTouch api keeps a single snapshot (`SoundTouchClient.SnapshotSettings`) per
+device in memory, which is lost when the integration is reloaded or Home Assistant is
+restarted.  The store keeps named snapshots for a device in Home Assistant storage, so
+that a snapshot taken before an announcement can be restored after a restart.
+
+The snapshots are loaded when the device is set up, and the number of snapshots per
+device is capped; when the cap is reached, the least recently used snapshot is removed.
+"""
+from collections import OrderedDict
+import threading
+import time
+from xml.etree.ElementTree import Element
+
+from bosesoundtouchapi.models import ContentItem, NowPlayingStatus, Volume
+from bosesoundtouchapi.uri import SoundTouchNodes
+
+from homeassistant.core import HomeAssistant
+
+from .storepersistence import StorePersistence
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+SNAPSHOT_STORE_MAX_SLOTS:int = 10
+""" Max number of named snapshots to retain per device. """
+
+SNAPSHOT_STORE_SAVE_DELAY:float = 1.0
+""" Number of seconds after a snapshot is stored (or removed) that the store is saved. """
+
+SNAPSHOT_STORE_VERSION:int = 1
+""" Version of the persisted snapshot store format. """
+
+
+class SnapshotStore:
+    """
+    Per device store of named snapshots, persisted in Home Assistant storage.
+
+    Each snapshot contains the now playing content item (and status) and the volume
+    settings of a `SoundTouchClient.SnapshotSettings` dictionary, serialized as a
+    compact list of values.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, maxSlots:int=SNAPSHOT_STORE_MAX_SLOTS) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxSlots (int):
+                Max number of named snapshots to retain.
+        """
+        self._lock:threading.Lock = threading.Lock()
+        self._maxSlots:int = max(1, maxSlots)
+        self._persistence:StorePersistence = None
+        self._slots:OrderedDict[str, list] = OrderedDict()
+
+
+    async def async_Load(self, hass:HomeAssistant, key:str) -> None:
+        """
+        Loads the snapshots from Home Assistant storage (if they were stored), and
+        persists the snapshots there from now on.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+            key (str):
+                Storage key of the snapshots.
+        """
+        self._persistence = StorePersistence(hass, key, SNAPSHOT_STORE_VERSION, self._GetData, SNAPSHOT_STORE_SAVE_DELAY)
+        data:dict = await self._persistence.async_Load()
+        if data is None:
+            return
+
+        try:
+
+            with self._lock:
+                self._slots.clear()
+                for name, slot in data.get("snapshots", []):
+                    self._slots[name] = slot
+            _logsi.LogVerbose("SnapshotStore loaded %d snapshots from '%s'" % (len(self._slots), self._persistence.Key))
+
+        except (TypeError, ValueError) as ex:
+            _logsi.LogWarning("SnapshotStore could not load '%s': %s" % (self._persistence.Key, str(ex)))
+
+
+    def Get(self, name:str) -> dict:
+        """
+        Returns the settings of a named snapshot.
+
+        Args:
+            name (str):
+                Snapshot name.
+
+        Returns:
+            A snapshot settings dictionary (in `SoundTouchClient.SnapshotSettings` form),
+            or None if the snapshot was not found.
+        """
+        with self._lock:
+            slot:list = self._slots.get(name, None)
+            if slot is None:
+                return None
+            self._slots.move_to_end(name)
+        return self._FromSlot(slot)
+
+
+    def GetNames(self) -> list[str]:
+        """
+        Returns the names of the stored snapshots, least recently used first.
+        """
+        with self._lock:
+            return list(self._slots)
+
+
+    def Put(self, name:str, settings:dict) -> list[str]:
+        """
+        Stores the settings of a named snapshot (replacing a snapshot with the same name),
+        and schedules a save of the store.
+
+        Args:
+            name (str):
+                Snapshot name.
+            settings (dict):
+                Snapshot settings dictionary (e.g. `SoundTouchClient.SnapshotSettings`).
+
+        Returns:
+            The names of snapshots that were removed to keep the store within it's max
+            number of snapshots.
+        """
+        slot:list = self._ToSlot(settings)
+        removed:list[str] = []
+        with self._lock:
+            self._slots[name] = slot
+            self._slots.move_to_end(name)
+            while len(self._slots) > self._maxSlots:
+                removed.append(self._slots.popitem(last=False)[0])
+        self._Save()
+
+        if len(removed) > 0:
+            _logsi.LogVerbose("SnapshotStore removed least recently used snapshots: %s" % ", ".join(removed))
+        return removed
+
+
+    def Remove(self, name:str) -> bool:
+        """
+        Removes a named snapshot, and schedules a save of the store.
+
+        Returns:
+            True if the snapshot was removed; otherwise, False if it was not found.
+        """
+        with self._lock:
+            if self._slots.pop(name, None) is None:
+                return False
+        self._Save()
+        return True
+
+
+    @staticmethod
+    def _FromSlot(slot:list) -> dict:
+        """
+        Converts a compact snapshot slot to a snapshot settings dictionary.
+        """
+        createdOn, source, sourceAccount, playStatus, contentItem, volume = slot
+        settings:dict = {}
+
+        if source is not None:
+            # build the status from xml, as the status content item is not settable.
+            root:Element = Element("nowPlaying")
+            root.set("source", source)
+            if sourceAccount is not None:
+                root.set("sourceAccount", sourceAccount)
+            if contentItem is not None:
+                itemSource, typeValue, location, itemSourceAccount, isPresetable, name, containerArt = contentItem
+                root.append(ContentItem(itemSource, typeValue, location, itemSourceAccount, isPresetable, name=name, containerArt=containerArt).ToElement())
+            if playStatus is not None:
+                elmNode:Element = Element("playStatus")
+                elmNode.text = playStatus
+                root.append(elmNode)
+            settings[SoundTouchNodes.nowPlaying.Path] = NowPlayingStatus(root=root)
+
+        if volume is not None:
+            actual, isMuted = volume
+            settings[SoundTouchNodes.volume.Path] = Volume(actual, actual, isMuted)
+
+        return settings
+
+
+    def _GetData(self) -> dict:
+        """
+        Returns the store data to persist.
+        """
+        with self._lock:
+            return {"snapshots": [[name, slot] for name, slot in self._slots.items()]}
+
+
+    @staticmethod
+    def _ToSlot(settings:dict) -> list:
+        """
+        Converts a snapshot settings dictionary to a compact snapshot slot.
+        """
+        source:str = None
+        sourceAccount:str = None
+        playStatus:str = None
+        contentItem:list = None
+        volume:list = None
+
+        status:NowPlayingStatus = settings.get(SoundTouchNodes.nowPlaying.Path, None)
+        if status is not None:
+            source = status.Source
+            sourceAccount = status.SourceAccount
+            playStatus = status.PlayStatus
+            ci:ContentItem = status.ContentItem
+            if ci is not None:
+                contentItem = [ci.Source, ci.TypeValue, ci.Location, ci.SourceAccount, ci.IsPresetable, ci.Name, ci.ContainerArt]
+
+        config:Volume = settings.get(SoundTouchNodes.volume.Path, None)
+        if config is not None:
+            volume = [config.Actual, config.IsMuted]
+
+        return [int(time.time()), source, sourceAccount, playStatus, contentItem, volume]
+
+
+    def _Save(self) -> None:
+        """
+        Schedules a save of the store (if it is persisted).
+        """
+        if self._persistence is not None:
+            self._persistence.ScheduleSave()
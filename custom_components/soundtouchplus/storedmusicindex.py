@@ -0,0 +1,459 @@
+"""
+Stored music search index for the SoundTouchPlus component.
+
+Finding a track in a STORED_MUSIC (e.g. DLNA / NAS) music library requires navigating
+the library container hierarchy, with one or more device navigate requests for every
+level.  The index is built by a background crawler that walks the hierarchy, and keeps
+a compact record of every container and item along with a trigram search structure, so
+that searches are satisfied in memory without querying the device.
+
+The index is persisted in Home Assistant storage, and is updated incrementally: a container whose item
+count and first page of items are unchanged since the last crawl is not re-read (only
+it's child containers are visited).
+"""
+from collections import defaultdict
+import re
+import threading
+import time
+
+from bosesoundtouchapi import SoundTouchClient, SoundTouchSources
+from bosesoundtouchapi.models import ContentItem, Navigate, NavigateItem, NavigateResponse, SourceItem, SourceList
+
+from homeassistant.core import HomeAssistant
+
+from .storepersistence import StorePersistence
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+STORED_MUSIC_INDEX_MAX_AGE:float = 86400.0
+""" Number of seconds after which the index is re-crawled when the media player starts. """
+
+STORED_MUSIC_INDEX_PAGE_SIZE:int = 500
+""" Max number of items to return from a navigate request while crawling. """
+
+STORED_MUSIC_INDEX_SEARCH_LIMIT:int = 50
+""" Default max number of items to return from a search. """
+
+STORED_MUSIC_INDEX_SAVE_DELAY:float = 5.0
+""" Number of seconds after a crawl completes that the index is saved. """
+
+STORED_MUSIC_INDEX_VERSION:int = 1
+""" Version of the persisted index format. """
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+""" Regular expression used to split search text into tokens. """
+
+
+class StoredMusicIndex:
+    """
+    Per device search index of STORED_MUSIC library containers and items.
+
+    Each container is stored as a record that contains the item count reported by the
+    device, a signature of the first page of items (used to detect changes), it's path
+    (names of the parent containers), and a list of item records (type, location, name,
+    container art).  A trigram inverted index maps each trigram of an item's name and
+    path to the ordinals of the items that contain it.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+        """
+        self._containers:dict[str, dict] = {}
+        self._crawlThread:threading.Thread = None
+        self._items:dict[int, tuple] = {}
+        self._itemsByContainer:dict[str, list[int]] = {}
+        self._lastCrawledOn:float = 0
+        self._lock:threading.Lock = threading.Lock()
+        self._nextOrdinal:int = 0
+        self._persistence:StorePersistence = None
+        self._stopEvent:threading.Event = threading.Event()
+        self._trigrams:dict[str, set[int]] = defaultdict(set)
+
+
+    @property
+    def ContainerCount(self) -> int:
+        """ Number of containers currently in the index. """
+        return len(self._containers)
+
+
+    @property
+    def Count(self) -> int:
+        """ Number of items (containers and tracks) currently in the index. """
+        return len(self._items)
+
+
+    @property
+    def IsCrawling(self) -> bool:
+        """ True if a background crawl is in progress; otherwise, False. """
+        thread:threading.Thread = self._crawlThread
+        return (thread is not None) and (thread.is_alive())
+
+
+    @property
+    def IsStale(self) -> bool:
+        """ True if the index has not been crawled within `STORED_MUSIC_INDEX_MAX_AGE` seconds. """
+        return (time.time() - self._lastCrawledOn) > STORED_MUSIC_INDEX_MAX_AGE
+
+
+    @property
+    def LastCrawledOn(self) -> float:
+        """ Date and time (epoch seconds) that the last crawl completed, or 0 if never crawled. """
+        return self._lastCrawledOn
+
+
+    def Crawl(self, client:SoundTouchClient) -> int:
+        """
+        Crawls all STORED_MUSIC sources of a device, and updates the index.
+
+        Args:
+            client (SoundTouchClient):
+                SoundTouchClient instance used to query the device.
+
+        Returns:
+            The number of containers that were re-read from the device (e.g. new or changed
+            containers).
+
+        This method blocks while the device is queried, so it should be called from an
+        executor or background thread.
+        """
+        changedCount:int = 0
+        visited:set[str] = set()
+
+        sourceList:SourceList = client.GetSourceList(refresh=False)
+        sourceItem:SourceItem
+        for sourceItem in sourceList:
+            if sourceItem.Source != SoundTouchSources.STORED_MUSIC.value:
+                continue
+
+            # walk the container hierarchy, starting at the source account root container.
+            _logsi.LogVerbose("StoredMusicIndex is crawling STORED_MUSIC account '%s'" % sourceItem.SourceAccount)
+            pending:list[tuple[NavigateItem, str]] = [(None, "")]
+            while (len(pending) > 0) and (not self._stopEvent.is_set()):
+                containerItem, path = pending.pop()
+                location:str = containerItem.ContentItem.Location if containerItem is not None else None
+                key:str = self._GetContainerKey(sourceItem.SourceAccount, location)
+                if key in visited:
+                    continue
+                visited.add(key)
+
+                records, isChanged = self._CrawlContainer(client, sourceItem.SourceAccount, containerItem, key, path)
+                if isChanged:
+                    changedCount += 1
+
+                # queue child containers; a container path includes it's own name, so 
+                # that items can be found by their album / artist folder names.
+                for typeValue, childLocation, name, _ in records:
+                    if (typeValue == "dir") and (childLocation is not None):
+                        childPath:str = (path + " / " + (name or "")) if path else (name or "")
+                        childContent:ContentItem = ContentItem(SoundTouchSources.STORED_MUSIC.value, typeValue, childLocation, sourceItem.SourceAccount, True, name=name)
+                        pending.append((NavigateItem(SoundTouchSources.STORED_MUSIC.value, sourceItem.SourceAccount, name or "", typeValue, contentItem=childContent), childPath))
+
+        # if the crawl was interrupted, then keep what we have but do not purge anything.
+        if self._stopEvent.is_set():
+            return changedCount
+
+        # remove containers that no longer exist on the device.
+        with self._lock:
+            for key in [key for key in self._containers if key not in visited]:
+                self._RemoveContainer(key)
+                changedCount += 1
+            self._lastCrawledOn = time.time()
+
+        _logsi.LogVerbose("StoredMusicIndex crawl complete: %d containers, %d items, %d containers changed" % (len(self._containers), len(self._items), changedCount))
+        return changedCount
+
+
+    async def async_Load(self, hass:HomeAssistant, key:str) -> None:
+        """
+        Loads the index from Home Assistant storage (if it was stored), and persists
+        the index there from now on.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+            key (str):
+                Storage key of the index.
+        """
+        self._persistence = StorePersistence(hass, key, STORED_MUSIC_INDEX_VERSION, self._GetData, STORED_MUSIC_INDEX_SAVE_DELAY)
+        data:dict = await self._persistence.async_Load()
+        if data is None:
+            return
+
+        try:
+
+            with self._lock:
+                self._lastCrawledOn = data.get("lastCrawledOn", 0)
+                for key, container in data.get("containers", {}).items():
+                    self._SetContainer(key, container)
+            _logsi.LogVerbose("StoredMusicIndex loaded %d containers (%d items) from '%s'" % (len(self._containers), len(self._items), self._persistence.Key))
+
+        except (TypeError, ValueError, KeyError) as ex:
+            _logsi.LogWarning("StoredMusicIndex could not load '%s'; the index will be rebuilt: %s" % (self._persistence.Key, str(ex)))
+            with self._lock:
+                for key in list(self._containers):
+                    self._RemoveContainer(key)
+
+
+    def Save(self) -> None:
+        """
+        Schedules a save of the index to Home Assistant storage (if it is persisted).
+        """
+        if self._persistence is not None:
+            self._persistence.ScheduleSave()
+
+
+    def Search(self, criteria:str, limit:int=STORED_MUSIC_INDEX_SEARCH_LIMIT, includeContainers:bool=True) -> list[ContentItem]:
+        """
+        Searches the index for items whose name or path (names of the parent containers)
+        contain all of the words in the search criteria.
+
+        Args:
+            criteria (str):
+                Search criteria (e.g. "beatles help").  The search is case-insensitive.
+            limit (int):
+                Max number of items to return.
+            includeContainers (bool):
+                True to include containers (e.g. albums, artists) in the results; otherwise,
+                False to only return tracks.
+
+        Returns:
+            A list of playable `ContentItem` objects, ranked by how closely the item name
+            matches the criteria (exact, prefix, word prefix, then other matches).
+        """
+        tokens:list[str] = self._GetTokens(criteria)
+        if len(tokens) == 0:
+            return []
+
+        with self._lock:
+
+            # find candidates that contain every trigram of every token; tokens that are
+            # too short to contain a trigram are verified below.
+            candidates:set[int] = None
+            for token in tokens:
+                for trigram in self._GetTrigrams(token):
+                    postings:set[int] = self._trigrams.get(trigram, None)
+                    if postings is None:
+                        return []
+                    candidates = set(postings) if candidates is None else (candidates & postings)
+                    if len(candidates) == 0:
+                        return []
+            if candidates is None:
+                candidates = set(self._items.keys())
+
+            # verify candidates (trigrams can produce false positives), and rank them.
+            phrase:str = " ".join(tokens)
+            ranked:list[tuple] = []
+            for ordinal in candidates:
+                account, typeValue, location, name, containerArt, path = self._items[ordinal]
+                if (not includeContainers) and (typeValue == "dir"):
+                    continue
+                nameLower:str = (name or "").lower()
+                text:str = nameLower + " " + path.lower()
+                if not all(token in text for token in tokens):
+                    continue
+                if nameLower == phrase:
+                    rank = 0
+                elif nameLower.startswith(phrase):
+                    rank = 1
+                elif all(re.search(r"\b" + re.escape(token), nameLower) for token in tokens):
+                    rank = 2
+                else:
+                    rank = 3
+                ranked.append((rank, nameLower, ordinal))
+            ranked.sort()
+
+            results:list[ContentItem] = []
+            for _, _, ordinal in ranked[:max(0, limit)]:
+                account, typeValue, location, name, containerArt, path = self._items[ordinal]
+                results.append(ContentItem(SoundTouchSources.STORED_MUSIC.value, typeValue, location, account, True, name=name, containerArt=containerArt))
+            return results
+
+
+    def Shutdown(self) -> None:
+        """
+        Stops a background crawl (if one is in progress).
+        """
+        self._stopEvent.set()
+
+
+    def StartCrawl(self, client:SoundTouchClient) -> bool:
+        """
+        Starts a background crawl of the device STORED_MUSIC sources, unless one is already
+        in progress.  The index is saved to it's file when the crawl completes.
+
+        Args:
+            client (SoundTouchClient):
+                SoundTouchClient instance used to query the device.
+
+        Returns:
+            True if a crawl was started; otherwise, False.
+        """
+        with self._lock:
+            if self.IsCrawling:
+                return False
+            self._stopEvent.clear()
+            self._crawlThread = threading.Thread(target=self._CrawlInBackground, args=(client,), name="SoundTouchPlusStoredMusicIndex", daemon=True)
+            self._crawlThread.start()
+            return True
+
+
+    def _CrawlContainer(self, client:SoundTouchClient, sourceAccount:str, containerItem:NavigateItem, key:str, path:str) -> tuple[list[list], bool]:
+        """
+        Reads a container from the device, unless it is unchanged since the last crawl.
+
+        Returns:
+            A tuple of the container item records, and True if the container was re-read
+            (or False if the indexed records were unchanged).
+
+        If the container could not be read completely (the crawl was stopped, or the device
+        returned fewer items than it reported), then the records that were read are
+        returned but the index is not updated; the indexed records (if any) are kept, so
+        that the container is re-read by the next crawl.
+        """
+        criteria:Navigate = Navigate(SoundTouchSources.STORED_MUSIC.value, sourceAccount, containerItem, 1, STORED_MUSIC_INDEX_PAGE_SIZE)
+        response:NavigateResponse = client.GetMusicLibraryItems(criteria)
+        total:int = response.TotalItems or 0
+        readCount:int = len(response.Items)
+        records:list[list] = self._GetRecords(response)
+        signature:str = "|".join(record[1] or "" for record in records)
+
+        # if the item count and first page are unchanged, then use the indexed records.
+        with self._lock:
+            container:dict = self._containers.get(key, None)
+            if (container is not None) and (container["total"] == total) and (container["signature"] == signature) and (container["path"] == path):
+                return container["items"], False
+
+        # read the remaining pages; pages are positioned by the number of items read, as
+        # items that are not playable are not recorded.
+        while (readCount < total) and (not self._stopEvent.is_set()):
+            criteria = Navigate(SoundTouchSources.STORED_MUSIC.value, sourceAccount, containerItem, readCount + 1, STORED_MUSIC_INDEX_PAGE_SIZE)
+            response = client.GetMusicLibraryItems(criteria)
+            if len(response.Items) == 0:
+                break
+            readCount += len(response.Items)
+            records.extend(self._GetRecords(response))
+
+        # do not index a partially read container.
+        if (readCount < total) or (self._stopEvent.is_set()):
+            _logsi.LogVerbose("StoredMusicIndex read %d of %d items of container '%s'; the container was not indexed" % (readCount, total, path))
+            return records, False
+
+        with self._lock:
+            self._SetContainer(key, {"account": sourceAccount, "total": total, "signature": signature, "path": path, "items": records})
+        return records, True
+
+
+    def _CrawlInBackground(self, client:SoundTouchClient) -> None:
+        """
+        Crawls the device and saves the index (background thread).
+        """
+        try:
+            self.Crawl(client)
+            # an interrupted crawl is not saved; the next crawl completes it.
+            if not self._stopEvent.is_set():
+                self.Save()
+        except Exception as ex:
+            _logsi.LogWarning("StoredMusicIndex crawl failed: %s" % str(ex))
+
+
+    def _GetData(self) -> dict:
+        """
+        Returns the index data to persist.
+        """
+        with self._lock:
+            return {
+                "lastCrawledOn": self._lastCrawledOn,
+                "containers": dict(self._containers),
+            }
+
+
+    @staticmethod
+    def _GetContainerKey(sourceAccount:str, location:str) -> str:
+        """
+        Returns the index key of a container.
+        """
+        return "%s\n%s" % (sourceAccount or "", location or "")
+
+
+    @staticmethod
+    def _GetRecords(response:NavigateResponse) -> list[list]:
+        """
+        Returns the item records (type, location, name, container art) of a navigate
+        response; items without a ContentItem are not playable, and are ignored.
+        """
+        records:list[list] = []
+        item:NavigateItem
+        for item in response.Items:
+            if item.ContentItem is not None:
+                records.append([item.TypeValue or item.ContentItem.TypeValue, item.ContentItem.Location, item.Name or item.ContentItem.Name, item.ContentItem.ContainerArt])
+        return records
+
+
+    @staticmethod
+    def _GetTokens(text:str) -> list[str]:
+        """
+        Returns the lower-case word tokens of a text value.
+        """
+        return _TOKEN_PATTERN.findall((text or "").lower())
+
+
+    @staticmethod
+    def _GetTrigrams(token:str) -> set[str]:
+        """
+        Returns the trigrams of a token; tokens shorter than 3 characters have none.
+        """
+        return {token[i:i+3] for i in range(len(token) - 2)}
+
+
+    def _RemoveContainer(self, key:str) -> None:
+        """
+        Removes a container and it's items from the index (caller must hold the lock).
+        """
+        self._containers.pop(key, None)
+        for ordinal in self._itemsByContainer.pop(key, []):
+            account, typeValue, location, name, containerArt, path = self._items.pop(ordinal)
+            for trigram in self._GetItemTrigrams(name, path):
+                postings:set[int] = self._trigrams.get(trigram, None)
+                if postings is not None:
+                    postings.discard(ordinal)
+                    if len(postings) == 0:
+                        del self._trigrams[trigram]
+
+
+    def _SetContainer(self, key:str, container:dict) -> None:
+        """
+        Adds (or replaces) a container and it's items in the index (caller must hold the lock).
+        """
+        self._RemoveContainer(key)
+        self._containers[key] = container
+
+        ordinals:list[int] = []
+        path:str = container["path"]
+        for typeValue, location, name, containerArt in container["items"]:
+            ordinal:int = self._nextOrdinal
+            self._nextOrdinal += 1
+            self._items[ordinal] = (container["account"], typeValue, location, name, containerArt, path)
+            for trigram in self._GetItemTrigrams(name, path):
+                self._trigrams[trigram].add(ordinal)
+            ordinals.append(ordinal)
+        self._itemsByContainer[key] = ordinals
+
+
+    def _GetItemTrigrams(self, name:str, path:str) -> set[str]:
+        """
+        Returns the trigrams of an item's name and path.
+        """
+        trigrams:set[str] = set()
+        for token in self._GetTokens(name) + self._GetTokens(path):
+            trigrams.update(self._GetTrigrams(token))
+        return trigrams
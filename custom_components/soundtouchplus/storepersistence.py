@@ -0,0 +1,78 @@
+"""
+Home Assistant storage persistence for the SoundTouchPlus component.
+
+Indexes and stores of the component (e.g. the stored music index, play history index,
+and named snapshots) are updated from executor and background threads, while a Home
+Assistant `Store` must be used from the event loop.  The persistence object loads the
+data of a store, and schedules (debounced) saves from any thread; pending saves are
+written by Home Assistant when it stops.
+"""
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class StorePersistence:
+    """
+    Persists the data of an object in Home Assistant storage.
+
+    Threadsafety:
+        `ScheduleSave` can be called from any thread; `async_Load` must be called from
+        the event loop.
+    """
+
+    def __init__(self, hass:HomeAssistant, key:str, version:int, getData:Callable[[], dict], saveDelay:float) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+            key (str):
+                Storage key (e.g. "soundtouchplus_snapshots_<device id>").
+            version (int):
+                Version of the stored data format.
+            getData (Callable[[], dict]):
+                Method that returns the data to save; it is called from the event loop
+                when a scheduled save is written.
+            saveDelay (float):
+                Number of seconds to wait after a save is scheduled before the data is
+                written; saves scheduled in the meantime are written together.
+        """
+        self._getData:Callable[[], dict] = getData
+        self._hass:HomeAssistant = hass
+        self._saveDelay:float = saveDelay
+        self._store:Store = Store(hass, version, key)
+
+
+    @property
+    def Key(self) -> str:
+        """ Storage key of the data. """
+        return self._store.key
+
+
+    async def async_Load(self) -> dict | None:
+        """
+        Returns the stored data, or None if there is no (readable) stored data.
+        """
+        try:
+            return await self._store.async_load()
+        except Exception as ex:
+            _logsi.LogWarning("StorePersistence could not load '%s': %s" % (self._store.key, str(ex)))
+            return None
+
+
+    def ScheduleSave(self) -> None:
+        """
+        Schedules a save of the data.
+        """
+        self._hass.loop.call_soon_threadsafe(self._store.async_delay_save, self._getData, self._saveDelay)
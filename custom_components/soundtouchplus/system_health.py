@@ -5,8 +5,11 @@ import json
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 
+from .artworkcache import ARTWORK_CACHE
 from .const import DOMAIN
 from .instancedata_soundtouchplus import InstanceDataSoundTouchPlus
+from .logsink import TRACE_SINK
+from .ttscache import TTS_CACHE
 
 # get smartinspect logger reference; create a new session for this module name.
 from smartinspectpython.siauto import SIAuto, SILevel, SISession
@@ -55,6 +58,15 @@ async def system_health_info(hass):
         else:
             deviceConfig = "(None Defined)"
         healthInfo["devices_configured"] = deviceConfig
+
+        # add trace log sink statistics.
+        healthInfo["trace_entries_dropped"] = TRACE_SINK.DroppedCount
+
+        # add artwork cache statistics.
+        healthInfo["artwork_cache"] = "%d images, %d bytes (hits=%d, disk hits=%d, misses=%d)" % (ARTWORK_CACHE.Count, ARTWORK_CACHE.Bytes, ARTWORK_CACHE.Hits, ARTWORK_CACHE.HitsDisk, ARTWORK_CACHE.Misses)
+
+        # add tts cache statistics.
+        healthInfo["tts_cache"] = "%s (hits=%d, misses=%d)" % ("enabled" if TTS_CACHE.IsEnabled else "disabled", TTS_CACHE.Hits, TTS_CACHE.Misses)
         
         # trace.
         _logsi.LogDictionary(SILevel.Verbose, "System Health results", healthInfo)
@@ -0,0 +1,352 @@
+"""
+Text-To-Speech audio cache for the SoundTouchPlus component.
+
+The play_tts service (and tts announcements when the Google Translate option is forced)
+hands the speaker a tts url, and the speaker fetches (and the upstream service renders)
+the audio again every time the message is played, even when the same message is played
+many times a day.  The cache renders a message once, stores the MP3 audio in a local
+directory (within a size and age budget), and the speaker fetches the audio from the
+Home Assistant http server instead.
+
+Cached audio is keyed by message, language, voice, and tts url template; the audio file
+name is a hash of the key, which is also used (unauthenticated, as the speaker cannot
+authenticate) in the url that the audio is served from.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+
+from aiohttp import web
+import requests
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+TTS_CACHE_FETCH_TIMEOUT:float = 10.0
+""" Max number of seconds to wait for the upstream tts service to render a message. """
+
+TTS_CACHE_MAX_AGE:int = 30 * 24 * 60 * 60
+""" Max number of seconds that rendered audio is retained after it was last played. """
+
+TTS_CACHE_MAX_BYTES:int = 32 * 1024 * 1024
+""" Max number of rendered audio bytes to retain on disk. """
+
+TTS_CACHE_MAX_ITEM_BYTES:int = 2 * 1024 * 1024
+""" Max size of a single rendered message that will be cached. """
+
+TTS_CACHE_URL_PATH:str = "/api/%s/tts" % DOMAIN
+""" Home Assistant http server path that cached audio is served from. """
+
+_KEY_PATTERN:re.Pattern = re.compile(r"^[0-9a-f]{64}$")
+
+
+class TtsCache:
+    """
+    Disk cache of rendered tts audio, keyed by message, language, voice, and tts url.
+
+    Threadsafety:
+        This class is fully thread-safe.  Methods that access the file system or the
+        upstream tts service should be called from an executor thread.
+    """
+
+    def __init__(self,
+                 maxBytes:int=TTS_CACHE_MAX_BYTES,
+                 maxAge:int=TTS_CACHE_MAX_AGE,
+                 maxItemBytes:int=TTS_CACHE_MAX_ITEM_BYTES,
+                 ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxBytes (int):
+                Max number of rendered audio bytes to retain on disk.
+            maxAge (int):
+                Max number of seconds that rendered audio is retained after it was last played.
+            maxItemBytes (int):
+                Max size of a single rendered message that will be cached.
+        """
+        self._baseUrl:str = None
+        self._directory:str = None
+        self._hits:int = 0
+        self._lock:threading.Lock = threading.Lock()
+        self._maxAge:int = max(0, maxAge)
+        self._maxBytes:int = max(0, maxBytes)
+        self._maxItemBytes:int = max(0, maxItemBytes)
+        self._misses:int = 0
+        self._renderLock:threading.Lock = threading.Lock()
+
+
+    @property
+    def BaseUrl(self) -> str:
+        """
+        Home Assistant base url (e.g. "http://192.168.1.10:8123") that the speaker fetches
+        cached audio from, or None if audio cannot be served to the speaker.
+        """
+        return self._baseUrl
+
+    @BaseUrl.setter
+    def BaseUrl(self, value:str):
+        """
+        Sets the BaseUrl property value; SoundTouch speakers only support http urls, so
+        other urls disable the cache.
+        """
+        if (value is not None) and (not value.startswith("http://")):
+            _logsi.LogVerbose("TtsCache is disabled, as the speaker cannot fetch audio from '%s'" % value)
+            value = None
+        self._baseUrl = value.rstrip("/") if value is not None else None
+
+
+    @property
+    def Directory(self) -> str:
+        """ Directory that rendered audio is stored in, or None if the cache is disabled. """
+        return self._directory
+
+    @Directory.setter
+    def Directory(self, value:str):
+        """
+        Sets the Directory property value.
+        """
+        self._directory = value
+
+
+    @property
+    def Hits(self) -> int:
+        """ Number of messages that were played from the cache. """
+        return self._hits
+
+
+    @property
+    def IsEnabled(self) -> bool:
+        """ True if rendered audio can be cached and served to the speaker; otherwise, False. """
+        return (self._directory is not None) and (self._baseUrl is not None)
+
+
+    @property
+    def Misses(self) -> int:
+        """ Number of messages that had to be rendered by the upstream tts service. """
+        return self._misses
+
+
+    @staticmethod
+    def GetKey(message:str, ttsUrl:str, language:str=None, voice:str=None) -> str:
+        """
+        Returns the cache key of a message.
+
+        Args:
+            message (str):
+                The message text.
+            ttsUrl (str):
+                The tts url template (with a "{saytext}" format parameter) used to render
+                the message.
+            language (str):
+                The message language, if it is not part of the tts url template.
+            voice (str):
+                The message voice, if it is not part of the tts url template.
+        """
+        text:str = json.dumps([message, language or "", voice or "", ttsUrl], separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+    def GetFilePath(self, key:str) -> str:
+        """
+        Returns the path of the rendered audio file of a cache key, or None if the key is
+        invalid, the cache is disabled, or the audio is not cached (or has expired).
+
+        This method accesses the file system, so it should be called from an executor thread.
+        """
+        directory:str = self._directory
+        if (directory is None) or (key is None) or (not _KEY_PATTERN.match(key)):
+            return None
+        filePath:str = os.path.join(directory, key + ".mp3")
+        try:
+            if (self._maxAge > 0) and (time.time() - os.path.getmtime(filePath) > self._maxAge):
+                return None
+        except OSError:
+            return None
+        return filePath
+
+
+    def GetUrl(self, message:str, ttsUrl:str, language:str=None, voice:str=None) -> str:
+        """
+        Returns the Home Assistant url of the rendered audio of a message, rendering (and
+        caching) the message via the tts url if it is not cached.
+
+        Args:
+            message (str):
+                The message text.
+            ttsUrl (str):
+                The tts url template (with a "{saytext}" format parameter) used to render
+                the message.
+            language (str):
+                The message language, if it is not part of the tts url template.
+            voice (str):
+                The message voice, if it is not part of the tts url template.
+
+        Returns:
+            The url that the speaker can fetch the audio from, or None if the cache is
+            disabled or the message could not be rendered (in which case the caller should
+            play the tts url directly).
+
+        This method accesses the file system and the upstream tts service, so it should
+        be called from an executor thread.
+        """
+        if (not self.IsEnabled) or (not message) or (not ttsUrl):
+            return None
+
+        key:str = TtsCache.GetKey(message, ttsUrl, language, voice)
+        if not self._Touch(key):
+
+            # render the message; one render at a time, so that concurrent plays of the same
+            # message (e.g. to every speaker) only render it once.
+            with self._renderLock:
+                if not self._Touch(key):
+                    with self._lock:
+                        self._misses += 1
+                    if not self._Render(key, ttsUrl.format(saytext=urllib.parse.quote(message))):
+                        return None
+
+        return "%s%s/%s.mp3" % (self._baseUrl, TTS_CACHE_URL_PATH, key)
+
+
+    def Prune(self) -> None:
+        """
+        Removes expired audio, and the least recently played audio if the cache exceeds
+        it's size budget.
+
+        This method accesses the file system, so it should be called from an executor thread.
+        """
+        directory:str = self._directory
+        if directory is None:
+            return
+
+        try:
+
+            files:list[tuple[float, int, str]] = []
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".mp3"):
+                    stat:os.stat_result = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+            files.sort()
+
+            now:float = time.time()
+            totalBytes:int = sum(size for _, size, _ in files)
+            removed:int = 0
+            for modifiedOn, size, filePath in files:
+                if (totalBytes <= self._maxBytes) and ((self._maxAge == 0) or (now - modifiedOn <= self._maxAge)):
+                    continue
+                os.remove(filePath)
+                totalBytes -= size
+                removed += 1
+
+            if removed > 0:
+                _logsi.LogVerbose("TtsCache removed %d expired or least recently played messages" % removed)
+
+        except FileNotFoundError:
+            pass
+        except OSError as ex:
+            _logsi.LogWarning("TtsCache could not prune '%s': %s" % (directory, str(ex)))
+
+
+    def _Render(self, key:str, url:str) -> bool:
+        """
+        Fetches the rendered audio of a message from the upstream tts service, and stores
+        it in the cache.
+
+        Returns:
+            True if the audio was stored; otherwise, False.
+        """
+        try:
+
+            _logsi.LogVerbose("TtsCache is rendering message: '%s'" % url)
+            with requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=TTS_CACHE_FETCH_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                content:bytes = response.raw.read(self._maxItemBytes + 1, decode_content=True)
+
+            if (len(content) == 0) or (len(content) > self._maxItemBytes):
+                _logsi.LogVerbose("TtsCache did not cache rendered message (%d bytes): '%s'" % (len(content), url))
+                return False
+
+            os.makedirs(self._directory, exist_ok=True)
+            filePath:str = os.path.join(self._directory, key + ".mp3")
+            tempPath:str = filePath + ".tmp"
+            with open(tempPath, "wb") as file:
+                file.write(content)
+            os.replace(tempPath, filePath)
+
+        except (OSError, requests.RequestException) as ex:
+
+            _logsi.LogWarning("TtsCache could not render message '%s': %s" % (url, str(ex)))
+            return False
+
+        self.Prune()
+        return True
+
+
+    def _Touch(self, key:str) -> bool:
+        """
+        Marks the rendered audio of a cache key as played (which also extends it's age).
+
+        Returns:
+            True if the audio is cached; otherwise, False.
+        """
+        filePath:str = self.GetFilePath(key)
+        if filePath is None:
+            return False
+        try:
+            os.utime(filePath)
+        except OSError:
+            return False
+        with self._lock:
+            self._hits += 1
+        return True
+
+
+class TtsCacheView(HomeAssistantView):
+    """
+    Serves cached tts audio to SoundTouch speakers.
+    """
+
+    name:str = "api:%s:tts" % DOMAIN
+    requires_auth:bool = False
+    url:str = TTS_CACHE_URL_PATH + "/{key}.mp3"
+
+    def __init__(self, cache:TtsCache) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            cache (TtsCache):
+                The cache to serve audio from.
+        """
+        self._cache:TtsCache = cache
+
+
+    async def get(self, request:web.Request, key:str) -> web.StreamResponse:
+        """
+        Returns the rendered audio of a cache key.
+        """
+        hass:HomeAssistant = request.app[KEY_HASS]
+        filePath:str = await hass.async_add_executor_job(self._cache.GetFilePath, key)
+        if filePath is None:
+            return web.Response(status=404)
+        return web.FileResponse(filePath, headers={"Content-Type": "audio/mpeg"})
+
+
+TTS_CACHE:TtsCache = TtsCache()
+"""
+Shared tts audio cache instance used by all media players.
+"""
@@ -0,0 +1,105 @@
+"""
+Volume write coalescer for the SoundTouchPlus component.
+
+Volume sliders (and group volume operations) can request many volume levels in quick
+succession, and each SoundTouch volume request is followed by a volumeUpdated event
+(and a Home Assistant state update).  The coalescer keeps one write in flight per
+device: levels requested while a write is in progress replace each other, and only the
+latest level is written once the in-flight write completes.  A single state update is
+issued when the device has reached the latest level.
+"""
+from collections.abc import Callable
+import threading
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class VolumeCoalescer:
+    """
+    Per device volume write coalescer; the latest requested level wins.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, writer:Callable[[int], None], onWritten:Callable[[int], None]=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            writer (Callable[[int], None]):
+                Method that writes a volume level (0 - 100) to the device.
+            onWritten (Callable[[int], None]):
+                Method that is called (with the level) once the latest requested level
+                has been written; used to issue a single state update.
+        """
+        self._isWriting:bool = False
+        self._lock:threading.Lock = threading.Lock()
+        self._onWritten:Callable[[int], None] = onWritten
+        self._pendingLevel:int = None
+        self._skippedCount:int = 0
+        self._writer:Callable[[int], None] = writer
+
+
+    @property
+    def IsWriting(self) -> bool:
+        """ True if a volume write is in progress; otherwise, False. """
+        return self._isWriting
+
+
+    @property
+    def SkippedCount(self) -> int:
+        """ Number of requested levels that were replaced by a later level before they were written. """
+        return self._skippedCount
+
+
+    def Set(self, level:int) -> None:
+        """
+        Requests a volume level.
+
+        Args:
+            level (int):
+                Volume level (0 - 100); values outside the range are clamped.
+
+        If a write is already in progress, the level is queued (replacing any queued level)
+        and the method returns immediately; the in-flight writer will write it.  Otherwise,
+        the calling thread writes the level (and any levels queued meanwhile), so this
+        method should be called from an executor thread.
+        """
+        level = max(0, min(100, int(level)))
+        with self._lock:
+            if self._pendingLevel is not None:
+                self._skippedCount += 1
+            self._pendingLevel = level
+            if self._isWriting:
+                return
+            self._isWriting = True
+
+        written:int = None
+        try:
+
+            while True:
+                with self._lock:
+                    level = self._pendingLevel
+                    self._pendingLevel = None
+                    if level is None:
+                        self._isWriting = False
+                        break
+                self._writer(level)
+                written = level
+
+        except Exception:
+
+            with self._lock:
+                self._pendingLevel = None
+                self._isWriting = False
+            raise
+
+        if self._onWritten is not None:
+            self._onWritten(written)
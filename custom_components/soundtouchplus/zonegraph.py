@@ -0,0 +1,282 @@
+"""
+Zone topology graph for the SoundTouchPlus component.
+
+Every SoundTouch device of a zone receives a zoneUpdated event when the zone changes,
+and each media player used to rebuild it's own group members list from it's own copy
+of the zone.  The graph is shared by all media players; it is updated from the zone
+updates of every device (only the first update of a zone change alters it), and
+answers "who is the master of this device" and "who is in this device's zone" queries
+without a device request.
+
+A member is confirmed when it reports (via it's own zone update) that it is in it's
+master's zone; zone builds wait on confirmations rather than a fixed delay.
+"""
+import threading
+import time
+
+from bosesoundtouchapi.models import Zone
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class ZoneGraph:
+    """
+    Fleet wide graph of SoundTouch zones, keyed by device id.
+
+    Each zone is stored as a tuple of device ids (master first, then members in zone
+    order), and each grouped device is mapped to it's zone master; a device that is
+    not in a zone is not mapped.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+        """
+        self._confirmedOn:dict[str, float] = {}
+        self._entityIds:dict[str, str] = {}
+        self._groups:dict[str, tuple[str, ...]] = {}
+        self._knownDeviceIds:set[str] = set()
+        self._lock:threading.Lock = threading.Lock()
+        self._changed:threading.Condition = threading.Condition(self._lock)
+        self._masters:dict[str, str] = {}
+        self._updateCount:int = 0
+
+
+    @property
+    def UpdateCount(self) -> int:
+        """ Number of zone updates that changed the graph. """
+        return self._updateCount
+
+
+    def ClearConfirmations(self, deviceIds:list[str]) -> None:
+        """
+        Clears the join confirmations of devices, so that only confirmations of a zone
+        change that follows are returned by `WaitForMembers`.
+
+        Args:
+            deviceIds (list[str]):
+                Device ids of the members that are about to be (re)joined to a zone.
+        """
+        with self._lock:
+            for deviceId in deviceIds:
+                self._confirmedOn.pop(deviceId, None)
+
+
+    def GetEntityId(self, deviceId:str) -> str:
+        """
+        Returns the media player entity id of a device, or None if the device has no
+        registered media player.
+        """
+        return self._entityIds.get(deviceId, None)
+
+
+    def GetGroupDeviceIds(self, deviceId:str) -> list[str]:
+        """
+        Returns the device ids of the zone that a device belongs to (master first), or an
+        empty list if the device is not in a zone.
+        """
+        with self._lock:
+            return list(self._groups.get(self._masters.get(deviceId, None), ()))
+
+
+    def GetGroupEntityIds(self, deviceId:str) -> list[str]:
+        """
+        Returns the media player entity ids of the zone that a device belongs to (master
+        first), or an empty list if the device is not in a zone.  Devices that have no
+        registered media player are not returned.
+        """
+        with self._lock:
+            group:tuple[str, ...] = self._groups.get(self._masters.get(deviceId, None), ())
+            return [self._entityIds[member] for member in group if member in self._entityIds]
+
+
+    def GetMasterDeviceId(self, deviceId:str) -> str:
+        """
+        Returns the device id of the zone master of a device (which is the device id itself
+        if the device is the master), or None if the device is not in a zone.
+        """
+        return self._masters.get(deviceId, None)
+
+
+    def IsKnown(self, deviceId:str) -> bool:
+        """
+        True if the zone status of a device has been added to the graph; otherwise, False
+        (in which case the graph cannot tell if the device is in a zone).
+        """
+        return deviceId in self._knownDeviceIds
+
+
+    def RegisterEntity(self, deviceId:str, entityId:str) -> list[str]:
+        """
+        Registers the media player entity id of a device.
+
+        Returns:
+            The device ids of the other devices of the zone that the device belongs to
+            (whose group members now include the entity id).
+        """
+        with self._lock:
+            self._entityIds[deviceId] = entityId
+            return [member for member in self._groups.get(self._masters.get(deviceId, None), ()) if member != deviceId]
+
+
+    def UnregisterEntity(self, deviceId:str) -> list[str]:
+        """
+        Removes a device (and it's media player entity id) from the graph.
+
+        Returns:
+            The device ids whose zone changed as a result.
+        """
+        affected:set[str] = set()
+        with self._lock:
+            self._entityIds.pop(deviceId, None)
+            self._knownDeviceIds.discard(deviceId)
+            self._Detach(deviceId, affected)
+            self._changed.notify_all()
+        affected.discard(deviceId)
+        return sorted(affected)
+
+
+    def Update(self, deviceId:str, zone:Zone) -> list[str]:
+        """
+        Updates the graph from the zone status reported by a device.
+
+        Args:
+            deviceId (str):
+                Device id of the device that reported the zone status.
+            zone (Zone):
+                The zone status reported by the device.
+
+        Returns:
+            The device ids whose zone changed, or an empty list if the graph already
+            reflected the zone status (e.g. it was reported by another device of the zone).
+
+        The zone status of the master lists every member of the zone; the zone status of a
+        member only tells us who it's master is.
+        """
+        masterId:str = zone.MasterDeviceId if zone is not None else None
+        affected:set[str] = set()
+
+        with self._lock:
+            self._knownDeviceIds.add(deviceId)
+
+            if not masterId:
+                # the device is not in a zone.
+                self._Detach(deviceId, affected)
+
+            elif masterId == deviceId:
+                # the master reports the complete zone.
+                group:list[str] = [masterId]
+                for member in zone.Members:
+                    if (member.DeviceId) and (member.DeviceId not in group):
+                        group.append(member.DeviceId)
+                if self._groups.get(masterId, None) != tuple(group):
+                    self._SetGroup(masterId, tuple(group), affected)
+
+            elif self._masters.get(deviceId, None) != masterId:
+                # a member reports that it joined a zone.
+                group:tuple[str, ...] = self._groups.get(masterId, (masterId,))
+                self._SetGroup(masterId, group + (deviceId,), affected)
+
+            # a member confirms that it joined it's master's zone.
+            isConfirmed:bool = False
+            if (masterId) and (masterId != deviceId) and (self._masters.get(deviceId, None) == masterId) \
+                and (deviceId not in self._confirmedOn):
+                self._confirmedOn[deviceId] = time.monotonic()
+                isConfirmed = True
+
+            if len(affected) > 0:
+                self._updateCount += 1
+            if (len(affected) > 0) or (isConfirmed):
+                self._changed.notify_all()
+
+        if len(affected) > 0:
+            _logsi.LogVerbose("ZoneGraph was updated by device '%s'; zone of device(s) %s changed" % (deviceId, ", ".join(sorted(affected))))
+        return sorted(affected)
+
+
+    def WaitForMembers(self, masterId:str, deviceIds:set[str], timeout:float) -> dict[str, float]:
+        """
+        Waits for devices to confirm that they joined a master's zone.
+
+        Args:
+            masterId (str):
+                Device id of the zone master.
+            deviceIds (set[str]):
+                Device ids of the members to wait for.
+            timeout (float):
+                Max number of seconds to wait; zero to return the current confirmations
+                without waiting.
+
+        Returns:
+            A dictionary of the confirmed device ids, and the time (`time.monotonic`) that
+            each device confirmed that it joined the zone.
+        """
+        deadline:float = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                confirmed:dict[str, float] = {}
+                for deviceId in deviceIds:
+                    if (self._masters.get(deviceId, None) == masterId) and (deviceId in self._confirmedOn):
+                        confirmed[deviceId] = self._confirmedOn[deviceId]
+                remaining:float = deadline - time.monotonic()
+                if (len(confirmed) == len(deviceIds)) or (remaining <= 0):
+                    return confirmed
+                self._changed.wait(remaining)
+
+
+    def _Detach(self, deviceId:str, affected:set[str]) -> None:
+        """
+        Removes a device from it's zone; if the device is the master, then the zone is
+        removed.  The caller must hold the lock.
+        """
+        masterId:str = self._masters.pop(deviceId, None)
+        self._confirmedOn.pop(deviceId, None)
+        if masterId is None:
+            return
+        group:tuple[str, ...] = self._groups.pop(masterId, ())
+        affected.update(group)
+        rest:tuple[str, ...] = () if masterId == deviceId else tuple(member for member in group if member != deviceId)
+        if len(rest) > 1:
+            self._groups[masterId] = rest
+        else:
+            for member in group:
+                self._masters.pop(member, None)
+                self._confirmedOn.pop(member, None)
+
+
+    def _SetGroup(self, masterId:str, group:tuple[str, ...], affected:set[str]) -> None:
+        """
+        Replaces the zone of a master; devices that are moved from another zone are
+        removed from it.  The caller must hold the lock.
+        """
+        for member in self._groups.get(masterId, ()):
+            if member not in group:
+                self._masters.pop(member, None)
+                self._confirmedOn.pop(member, None)
+                affected.add(member)
+        for member in group:
+            if self._masters.get(member, masterId) != masterId:
+                self._Detach(member, affected)
+        affected.update(group)
+
+        if len(group) > 1:
+            self._groups[masterId] = group
+            for member in group:
+                self._masters[member] = masterId
+        else:
+            self._groups.pop(masterId, None)
+            self._masters.pop(masterId, None)
+            self._confirmedOn.pop(masterId, None)
+
+
+ZONE_GRAPH:ZoneGraph = ZoneGraph()
+""" Zone topology graph shared by all SoundTouchPlus media players. """